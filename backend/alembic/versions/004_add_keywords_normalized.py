@@ -0,0 +1,31 @@
+"""Add normalized keywords to interview questions
+
+Revision ID: 004_add_keywords_normalized
+Revises: 003_add_question_bank
+Create Date: 2026-10-15
+
+This migration adds:
+- Pre-normalized expected keywords used by answer evaluation
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004_add_keywords_normalized'
+down_revision: Union[str, None] = '003_add_question_bank'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add keywords_normalized column."""
+    op.add_column('interview_questions',
+        sa.Column('keywords_normalized', sa.JSON(), default=list, nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Remove keywords_normalized column."""
+    op.drop_column('interview_questions', 'keywords_normalized')
@@ -0,0 +1,33 @@
+"""Add audio content hash to interview questions
+
+Revision ID: 005_add_audio_hash
+Revises: 004_add_keywords_normalized
+Create Date: 2026-10-15
+
+This migration adds:
+- Audio content hash used to reuse transcripts of identical uploads
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005_add_audio_hash'
+down_revision: Union[str, None] = '004_add_keywords_normalized'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add audio_hash column."""
+    op.add_column('interview_questions',
+        sa.Column('audio_hash', sa.String(64), nullable=True)
+    )
+    op.create_index('ix_interview_questions_audio_hash', 'interview_questions', ['audio_hash'])
+
+
+def downgrade() -> None:
+    """Remove audio_hash column."""
+    op.drop_index('ix_interview_questions_audio_hash', table_name='interview_questions')
+    op.drop_column('interview_questions', 'audio_hash')
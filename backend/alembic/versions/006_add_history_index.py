@@ -0,0 +1,33 @@
+"""Add composite index for interview history pagination
+
+Revision ID: 006_add_history_index
+Revises: 005_add_audio_hash
+Create Date: 2026-10-15
+
+This migration adds:
+- (user_id, status, completed_at, id) index used by keyset pagination
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006_add_history_index'
+down_revision: Union[str, None] = '005_add_audio_hash'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add history pagination index."""
+    op.create_index(
+        'ix_interview_sessions_user_status_completed',
+        'interview_sessions',
+        ['user_id', 'status', 'completed_at', 'id']
+    )
+
+
+def downgrade() -> None:
+    """Remove history pagination index."""
+    op.drop_index('ix_interview_sessions_user_status_completed', table_name='interview_sessions')
@@ -35,6 +35,7 @@ class Settings(BaseSettings):
     app_version: str = Field(default="1.0.0")
     debug: bool = Field(default=True)
     environment: str = Field(default="development")
+    openapi_examples: bool = Field(default=True)  # schema examples shown in Swagger UI
     
     # =========================================================================
     # SERVER SETTINGS
@@ -49,6 +50,12 @@ class Settings(BaseSettings):
     database_url: str = Field(
         default="sqlite+aiosqlite:///./interview_system.db"
     )
+    db_pool_size: int = Field(default=10)
+    db_max_overflow: int = Field(default=20)  # peak connections = pool size + overflow
+    db_statement_cache_size: int = Field(default=256)  # asyncpg prepared statements
+    db_query_cache_size: int = Field(default=1200)  # SQLAlchemy compiled SQL cache
+    db_pool_pre_ping: bool = Field(default=False)  # extra round trip per checkout
+    db_pool_recycle_seconds: int = Field(default=1800)  # retire idle connections instead
     
     # =========================================================================
     # SECURITY SETTINGS
@@ -58,6 +65,8 @@ class Settings(BaseSettings):
     )
     algorithm: str = Field(default="HS256")
     access_token_expire_minutes: int = Field(default=60)
+    user_cache_ttl_seconds: int = Field(default=5)  # 0 disables the auth user cache
+    token_cache_ttl_seconds: int = Field(default=300)  # 0 disables the verified-token cache
     
     # =========================================================================
     # AI MODEL SETTINGS
@@ -69,6 +78,8 @@ class Settings(BaseSettings):
     huggingface_model: str = Field(default="meta-llama/Meta-Llama-3-8B-Instruct")
     ai_provider: str = Field(default="huggingface")  # openai, google, huggingface, local
     ai_model: str = Field(default="gpt-4-turbo-preview")
+    normalized_cache_ttl_seconds: int = Field(default=3600)
+    normalized_cache_max_entries: int = Field(default=1024)
     
     # =========================================================================
     # SPEECH-TO-TEXT SETTINGS
@@ -77,6 +88,8 @@ class Settings(BaseSettings):
     whisper_model: str = Field(default="base")  # tiny, base, small, medium, large
     whisper_model_size: str = Field(default="base")  # tiny, base, small, medium, large
     whisper_use_api: bool = Field(default=True)  # True=use API, False=local model
+    whisper_device: str = Field(default="auto")  # auto, cpu, cuda (faster-whisper)
+    whisper_compute_type: str = Field(default="int8")  # int8, int8_float16, float16 (faster-whisper)
     google_cloud_credentials: Optional[str] = Field(default=None)
     
     # =========================================================================
@@ -85,6 +98,7 @@ class Settings(BaseSettings):
     upload_dir: str = Field(default="./uploads")
     max_audio_size_mb: int = Field(default=50)
     allowed_audio_formats: str = Field(default="wav,mp3,m4a,webm,ogg")
+    cleanup_parallelism: int = Field(default=1)  # >1 overlaps unlinks on networked storage
     
     @property
     def allowed_audio_formats_list(self) -> List[str]:
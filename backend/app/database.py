@@ -31,20 +31,34 @@ from app.config import settings
 # Create async engine based on database URL
 if "sqlite" in settings.database_url:
     # SQLite configuration (for development)
+    # StaticPool keeps a single long-lived connection, so there is no
+    # per-request connect cost and the page cache stays warm
     engine = create_async_engine(
         settings.database_url,
         echo=settings.debug,  # Log SQL queries in debug mode
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
+        query_cache_size=settings.db_query_cache_size,
     )
 else:
     # PostgreSQL or other databases (for production)
+    connect_args = {}
+    if "asyncpg" in settings.database_url:
+        # Reuse server-side prepared statements for repeated lookups
+        connect_args["statement_cache_size"] = settings.db_statement_cache_size
+    
     engine = create_async_engine(
         settings.database_url,
         echo=settings.debug,
-        pool_pre_ping=True,  # Check connection health
-        pool_size=10,
-        max_overflow=20,
+        # Pinging costs a round trip on every checkout; recycling
+        # connections before server-side idle timeouts covers the same risk
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        connect_args=connect_args,
+        # Compiled SQL is cached per statement shape across requests
+        query_cache_size=settings.db_query_cache_size,
     )
 
 
@@ -18,11 +18,13 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.config import settings
+from app.responses import ORJSONResponse
 from app.database import init_db, drop_db
+from app.services.stt_service import get_stt_service
+from app.services.evaluation_service import get_evaluation_service
 from app.routers import users_router, interviews_router, feedback_router, skill_interview_router
 
 # =============================================================================
@@ -62,6 +64,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     os.makedirs(settings.upload_dir, exist_ok=True)
     logger.info(f"📁 Upload directory ready: {settings.upload_dir}")
     
+    # Warm up model-backed services so the first request doesn't pay the load
+    try:
+        get_stt_service()
+        get_evaluation_service()
+        logger.info("🧠 STT and evaluation services loaded")
+    except Exception as e:
+        logger.warning(f"⚠️ Service warm-up failed, will retry lazily: {e}")
+    
+    # FastAPI memoizes the generated OpenAPI schema on the app; build it now
+    # so the first /docs or /openapi.json request doesn't walk every model
+    if app.openapi_url:
+        app.openapi()
+        logger.info("📚 OpenAPI schema generated")
+    
     # Log configuration
     logger.info(f"🔧 Environment: {settings.environment}")
     logger.info(f"🔧 Debug Mode: {settings.debug}")
@@ -85,6 +101,8 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     redirect_slashes=False,
+    # orjson serializes straight to UTF-8 bytes; routers inherit this default
+    default_response_class=ORJSONResponse,
     description="""
     # AI Mock Interview System API
     
@@ -156,7 +174,7 @@ async def log_requests(request: Request, call_next):
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions with consistent response format."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -175,7 +193,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     logger.error(f"Unexpected error: {exc}", exc_info=True)
     # Don't expose internal error details in production
     message = str(exc) if settings.debug else "An unexpected error occurred"
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
@@ -21,7 +21,7 @@ def utc_now():
     return datetime.now(timezone.utc)
 from sqlalchemy import (
     Column, String, Text, Integer, Float, Boolean,
-    DateTime, JSON, ForeignKey, Enum as SQLEnum
+    DateTime, JSON, ForeignKey, Index, Enum as SQLEnum
 )
 from sqlalchemy.orm import relationship
 import enum
@@ -58,6 +58,13 @@ class InterviewSession(Base):
     """
     
     __tablename__ = "interview_sessions"
+    __table_args__ = (
+        # Keyset pagination of a user's history: (completed_at, id) DESC
+        Index(
+            "ix_interview_sessions_user_status_completed",
+            "user_id", "status", "completed_at", "id"
+        ),
+    )
     
     # =========================================================================
     # PRIMARY KEY
@@ -23,7 +23,7 @@ from sqlalchemy import (
     Column, String, Text, Integer, Float, Boolean,
     DateTime, JSON, ForeignKey
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 
 from app.database import Base
 
@@ -79,6 +79,9 @@ class InterviewQuestion(Base):
     # Expected keywords for evaluation
     expected_keywords = Column(JSON, default=list)
     
+    # Lowercased/stripped keywords, kept in sync with expected_keywords
+    keywords_normalized = Column(JSON, default=list)
+    
     # Ideal answer (for reference/comparison)
     ideal_answer = Column(Text, nullable=True)
     
@@ -94,6 +97,9 @@ class InterviewQuestion(Base):
     # Audio file size in bytes
     audio_file_size = Column(Integer, nullable=True)
     
+    # Content hash of the audio bytes (keys the transcript cache)
+    audio_hash = Column(String(64), nullable=True, index=True)
+    
     # Audio duration in seconds
     audio_duration_seconds = Column(Float, nullable=True)
     
@@ -161,6 +167,14 @@ class InterviewQuestion(Base):
     # =========================================================================
     # HELPER METHODS
     # =========================================================================
+    @validates("expected_keywords")
+    def _normalize_keywords(self, key: str, keywords: Optional[list]) -> Optional[list]:
+        """Store a normalized copy of the keywords for evaluation."""
+        self.keywords_normalized = [
+            kw.lower().strip() for kw in (keywords or []) if kw and kw.strip()
+        ]
+        return keywords
+    
     def set_audio_response(
         self,
         file_path: str,
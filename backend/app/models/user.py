@@ -20,7 +20,8 @@ def utc_now():
     return datetime.now(timezone.utc)
 from sqlalchemy import (
     Column, String, Text, Integer, Float, Boolean,
-    DateTime, JSON, ForeignKey, Enum as SQLEnum
+    DateTime, JSON, ForeignKey, Enum as SQLEnum,
+    case, func, update
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -179,5 +180,26 @@ class User(Base):
         if new_score > self.best_score:
             self.best_score = new_score
     
+    @classmethod
+    def statistics_update(cls, user_id: str, new_score: float):
+        """
+        UPDATE statement folding a new interview score into the counters.
+        
+        The arithmetic runs in the database against the current row, so a
+        stale in-memory user or a concurrent writer cannot lose an update.
+        """
+        count = func.coalesce(cls.total_interviews, 0)
+        best = func.coalesce(cls.best_score, 0.0)
+        return (
+            update(cls)
+            .where(cls.id == user_id)
+            .values(
+                total_interviews=count + 1,
+                average_score=(func.coalesce(cls.average_score, 0.0) * count + new_score) / (count + 1),
+                best_score=case((best < new_score, new_score), else_=best)
+            )
+            .execution_options(synchronize_session=False)
+        )
+    
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email}, name={self.full_name})>"
@@ -0,0 +1,50 @@
+"""
+==============================================================================
+AI Mock Interview System - JSON Responses
+==============================================================================
+
+orjson-backed response class shared by the app and its routers.
+
+Author: AI Mock Interview System
+Version: 1.0.0
+==============================================================================
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse as _BaseORJSONResponse
+from pydantic import BaseModel
+
+# Datetimes match pydantic's JSON output, so a field reads the same whether
+# its route goes through orjson or a response_model: naive values carry no
+# offset and aware UTC values end in Z
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_UTC_Z
+)
+
+
+def render_json(content: Any) -> bytes:
+    """Serialize content with the app's orjson options."""
+    return orjson.dumps(content, default=str, option=_ORJSON_OPTIONS)
+
+
+class ORJSONResponse(_BaseORJSONResponse):
+    """ORJSONResponse rendered with the app's orjson options."""
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
+
+
+def model_response(model: BaseModel, status_code: int = 200, **dump_options: Any) -> ORJSONResponse:
+    """
+    Serialize a response model straight to an ORJSONResponse.
+
+    Returning a Response skips FastAPI's response_model re-validation and
+    jsonable_encoder walk. The model is dumped in python mode so datetimes
+    reach orjson as objects rather than isoformat strings; dump_options
+    (e.g. exclude_none) are passed through to model_dump.
+    """
+    return ORJSONResponse(content=model.model_dump(**dump_options), status_code=status_code)
@@ -22,6 +22,7 @@ from sqlalchemy import select, func, and_
 from sqlalchemy.orm import selectinload
 
 from app.database import get_db
+from app.responses import ORJSONResponse, model_response
 from app.models.user import User
 from app.models.interview import InterviewSession, InterviewStatus
 from app.models.question import InterviewQuestion
@@ -35,7 +36,6 @@ from app.schemas.feedback import (
     StrengthItem,
     WeaknessItem,
     SuggestionItem,
-    InterviewHistoryItem,
     InterviewHistoryResponse,
     DashboardStatsResponse,
     PerformanceTrend,
@@ -44,9 +44,10 @@ from app.schemas.feedback import (
     TimingByQuestionCount,
 )
 from app.schemas.common import APIResponse
-from app.services.auth_service import get_current_user
+from app.services.auth_service import get_current_user, invalidate_cached_user
 from app.services.scoring_service import ScoringService
 from app.services.feedback_service import FeedbackService
+from app.services.stats_service import invalidate_user_stats
 
 # =============================================================================
 # ROUTER SETUP
@@ -252,10 +253,12 @@ async def calculate_scores(
     session.grade = breakdown.letter_grade
     session.status = InterviewStatus.EVALUATED.value
 
-    # Update user statistics
-    current_user.update_statistics(breakdown.total_score)
+    # Update user statistics in SQL; current_user may be a cached snapshot
+    await db.execute(User.statistics_update(current_user.id, breakdown.total_score))
 
     await db.commit()
+    invalidate_user_stats(current_user.id)
+    invalidate_cached_user(current_user.id)
 
     # Build section scores response
     section_scores = [
@@ -477,7 +480,7 @@ async def generate_feedback(
 
     await db.commit()
 
-    return FeedbackResponse(
+    return model_response(FeedbackResponse(
         success=True,
         session_id=session_id,
         performance_rating=feedback_result.overall_rating,
@@ -497,7 +500,7 @@ async def generate_feedback(
         recommended_resources=resources_list,
         practice_topics=feedback_result.next_steps,
         generated_at=datetime.utcnow()
-    )
+    ), exclude_none=True)
 
 
 @router.get(
@@ -548,7 +551,7 @@ async def get_session_feedback(
             detail="Feedback not generated yet. Please generate feedback first."
         )
 
-    return FeedbackResponse(
+    return model_response(FeedbackResponse(
         success=True,
         session_id=session_id,
         performance_rating=feedback_record.performance_rating,
@@ -568,7 +571,7 @@ async def get_session_feedback(
         recommended_resources=feedback_record.recommended_resources or [],
         practice_topics=feedback_record.practice_topics or [],
         generated_at=feedback_record.created_at
-    )
+    ), exclude_none=True)
 
 
 @router.get(
@@ -747,34 +750,36 @@ async def get_interview_history(
     result = await db.execute(query)
     sessions = result.scalars().all()
     
-    # Build response
-    interviews = []
-    for session in sessions:
-        interviews.append(InterviewHistoryItem(
-            session_id=session.id,
-            id=session.id,
-            job_role=session.job_role,
-            interview_type=session.interview_type,
-            total_score=session.overall_score,
-            overall_score=session.overall_score,
-            grade=session.grade,
-            status=session.status,
-            questions_count=len(session.questions),
-            duration_seconds=session.duration_seconds or 0,
-            completed_at=session.completed_at,
-            created_at=session.created_at
-        ))
+    # Rows were validated on write, so the page is built as plain dicts in
+    # the InterviewHistoryResponse shape and handed straight to orjson
+    interviews = [
+        {
+            "session_id": session.id,
+            "id": session.id,
+            "job_role": session.job_role,
+            "interview_type": session.interview_type,
+            "total_score": session.overall_score,
+            "overall_score": session.overall_score,
+            "grade": session.grade,
+            "status": session.status,
+            "questions_count": len(session.questions),
+            "duration_seconds": session.duration_seconds or 0,
+            "completed_at": session.completed_at,
+            "created_at": session.created_at,
+        }
+        for session in sessions
+    ]
     
     total_pages = (total + page_size - 1) // page_size
     
-    return InterviewHistoryResponse(
-        user_id=current_user.id,
-        total_interviews=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
-        interviews=interviews
-    )
+    return ORJSONResponse(content={
+        "user_id": current_user.id,
+        "total_interviews": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "interviews": interviews,
+    })
 
 
 # =============================================================================
@@ -833,7 +838,7 @@ async def get_dashboard_stats(
     recent_scores = []
     for session in recent_sessions:
         if session.overall_score:
-            recent_scores.append(PerformanceTrend(
+            recent_scores.append(PerformanceTrend.model_construct(
                 date=session.created_at.strftime("%Y-%m-%d"),
                 score=session.overall_score,
                 interview_type=session.interview_type,
@@ -899,7 +904,7 @@ async def get_dashboard_stats(
     # Calculate total practice minutes (more granular than hours for dashboard)
     total_minutes = total_seconds / 60
 
-    return DashboardStatsResponse(
+    return model_response(DashboardStatsResponse(
         user_id=current_user.id,
         total_interviews=total_interviews,
         total_sessions=total_interviews,  # Alias for consistency
@@ -920,9 +925,11 @@ async def get_dashboard_stats(
         target_score=85.0,  # Could be user-configurable
         progress_to_target=(average_score / 85.0 * 100) if average_score else 0,
         generated_at=datetime.utcnow()
-    )
+    ))
 
 
+# Chart payloads are plain JSON built here, so the chart routes hand dicts
+# straight to orjson; ChartDataResponse only documents the shape
 @router.get(
     "/charts/performance",
     response_model=ChartDataResponse,
@@ -976,11 +983,11 @@ async def get_performance_chart_data(
         labels.append(session.created_at.strftime("%b %d"))
         scores.append(session.overall_score)
     
-    return ChartDataResponse(
-        chart_type="line",
-        title="Performance Over Time",
-        labels=labels,
-        datasets=[
+    return ORJSONResponse(content={
+        "chart_type": "line",
+        "title": "Performance Over Time",
+        "labels": labels,
+        "datasets": [
             {
                 "label": "Overall Score",
                 "data": scores,
@@ -990,7 +997,7 @@ async def get_performance_chart_data(
                 "fill": True
             }
         ]
-    )
+    })
 
 
 @router.get(
@@ -1023,11 +1030,11 @@ async def get_score_trend_chart(
     labels = [s.created_at.strftime("%b %d") for s in sessions]
     scores = [s.overall_score for s in sessions]
     
-    return ChartDataResponse(
-        chart_type="line",
-        title="Score Trend",
-        labels=labels,
-        datasets=[{
+    return ORJSONResponse(content={
+        "chart_type": "line",
+        "title": "Score Trend",
+        "labels": labels,
+        "datasets": [{
             "label": "Score",
             "data": scores,
             "borderColor": "#2196F3",
@@ -1035,7 +1042,7 @@ async def get_score_trend_chart(
             "tension": 0.4,
             "fill": True
         }]
-    )
+    })
 
 
 @router.get(
@@ -1072,17 +1079,17 @@ async def get_category_radar_chart(
         sum(technical_scores) / len(technical_scores) if technical_scores else 0,
     ]
     
-    return ChartDataResponse(
-        chart_type="radar",
-        title="Skills Breakdown",
-        labels=labels,
-        datasets=[{
+    return ORJSONResponse(content={
+        "chart_type": "radar",
+        "title": "Skills Breakdown",
+        "labels": labels,
+        "datasets": [{
             "label": "Average Score",
             "data": data,
             "borderColor": "#9C27B0",
             "backgroundColor": "rgba(156, 39, 176, 0.2)",
         }]
-    )
+    })
 
 
 @router.get(
@@ -1109,11 +1116,11 @@ async def get_metrics_bar_chart(
     
     labels = [s.created_at.strftime("%b %d") for s in reversed(list(sessions))]
     
-    return ChartDataResponse(
-        chart_type="bar",
-        title="Recent Performance Metrics",
-        labels=labels,
-        datasets=[
+    return ORJSONResponse(content={
+        "chart_type": "bar",
+        "title": "Recent Performance Metrics",
+        "labels": labels,
+        "datasets": [
             {
                 "label": "Relevance",
                 "data": [s.relevance_score or 0 for s in reversed(list(sessions))],
@@ -1135,4 +1142,4 @@ async def get_metrics_bar_chart(
                 "backgroundColor": "#9C27B0",
             },
         ]
-    )
+    })
@@ -16,22 +16,25 @@ Version: 1.0.0
 """
 
 import os
-import uuid
+import re
+import io
+import secrets
 import time
+import asyncio
 import logging
-import aiofiles
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 from fastapi import (
     APIRouter, Depends, HTTPException, status,
     UploadFile, File, Form, Query, BackgroundTasks
 )
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, exists
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import flag_modified
 
-from app.database import get_db
+from app.database import get_db, AsyncSessionLocal
+from app.responses import ORJSONResponse, model_response
 from app.models.user import User
 from app.models.interview import InterviewSession, InterviewStatus
 from app.models.question import InterviewQuestion
@@ -40,6 +43,7 @@ from app.schemas.interview import (
     InterviewSessionUpdate,
     InterviewSessionResponse,
     InterviewSessionDetailResponse,
+    InterviewQuestionResponse,
     QuestionGenerationRequest,
     QuestionGenerationResponse,
     GeneratedQuestion,
@@ -49,16 +53,81 @@ from app.schemas.interview import (
     EvaluationRequest,
     EvaluationResponse,
     EvaluationScores,
+    AnswerProcessingResponse,
 )
-from app.schemas.common import APIResponse
+from app.schemas.common import APIResponse, construct_from_attributes
 from app.services.auth_service import get_current_user
 from app.services.question_service import QuestionGeneratorService
-from app.services.stt_service import SpeechToTextService
-from app.services.evaluation_service import NLPEvaluationService
+from app.services.stt_service import SpeechToTextService, get_stt_service, audio_hasher
+from app.services.evaluation_service import (
+    NLPEvaluationService, EvaluationResult, get_evaluation_service
+)
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r"\S+")
+
+# Minimum transcript length (words) that is sent to NLP evaluation
+MIN_EVALUATION_WORDS = 3
+
+
+def _count_words(text: Optional[str]) -> int:
+    """Count whitespace-separated words without materializing them."""
+    if not text:
+        return 0
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+# Upload directories already created by this process
+_created_dirs: set = set()
+_mkdir_lock = asyncio.Lock()
+
+
+async def _ensure_dir(path: str) -> None:
+    """Create a directory once per process, off the event loop."""
+    if path in _created_dirs:
+        return
+    async with _mkdir_lock:
+        if path not in _created_dirs:
+            await asyncio.to_thread(os.makedirs, path, exist_ok=True)
+            _created_dirs.add(path)
+
+
+def _discard_upload(file_path: str, upload_dir: str) -> None:
+    """Remove a stored upload and its directory if that leaves it empty."""
+    os.remove(file_path)
+    try:
+        os.rmdir(upload_dir)
+    except OSError:
+        return  # other uploads still live here
+    _created_dirs.discard(upload_dir)
+
+
+# Chunk size used when copying uploads from the spooled temp file to storage
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _upload_size(upload: UploadFile) -> int:
+    """Size of an upload without reading it into memory."""
+    if upload.size is not None:
+        return upload.size
+    size = upload.file.seek(0, io.SEEK_END)
+    upload.file.seek(0)
+    return size
+
+
+def _copy_upload(src, dst_path: str) -> str:
+    """Copy an upload to disk in one pass, returning its content hash."""
+    hasher = audio_hasher()
+    src.seek(0)
+    with open(dst_path, "wb") as dst:
+        while chunk := src.read(UPLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+            dst.write(chunk)
+    return hasher.hexdigest()
+
+
 # =============================================================================
 # ROUTER SETUP
 # =============================================================================
@@ -66,6 +135,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(
     prefix="/interviews",
     tags=["Interviews"],
+    default_response_class=ORJSONResponse,
     responses={
         404: {"description": "Interview not found"},
         401: {"description": "Not authenticated"},
@@ -268,7 +338,20 @@ async def get_interview_session(
             detail=f"Interview session {session_id} not found"
         )
     
-    return InterviewSessionDetailResponse.model_validate(session)
+    # Construct on read (the row was validated on write) and return the
+    # serialized model directly so FastAPI does not re-validate it either
+    return model_response(construct_from_attributes(
+        InterviewSessionDetailResponse,
+        session,
+        # model_construct does not coerce, so tuple fields get tuples
+        questions=tuple(
+            construct_from_attributes(InterviewQuestionResponse, q)
+            for q in session.questions
+        ),
+        strengths=tuple(session.strengths or ()),
+        weaknesses=tuple(session.weaknesses or ()),
+        suggestions=tuple(session.suggestions or ())
+    ))
 
 
 @router.patch(
@@ -435,7 +518,7 @@ async def generate_questions(
         session_id="standalone",  # No session for standalone generation
         job_role=request.job_role,
         questions=questions,
-        generated_at=datetime.utcnow(),
+        generated_at=datetime.now(timezone.utc),
         ai_model_used=settings.ai_model
     )
 
@@ -585,7 +668,7 @@ async def submit_text_answer(
     # Save text answer directly as transcript
     question.transcript = answer_text
     question.transcript_confidence = 1.0
-    question.answered_at = datetime.utcnow()
+    question.answered_at = datetime.now(timezone.utc)
 
     await db.commit()
 
@@ -596,7 +679,7 @@ async def submit_text_answer(
         confidence=1.0,
         language_detected="en",
         duration_seconds=None,
-        word_count=len(answer_text.split()),
+        word_count=_count_words(answer_text),
         processing_time_ms=0
     )
 
@@ -636,27 +719,11 @@ async def upload_audio_answer(
     - Duration (if determinable)
     
     **Flow:**
-    1. Validate file format and size
+    1. Validate file format, size and that the question exists
     2. Save audio to storage
     3. Update question record with audio path
     4. Return upload confirmation
     """
-    # Validate session and question
-    result = await db.execute(
-        select(InterviewQuestion)
-        .where(
-            InterviewQuestion.id == question_id,
-            InterviewQuestion.session_id == session_id
-        )
-    )
-    question = result.scalar_one_or_none()
-    
-    if not question:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Question not found"
-        )
-    
     # Validate file extension
     file_ext = audio.filename.split(".")[-1].lower() if audio.filename else ""
     if file_ext not in settings.allowed_audio_formats_list:
@@ -665,38 +732,72 @@ async def upload_audio_answer(
             detail=f"Invalid audio format. Allowed: {settings.allowed_audio_formats}"
         )
     
-    # Read file content
-    content = await audio.read()
-    file_size = len(content)
-    
-    # Validate file size
+    # Validate file size before copying anything
+    file_size = _upload_size(audio)
     if file_size > settings.max_audio_size_bytes:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File too large. Max size: {settings.max_audio_size_mb}MB"
         )
     
+    # Confirm the question belongs to one of this user's sessions before
+    # anything touches the filesystem
+    question_exists = await db.scalar(
+        select(exists().where(
+            InterviewQuestion.id == question_id,
+            InterviewQuestion.session_id == session_id,
+            InterviewSession.id == InterviewQuestion.session_id,
+            InterviewSession.user_id == current_user.id
+        ))
+    )
+    if not question_exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Question not found"
+        )
+    
     # Create upload directory if not exists
     upload_dir = os.path.join(settings.upload_dir, "audio", session_id)
-    os.makedirs(upload_dir, exist_ok=True)
+    await _ensure_dir(upload_dir)
     
     # Generate unique filename
-    filename = f"{question_id}_{uuid.uuid4().hex[:8]}.{file_ext}"
+    filename = f"{question_id}_{secrets.token_hex(4)}.{file_ext}"
     file_path = os.path.join(upload_dir, filename)
     
-    # Save file
-    async with aiofiles.open(file_path, "wb") as f:
-        await f.write(content)
+    # Save file (spooled upload -> destination, off the event loop)
+    audio_hash = await asyncio.to_thread(_copy_upload, audio.file, file_path)
     
     # Update question record
-    question.audio_file_path = file_path
-    question.audio_file_size = file_size
-    question.answered_at = datetime.utcnow()
-
+    uploaded_at = datetime.now(timezone.utc)
+    values = {
+        "audio_file_path": file_path,
+        "audio_file_size": file_size,
+        "audio_hash": audio_hash,
+        "answered_at": uploaded_at,
+    }
+    
     # Save duration if provided
     if duration_seconds is not None:
-        question.audio_duration_seconds = duration_seconds
-
+        values["audio_duration_seconds"] = duration_seconds
+    
+    result = await db.execute(
+        update(InterviewQuestion)
+        .where(
+            InterviewQuestion.id == question_id,
+            InterviewQuestion.session_id == session_id
+        )
+        .values(**values)
+        .returning(InterviewQuestion.id)
+    )
+    
+    if result.first() is None:
+        # Deleted since the existence check
+        await asyncio.to_thread(_discard_upload, file_path, upload_dir)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Question not found"
+        )
+    
     await db.commit()
 
     return AudioUploadResponse(
@@ -706,7 +807,7 @@ async def upload_audio_answer(
         file_path=file_path,
         file_size=file_size,
         duration_seconds=duration_seconds,
-        uploaded_at=datetime.utcnow()
+        uploaded_at=uploaded_at
     )
 
 
@@ -725,7 +826,8 @@ async def transcribe_audio(
     question_id: str,
     language: str = Query("en", description="Language code (e.g., en, es, fr)"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    stt_service: SpeechToTextService = Depends(get_stt_service)
 ):
     """
     Transcribe audio answer to text.
@@ -777,11 +879,11 @@ async def transcribe_audio(
         )
     
     # Transcribe using STT service (includes hallucination filtering)
-    stt_service = SpeechToTextService()
     try:
         transcript_result = await stt_service.transcribe(
             audio_path=question.audio_file_path,
-            language=language
+            language=language,
+            audio_hash=question.audio_hash
         )
     except Exception as e:
         logger.error(f"Transcription failed for question {question_id}: {e}")
@@ -792,7 +894,7 @@ async def transcribe_audio(
 
     # After STT sanitization, empty text = no valid speech detected
     transcript_text = transcript_result.text.strip() if transcript_result.text else ""
-    transcript_word_count = len(transcript_text.split()) if transcript_text else 0
+    transcript_word_count = _count_words(transcript_text)
 
     if not transcript_text or transcript_word_count < 3:
         logger.info(f"No speech detected for question {question_id} (word_count={transcript_word_count})")
@@ -826,6 +928,41 @@ async def transcribe_audio(
 # NLP EVALUATION ENDPOINT
 # =============================================================================
 
+def _apply_evaluation(
+    question: InterviewQuestion,
+    evaluation_result: EvaluationResult,
+    evaluation_time_ms: int
+) -> List[str]:
+    """Store an NLP evaluation on a question, returning all suggestions."""
+    all_suggestions = (
+        evaluation_result.relevance.suggestions +
+        evaluation_result.grammar.suggestions +
+        evaluation_result.fluency.suggestions +
+        evaluation_result.keyword_usage.suggestions
+    )
+
+    question.set_evaluation(
+        relevance=evaluation_result.relevance.score,
+        grammar=evaluation_result.grammar.score,
+        fluency=evaluation_result.fluency.score,
+        keywords=evaluation_result.keyword_usage.score,
+        strengths=evaluation_result.strengths,
+        weaknesses=evaluation_result.improvements,
+        suggestions=all_suggestions,
+        feedback=evaluation_result.summary,
+        raw_data={
+            "relevance_score": evaluation_result.relevance.score,
+            "grammar_score": evaluation_result.grammar.score,
+            "fluency_score": evaluation_result.fluency.score,
+            "keyword_score": evaluation_result.keyword_usage.score,
+            "overall_score": evaluation_result.overall_score,
+            "evaluation_time_ms": evaluation_time_ms,
+        }
+    )
+    return all_suggestions
+
+
+
 @router.post(
     "/{session_id}/questions/{question_id}/evaluate",
     response_model=EvaluationResponse,
@@ -836,7 +973,8 @@ async def evaluate_answer(
     session_id: str,
     question_id: str,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    evaluation_service: NLPEvaluationService = Depends(get_evaluation_service)
 ):
     """
     Evaluate answer using NLP.
@@ -885,8 +1023,8 @@ async def evaluate_answer(
     
     # Check if transcript exists and has valid speech
     transcript = (question.transcript or "").strip()
-    transcript_word_count = len(transcript.split()) if transcript else 0
-    has_valid_speech = bool(transcript and transcript_word_count >= 3)
+    transcript_word_count = _count_words(transcript)
+    has_valid_speech = bool(transcript and transcript_word_count >= MIN_EVALUATION_WORDS)
 
     # Log transcript before evaluation for debugging
     logger.info(f"[Evaluate] Q={question_id} | Words={transcript_word_count} | "
@@ -895,39 +1033,17 @@ async def evaluate_answer(
 
     if has_valid_speech:
         # Evaluate using NLP service — uses ONLY the candidate's transcript
-        evaluation_service = NLPEvaluationService()
         evaluation_result = await evaluation_service.evaluate(
             question=question.question_text,
             response=transcript,
-            expected_keywords=question.expected_keywords or []
+            expected_keywords=question.keywords_normalized or question.expected_keywords or []
         )
 
         overall = evaluation_result.overall_score
-        all_suggestions = (
-            evaluation_result.relevance.suggestions +
-            evaluation_result.grammar.suggestions +
-            evaluation_result.fluency.suggestions +
-            evaluation_result.keyword_usage.suggestions
-        )
 
         # Update question with evaluation
-        question.set_evaluation(
-            relevance=evaluation_result.relevance.score,
-            grammar=evaluation_result.grammar.score,
-            fluency=evaluation_result.fluency.score,
-            keywords=evaluation_result.keyword_usage.score,
-            strengths=evaluation_result.strengths,
-            weaknesses=evaluation_result.improvements,
-            suggestions=all_suggestions,
-            feedback=evaluation_result.summary,
-            raw_data={
-                "relevance_score": evaluation_result.relevance.score,
-                "grammar_score": evaluation_result.grammar.score,
-                "fluency_score": evaluation_result.fluency.score,
-                "keyword_score": evaluation_result.keyword_usage.score,
-                "overall_score": evaluation_result.overall_score,
-                "evaluation_time_ms": int((time.time() - start_time) * 1000),
-            }
+        all_suggestions = _apply_evaluation(
+            question, evaluation_result, int((time.time() - start_time) * 1000)
         )
 
         strengths = evaluation_result.strengths
@@ -995,6 +1111,85 @@ async def evaluate_answer(
     )
 
 
+@router.post(
+    "/{session_id}/questions/{question_id}/process",
+    response_model=AnswerProcessingResponse,
+    summary="Transcribe and evaluate answer",
+    description="Run speech-to-text and NLP evaluation for an answer in one call."
+)
+async def process_answer(
+    session_id: str,
+    question_id: str,
+    language: str = Query("en", description="Language code (e.g., en, es, fr)"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    stt_service: SpeechToTextService = Depends(get_stt_service),
+    evaluation_service: NLPEvaluationService = Depends(get_evaluation_service)
+):
+    """
+    Transcribe and evaluate an answer in a single request.
+    
+    **Path Parameters:**
+    - **session_id**: Interview session ID
+    - **question_id**: Question ID
+    
+    **Returns:**
+    - Transcription result (same as /transcribe)
+    - Evaluation result (same as /evaluate)
+    
+    **Flow:**
+    1. Start question embedding prep in the background
+    2. Transcribe audio while the prep runs
+    3. Evaluate the transcript with the prepared question embedding
+    """
+    start_time = time.time()
+    
+    result = await db.execute(
+        select(InterviewQuestion.question_text)
+        .where(
+            InterviewQuestion.id == question_id,
+            InterviewQuestion.session_id == session_id
+        )
+    )
+    question_text = result.scalar_one_or_none()
+    
+    if question_text is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Question not found"
+        )
+    
+    # Overlap evaluation prep with speech-to-text
+    prepare_task = asyncio.create_task(evaluation_service.prepare(question_text))
+    try:
+        transcription = await transcribe_audio(
+            session_id=session_id,
+            question_id=question_id,
+            language=language,
+            current_user=current_user,
+            db=db,
+            stt_service=stt_service
+        )
+    finally:
+        await prepare_task
+    
+    evaluation = await evaluate_answer(
+        session_id=session_id,
+        question_id=question_id,
+        current_user=current_user,
+        db=db,
+        evaluation_service=evaluation_service
+    )
+    
+    return AnswerProcessingResponse(
+        success=True,
+        question_id=question_id,
+        transcription=transcription,
+        evaluation=evaluation,
+        processing_time_ms=int((time.time() - start_time) * 1000)
+    )
+
+
 @router.get(
     "/{session_id}/questions/{question_id}/transcript",
     response_model=TranscriptionResponse,
@@ -1042,7 +1237,7 @@ async def get_transcript(
         confidence=question.transcript_confidence,
         language_detected="en",
         duration_seconds=question.audio_duration_seconds,
-        word_count=len(transcript.split()) if transcript else 0,
+        word_count=_count_words(transcript),
         processing_time_ms=0
     )
 
@@ -1110,6 +1305,46 @@ async def get_session_evaluation(
 # BATCH OPERATIONS
 # =============================================================================
 
+async def evaluate_session_answers(session_id: str, question_ids: List[str]) -> None:
+    """
+    Background task: evaluate the given questions with one batched NLP pass.
+    
+    Runs in its own database session since the request session is closed
+    by the time background tasks execute.
+    """
+    start_time = time.time()
+    evaluation_service = get_evaluation_service()
+    
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(InterviewQuestion)
+                .where(
+                    InterviewQuestion.session_id == session_id,
+                    InterviewQuestion.id.in_(question_ids)
+                )
+            )
+            questions = result.scalars().all()
+            
+            evaluation_results = await evaluation_service.evaluate_batch([
+                {
+                    "question": q.question_text,
+                    "response": q.transcript.strip(),
+                    "expected_keywords": q.keywords_normalized or q.expected_keywords or [],
+                }
+                for q in questions
+            ])
+            
+            elapsed_ms = int((time.time() - start_time) * 1000)
+            for question, evaluation_result in zip(questions, evaluation_results):
+                _apply_evaluation(question, evaluation_result, elapsed_ms)
+            
+            await db.commit()
+            logger.info(f"[EvaluateAll] Session {session_id}: evaluated {len(questions)} answers")
+    except Exception as e:
+        logger.error(f"Batch evaluation failed for session {session_id}: {e}")
+
+
 @router.post(
     "/{session_id}/evaluate-all",
     response_model=APIResponse,
@@ -1132,9 +1367,10 @@ async def evaluate_all_answers(
     
     **Returns:** Confirmation that evaluation has started
     """
-    # Verify session exists
+    # Verify session exists (questions loaded in the same round trip)
     result = await db.execute(
         select(InterviewSession)
+        .options(selectinload(InterviewSession.questions))
         .where(
             InterviewSession.id == session_id,
             InterviewSession.user_id == current_user.id
@@ -1148,11 +1384,24 @@ async def evaluate_all_answers(
             detail="Interview session not found"
         )
     
+    pending_questions = [
+        q for q in session.questions
+        if not q.is_evaluated and _count_words(q.transcript) >= MIN_EVALUATION_WORDS
+    ]
+    
     # Queue background evaluation task
-    # background_tasks.add_task(evaluate_session_answers, session_id)
+    if pending_questions:
+        background_tasks.add_task(
+            evaluate_session_answers,
+            session_id,
+            [q.id for q in pending_questions]
+        )
     
     return APIResponse(
         success=True,
         message="Evaluation started. Results will be available shortly.",
-        data={"session_id": session_id}
+        data={
+            "session_id": session_id,
+            "pending_questions": len(pending_questions)
+        }
     )
@@ -16,23 +16,33 @@ Version: 1.0.0
 ==============================================================================
 """
 
+import io
 import os
+import re
+import sys
+import mmap
 import uuid
+import bisect
+import random
 import time
 import asyncio
 import aiofiles
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from fastapi import (
     APIRouter, Depends, HTTPException, status,
-    UploadFile, File, Form, Query, BackgroundTasks
+    UploadFile, File, Form, Query, BackgroundTasks, Request, Response
 )
+from starlette.formparsers import MultiPartParser
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, func, tuple_
+from sqlalchemy.orm import selectinload, joinedload, load_only
 from sqlalchemy.orm.attributes import flag_modified
 
-from app.database import get_db
+from app.database import get_db, AsyncSessionLocal
+from app.responses import ORJSONResponse, render_json
 from app.models.user import User
 from app.models.interview import InterviewSession, InterviewStatus
 from app.models.question import InterviewQuestion
@@ -45,13 +55,14 @@ from app.schemas.skill_interview import (
     SkillQuestion,
     QuestionScore,
     InterviewResult,
-    InterviewHistoryItem,
     InterviewHistoryResponse,
 )
-from app.services.auth_service import get_current_user
-from app.services.question_service import QuestionGeneratorService
-from app.services.stt_service import SpeechToTextService
-from app.services.evaluation_service import NLPEvaluationService
+from app.services.auth_service import get_current_user, invalidate_cached_user
+from app.services.question_service import QuestionGeneratorService, GeneratedQuestion
+from app.services.stt_service import get_stt_service, audio_hasher
+from app.services.evaluation_service import get_evaluation_service
+from app.services.normalized_cache import get_normalized_cache
+from app.services.stats_service import invalidate_user_stats
 from app.config import settings
 
 import logging
@@ -65,12 +76,27 @@ logger = logging.getLogger(__name__)
 router = APIRouter(
     prefix="/skill-interview",
     tags=["Skill-Based Interview"],
+    default_response_class=ORJSONResponse,
     responses={
         404: {"description": "Not found"},
         401: {"description": "Not authenticated"},
     }
 )
 
+# Chunk size used when streaming uploaded audio to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Questions generated per technology/difficulty pool; sessions sample from it
+QUESTION_POOL_SIZE = 20
+
+# Pool cache keys with a background refill in flight
+_pool_refills: set = set()
+
+# Maximum audio cleanups running in worker threads at once
+CLEANUP_CONCURRENCY = 4
+_cleanup_semaphore = asyncio.Semaphore(CLEANUP_CONCURRENCY)
+
+
 def debug_log(message: str, data: any = None):
     """Helper for consistent debug logging."""
     if data:
@@ -78,11 +104,50 @@ def debug_log(message: str, data: any = None):
     else:
         logger.debug(message)
 
+
+def _upload_fileno(upload: UploadFile) -> Optional[int]:
+    """Descriptor backing an upload, if it has already spilled to disk."""
+    if not sys.platform.startswith("linux"):
+        return None
+    # Starlette spools uploads in memory up to MultiPartParser.max_file_size;
+    # fileno() on one of those would force a rollover to disk
+    if upload.size is not None and upload.size <= MultiPartParser.max_file_size:
+        return None
+    try:
+        return upload.file.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _sendfile_upload(src_fd: int, dst_path: str) -> Tuple[int, str]:
+    """
+    Copy a spilled upload in-kernel with sendfile, returning (size, hash).
+    
+    The source is hashed through a read-only mmap, so the bytes never pass
+    through a Python-level buffer.
+    """
+    size = os.fstat(src_fd).st_size
+    hasher = audio_hasher()
+    dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+            if not sent:
+                break
+            offset += sent
+    finally:
+        os.close(dst_fd)
+    if size:
+        with mmap.mmap(src_fd, size, access=mmap.ACCESS_READ) as mapped:
+            hasher.update(mapped)
+    return size, hasher.hexdigest()
+
 # =============================================================================
 # TECHNOLOGY DATA
 # =============================================================================
 
-TECHNOLOGIES = [
+_RAW_TECHNOLOGIES = [
     # Programming Languages
     {"id": "python", "name": "Python", "category": "Programming Languages", "icon": "🐍"},
     {"id": "javascript", "name": "JavaScript", "category": "Programming Languages", "icon": "💛"},
@@ -140,6 +205,21 @@ TECHNOLOGIES = [
     {"id": "graphql", "name": "GraphQL", "category": "Architecture", "icon": "◼️"},
 ]
 
+# Immutable technology catalogue and lookup tables, built once at import
+TECHNOLOGIES = tuple(Technology(**tech) for tech in _RAW_TECHNOLOGIES)
+TECH_BY_ID: Dict[str, Technology] = {tech.id: tech for tech in TECHNOLOGIES}
+
+# Accepts either the id or the lowercased display name
+TECH_BY_KEY: Dict[str, Technology] = {tech.name.lower(): tech for tech in TECHNOLOGIES}
+TECH_BY_KEY.update(TECH_BY_ID)
+
+TECH_CATEGORIES_SORTED = sorted({tech.category for tech in TECHNOLOGIES})
+
+TECH_LIST_RESPONSE = TechnologyListResponse(
+    technologies=list(TECHNOLOGIES),
+    categories=TECH_CATEGORIES_SORTED
+)
+
 IDEAL_ANSWERS = {
     "python": {
         "What are Python's key features?": "Python's key features include: 1) Easy to read and write syntax with significant whitespace, 2) Dynamic typing - no need to declare variable types, 3) Interpreted language for rapid development, 4) Extensive standard library, 5) Support for multiple programming paradigms (OOP, functional, procedural), 6) Strong community and ecosystem with PyPI, 7) Memory management with garbage collection, 8) Cross-platform compatibility.",
@@ -176,6 +256,71 @@ IDEAL_ANSWERS = {
     },
 }
 
+_WORD_RE = re.compile(r"\w+")
+
+
+def _tokenize(text_lower: str) -> Tuple[frozenset, frozenset]:
+    """
+    Return (all word tokens, interior word tokens) of a lowercased text.
+    
+    If text A is a substring of text B, every interior token of A is a
+    whole word of B (its first/last token may be cut mid-word), so the
+    interior set is a cheap necessary condition for the substring test.
+    """
+    tokens = _WORD_RE.findall(text_lower)
+    return frozenset(tokens), frozenset(tokens[1:-1])
+
+
+# Per technology: (lowercased question, tokens, interior tokens, answer),
+# tokenized once at import for substring matching
+_IDEAL_INDEX = {
+    tech: [
+        (stored_q.lower(), *_tokenize(stored_q.lower()), stored_a)
+        for stored_q, stored_a in answers.items()
+    ]
+    for tech, answers in IDEAL_ANSWERS.items()
+}
+
+
+def _find_ideal_answer(tech_key: str, question_text: str) -> Optional[str]:
+    """Return the stored ideal answer whose question overlaps question_text."""
+    question_lower = question_text.lower()
+    question_tokens, question_interior = _tokenize(question_lower)
+    for stored_q_lower, stored_tokens, stored_interior, stored_a in _IDEAL_INDEX.get(tech_key, ()):
+        # Token-set checks reject most entries before any substring scan
+        if stored_interior <= question_tokens and stored_q_lower in question_lower:
+            return stored_a
+        if question_interior <= stored_tokens and question_lower in stored_q_lower:
+            return stored_a
+    return None
+
+
+def _as_question_dict(q: Any) -> Dict[str, Any]:
+    """Normalize a generated question (dict, pydantic model or dataclass) to a dict."""
+    if isinstance(q, dict):
+        return q
+    if hasattr(q, "model_dump"):
+        return q.model_dump()
+    return vars(q)
+
+
+# =============================================================================
+# SCORING BANDS
+# =============================================================================
+
+# Percentage cutoffs, ascending; bisect_right maps a score to its band
+_GRADE_CUTOFFS = (40, 50, 60, 70, 80, 90)
+_GRADES = ("F", "D", "C", "B", "B+", "A", "A+")
+
+_PERFORMANCE_CUTOFFS = (40, 60, 80)
+_PERFORMANCE_RATINGS = ("needs_improvement", "average", "good", "excellent")
+_PERFORMANCE_SUMMARIES = (
+    "Needs improvement. Consider reviewing {technology} fundamentals and practice explaining concepts more clearly.",
+    "Satisfactory performance. You have basic understanding of {technology} but need to work on technical depth and clarity.",
+    "Good performance. You showed solid understanding of {technology} fundamentals with room for improvement in some areas.",
+    "Excellent performance! You demonstrated strong knowledge of {technology} with clear and well-structured answers.",
+)
+
 
 # =============================================================================
 # ENDPOINTS
@@ -193,13 +338,7 @@ async def get_technologies():
     
     Returns list of technologies grouped by category.
     """
-    technologies = [Technology(**tech) for tech in TECHNOLOGIES]
-    categories = list(set(tech["category"] for tech in TECHNOLOGIES))
-    
-    return TechnologyListResponse(
-        technologies=technologies,
-        categories=sorted(categories)
-    )
+    return TECH_LIST_RESPONSE
 
 
 @router.post(
@@ -211,6 +350,7 @@ async def get_technologies():
 )
 async def start_skill_interview(
     request: SkillInterviewRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -230,22 +370,16 @@ async def start_skill_interview(
         "user_id": current_user.id
     })
     
-    # Validate technology
-    tech_ids = [t["id"] for t in TECHNOLOGIES]
-    tech_names = [t["name"].lower() for t in TECHNOLOGIES]
+    # Validate technology (by id or display name)
+    tech = TECH_BY_KEY.get(request.technology.lower())
     
-    if request.technology.lower() not in tech_names and request.technology.lower() not in tech_ids:
+    if tech is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid technology. Available: {', '.join(t['name'] for t in TECHNOLOGIES[:10])}..."
+            detail=f"Invalid technology. Available: {', '.join(t.name for t in TECHNOLOGIES[:10])}..."
         )
     
-    # Find technology name
-    tech_name = request.technology
-    for tech in TECHNOLOGIES:
-        if tech["id"] == request.technology.lower() or tech["name"].lower() == request.technology.lower():
-            tech_name = tech["name"]
-            break
+    tech_name = tech.name
     
     # Create session
     new_session = InterviewSession(
@@ -267,23 +401,41 @@ async def start_skill_interview(
     
     # Generate questions using AI service
     debug_log("Generating questions...")
-    question_service = QuestionGeneratorService()
     generation_started = time.time()
     
-    try:
-        generated_questions = await question_service.generate_questions(
-            role=f"{tech_name} Developer",
-            skills=[tech_name],
-            experience_years=3,
-            difficulty=request.difficulty,
-            num_questions=request.num_questions,
-            categories=["technical"]
-        )
-    except Exception as e:
-        logger.warning(f"AI question generation failed: {e}, using fallback")
-        debug_log("AI generation failed, using fallback", str(e))
-        # Use fallback questions
-        generated_questions = _get_fallback_questions(tech_name, request.num_questions, request.difficulty)
+    # The cache holds a candidate pool per technology/difficulty; each session
+    # draws its own sample so users and retakes do not share one fixed set
+    question_cache = get_normalized_cache(f"questions:{tech_name.lower()}")
+    cache_key = f"{tech_name}|{request.difficulty}"
+    question_pool = await question_cache.get(cache_key)
+    
+    if question_pool is not None and len(question_pool) >= request.num_questions:
+        debug_log("Question pool served from cache", cache_key)
+        generated_questions = random.sample(question_pool, request.num_questions)
+    else:
+        # Only the requested count is generated on the request path; the
+        # larger shared pool is filled in the background
+        question_service = QuestionGeneratorService()
+        try:
+            generated_questions = await question_service.generate_questions(
+                role=f"{tech_name} Developer",
+                skills=[tech_name],
+                experience_years=3,
+                difficulty=request.difficulty,
+                num_questions=request.num_questions,
+                categories=["technical"]
+            )
+            if cache_key not in _pool_refills:
+                _pool_refills.add(cache_key)
+                background_tasks.add_task(
+                    refill_question_pool, tech_name, request.difficulty,
+                    max(QUESTION_POOL_SIZE, request.num_questions)
+                )
+        except Exception as e:
+            logger.warning(f"AI question generation failed: {e}, using fallback")
+            debug_log("AI generation failed, using fallback", str(e))
+            # Use fallback questions
+            generated_questions = list(_get_fallback_questions(tech_name, request.num_questions, request.difficulty))
     generation_time_ms = int((time.time() - generation_started) * 1000)
     session_settings = dict(new_session.settings or {})
     session_settings["question_generation_ms"] = generation_time_ms
@@ -293,24 +445,19 @@ async def start_skill_interview(
     debug_log("Questions generated", {"count": len(generated_questions)})
     
     # Create question records
-    skill_questions = []
+    question_rows = []
+    tech_key = tech_name.lower()
     for i, q in enumerate(generated_questions, start=1):
-        # Get ideal answer if available
-        tech_key = tech_name.lower()
-        ideal_answer = None
-        
-        # Handle both Pydantic model and dict formats
-        q_text = getattr(q, 'question_text', '') if hasattr(q, 'question_text') else (q.get('question_text', '') if isinstance(q, dict) else '')
-        q_keywords = getattr(q, 'expected_topics', []) if hasattr(q, 'expected_topics') else (q.get('expected_keywords', []) if isinstance(q, dict) else [])
-        q_ideal = getattr(q, 'ideal_answer', None) if hasattr(q, 'ideal_answer') else (q.get('ideal_answer') if isinstance(q, dict) else None)
+        # Handle dict, Pydantic model and dataclass formats
+        qd = _as_question_dict(q)
+        q_text = qd.get('question_text', '')
+        q_keywords = qd.get('expected_topics') or qd.get('expected_keywords') or []
+        q_ideal = qd.get('ideal_answer')
         
-        if tech_key in IDEAL_ANSWERS:
-            for stored_q, stored_a in IDEAL_ANSWERS.get(tech_key, {}).items():
-                if stored_q.lower() in q_text.lower() or q_text.lower() in stored_q.lower():
-                    ideal_answer = stored_a
-                    break
+        # Get ideal answer if available
+        ideal_answer = _find_ideal_answer(tech_key, q_text)
         
-        question = InterviewQuestion(
+        question_rows.append(InterviewQuestion(
             session_id=new_session.id,
             question_text=q_text,
             question_order=i,
@@ -319,27 +466,28 @@ async def start_skill_interview(
             expected_keywords=q_keywords,
             ideal_answer=ideal_answer or q_ideal,
             time_limit=120
-        )
-        db.add(question)
-        await db.flush()  # Flush to get the question ID
-        
-        skill_questions.append(SkillQuestion(
+        ))
+    
+    db.add_all(question_rows)
+    
+    # Update session status (questions and status are written in one commit)
+    new_session.status = InterviewStatus.IN_PROGRESS.value
+    new_session.started_at = datetime.now(timezone.utc)
+    await db.commit()
+    
+    skill_questions = [
+        SkillQuestion(
             id=question.id,
-            question_number=i,
+            question_number=question.question_order,
             question_text=question.question_text,
             technology=tech_name,
             difficulty=request.difficulty,
             expected_keywords=question.expected_keywords or [],
             ideal_answer=question.ideal_answer,
             time_limit_seconds=120
-        ))
-    
-    await db.commit()
-    
-    # Update session status
-    new_session.status = InterviewStatus.IN_PROGRESS.value
-    new_session.started_at = datetime.now(timezone.utc)
-    await db.commit()
+        )
+        for question in question_rows
+    ]
     
     return SkillInterviewResponse(
         session_id=new_session.id,
@@ -473,10 +621,11 @@ async def start_resume_interview(
     # Create question records
     skill_questions = []
     for i, q in enumerate(generated_questions, start=1):
-        q_text = getattr(q, 'question_text', '') if hasattr(q, 'question_text') else (q.get('question_text', '') if isinstance(q, dict) else '')
-        q_keywords = getattr(q, 'expected_topics', []) if hasattr(q, 'expected_topics') else (q.get('expected_keywords', []) if isinstance(q, dict) else [])
-        q_ideal = getattr(q, 'ideal_answer', None) if hasattr(q, 'ideal_answer') else (q.get('ideal_answer') if isinstance(q, dict) else None)
-        q_category = getattr(q, 'category', 'behavioral') if hasattr(q, 'category') else (q.get('category', 'behavioral') if isinstance(q, dict) else 'behavioral')
+        qd = _as_question_dict(q)
+        q_text = qd.get('question_text', '')
+        q_keywords = qd.get('expected_topics') or qd.get('expected_keywords') or []
+        q_ideal = qd.get('ideal_answer')
+        q_category = qd.get('category', 'behavioral')
 
         question = InterviewQuestion(
             session_id=new_session.id,
@@ -527,6 +676,7 @@ async def start_resume_interview(
 async def upload_audio_answer(
     session_id: str,
     question_id: str,
+    background_tasks: BackgroundTasks,
     audio: UploadFile = File(...),
     duration_seconds: float = Form(0),
     current_user: User = Depends(get_current_user),
@@ -536,6 +686,7 @@ async def upload_audio_answer(
     Upload audio recording for a question.
     
     Accepts audio file (wav, mp3, webm, m4a) and stores it for processing.
+    Transcription starts in the background so it is ready by submit time.
     """
     debug_log("=== UPLOAD AUDIO ===")
     debug_log("Input params", {
@@ -546,41 +697,27 @@ async def upload_audio_answer(
         "user_id": current_user.id
     })
     
-    # Validate session
+    # Validate session ownership and question in one query
     result = await db.execute(
-        select(InterviewSession).where(
+        select(InterviewQuestion, InterviewSession)
+        .join(InterviewSession, InterviewQuestion.session_id == InterviewSession.id)
+        .where(
+            InterviewQuestion.id == question_id,
             InterviewSession.id == session_id,
             InterviewSession.user_id == current_user.id
         )
     )
-    session = result.scalar_one_or_none()
-    
-    if not session:
-        debug_log("ERROR: Session not found", session_id)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Session not found"
-        )
-    
-    debug_log("Session found", {"status": session.status})
-    
-    # Validate question
-    result = await db.execute(
-        select(InterviewQuestion).where(
-            InterviewQuestion.id == question_id,
-            InterviewQuestion.session_id == session_id
-        )
-    )
-    question = result.scalar_one_or_none()
+    row = result.first()
     
-    if not question:
-        debug_log("ERROR: Question not found", question_id)
+    if not row:
+        debug_log("ERROR: Session or question not found", {"session_id": session_id, "question_id": question_id})
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Question not found"
+            detail="Session or question not found"
         )
     
-    debug_log("Question found", {"question_order": question.question_order})
+    question, session = row
+    debug_log("Question found", {"question_order": question.question_order, "session_status": session.status})
     
     # Validate file
     if not audio.filename:
@@ -609,22 +746,44 @@ async def upload_audio_answer(
     filename = f"{question_id}.{file_ext}"
     file_path = os.path.join(upload_dir, filename)
     
-    async with aiofiles.open(file_path, 'wb') as f:
-        content = await audio.read()
-        await f.write(content)
+    # Uploads already spilled to a temp file are copied in-kernel; otherwise
+    # stream to disk in chunks so the recording is never held in memory
+    audio_hash = None
+    src_fd = _upload_fileno(audio)
+    if src_fd is not None:
+        try:
+            file_size, audio_hash = await asyncio.to_thread(_sendfile_upload, src_fd, file_path)
+        except OSError as e:
+            debug_log("sendfile copy failed, falling back to chunked write", str(e))
+    
+    if audio_hash is None:
+        file_size = 0
+        hasher = audio_hasher()
+        await audio.seek(0)
+        async with aiofiles.open(file_path, 'wb') as f:
+            while chunk := await audio.read(UPLOAD_CHUNK_SIZE):
+                hasher.update(chunk)
+                await f.write(chunk)
+                file_size += len(chunk)
+        audio_hash = hasher.hexdigest()
     
-    file_size = len(content)
     debug_log("File saved", {"path": file_path, "size": file_size})
     
-    # Update question record
+    # Update question record; a new recording supersedes any earlier transcript
     question.audio_file_path = file_path
     question.audio_file_size = file_size
+    question.audio_hash = audio_hash
     question.audio_duration_seconds = duration_seconds
     question.answered_at = datetime.now(timezone.utc)
+    question.transcript = None
+    question.transcript_confidence = None
     
     await db.commit()
     debug_log("Audio upload COMPLETE")
     
+    # Transcribe while the candidate moves on to the next question
+    background_tasks.add_task(transcribe_and_store, question_id, file_path, audio_hash)
+    
     return {
         "success": True,
         "message": "Audio uploaded successfully",
@@ -702,6 +861,9 @@ async def submit_text_answer(
     question.transcript = answer_text
     question.transcript_confidence = 1.0  # Perfect confidence for typed text
     question.answered_at = datetime.now(timezone.utc)
+    # A pending background transcription only writes while the row still
+    # carries its audio hash, so clearing it keeps the typed answer
+    question.audio_hash = None
 
     await db.commit()
     debug_log("Text answer submitted successfully")
@@ -776,8 +938,12 @@ async def generate_adaptive_followup(
     answer_text = ((body or {}).get("answer_text") or base_question.transcript or "").strip()
     if not answer_text and base_question.audio_file_path:
         try:
-            stt_service = SpeechToTextService()
-            tr = await stt_service.transcribe(base_question.audio_file_path, language="en")
+            stt_service = get_stt_service()
+            tr = await stt_service.transcribe(
+                base_question.audio_file_path,
+                language="en",
+                audio_hash=base_question.audio_hash
+            )
             answer_text = (tr.text or "").strip()
             if answer_text:
                 base_question.transcript = answer_text
@@ -866,16 +1032,29 @@ async def submit_interview(
     debug_log("User ID", current_user.id)
     submit_started = time.time()
     
-    # Get session with questions
+    # Get session with questions in a single joined query; only the
+    # question columns scoring reads are loaded (scores are bulk-updated)
     result = await db.execute(
         select(InterviewSession)
-        .options(selectinload(InterviewSession.questions))
+        .options(
+            joinedload(InterviewSession.questions).load_only(
+                InterviewQuestion.question_order,
+                InterviewQuestion.question_text,
+                InterviewQuestion.expected_keywords,
+                InterviewQuestion.keywords_normalized,
+                InterviewQuestion.ideal_answer,
+                InterviewQuestion.audio_file_path,
+                InterviewQuestion.audio_hash,
+                InterviewQuestion.transcript,
+                InterviewQuestion.transcript_confidence
+            )
+        )
         .where(
             InterviewSession.id == session_id,
             InterviewSession.user_id == current_user.id
         )
     )
-    session = result.scalar_one_or_none()
+    session = result.unique().scalar_one_or_none()
     
     if not session:
         debug_log("ERROR: Session not found")
@@ -901,14 +1080,14 @@ async def submit_interview(
     # Initialize services
     debug_log("Initializing STT and Evaluation services...")
     try:
-        stt_service = SpeechToTextService()
+        stt_service = get_stt_service()
         debug_log("STT service initialized")
     except Exception as e:
         debug_log("STT service init FAILED, using fallback", str(e))
         stt_service = None
     
     try:
-        evaluation_service = NLPEvaluationService()
+        evaluation_service = get_evaluation_service()
         debug_log("Evaluation service initialized")
     except Exception as e:
         debug_log("Evaluation service init FAILED, using fallback", str(e))
@@ -926,142 +1105,187 @@ async def submit_interview(
     # Minimum word count to consider a transcript as valid speech
     MIN_TRANSCRIPT_WORDS = 3
 
-    for i, question in enumerate(questions):
-        debug_log(f"Processing question {i+1}/{len(questions)}", question.id)
-        transcript = ""
-
-        # Step 1: Check if text answer already exists (typed answer)
+    async def _resolve_transcript(question: InterviewQuestion) -> tuple:
+        """Return (transcript, new confidence or None) for a question."""
+        # Step 1: Use the typed answer or the transcript stored after upload
         if question.transcript and question.transcript.strip():
-            debug_log("Using existing text answer (typed)", {
+            debug_log("Using existing transcript (typed or background STT)", {
                 "length": len(question.transcript),
                 "preview": question.transcript[:100]
             })
-            transcript = question.transcript.strip()
+            return question.transcript.strip(), None
+
         # Step 1b: Transcribe audio (STT service now includes hallucination filtering)
-        elif question.audio_file_path and os.path.exists(question.audio_file_path):
-            debug_log("Transcribing audio", question.audio_file_path)
-            if stt_service:
-                try:
-                    transcription_result = await stt_service.transcribe(question.audio_file_path)
-                    # After sanitization by STT service, empty text means no valid speech
-                    transcript = transcription_result.text.strip() if transcription_result.text else ""
-                    question.transcript_confidence = transcription_result.confidence
-                    debug_log("Transcription result", {
-                        "length": len(transcript),
-                        "word_count": len(transcript.split()) if transcript else 0,
-                        "confidence": transcription_result.confidence,
-                        "preview": transcript[:100] if transcript else "(empty)"
-                    })
-                except Exception as e:
-                    debug_log("Transcription FAILED", str(e))
-                    logger.error(f"Transcription failed for question {question.id}: {e}")
-                    transcript = ""
-            else:
-                debug_log("No STT service available")
-                transcript = ""
-        else:
+        if not (question.audio_file_path and os.path.exists(question.audio_file_path)):
             debug_log("No audio file or text answer", question.audio_file_path)
-            transcript = ""
-
-        # Step 2: Validate transcript before evaluation
-        transcript_word_count = len(transcript.split()) if transcript else 0
-        has_valid_speech = bool(transcript and transcript_word_count >= MIN_TRANSCRIPT_WORDS)
-
-        # Store transcript consistently — use actual text or empty string (never fake text)
-        question.transcript = transcript if transcript else ""
-
-        # Log transcript for debugging BEFORE evaluation
-        logger.info(f"[Q{i+1}] Question: {question.question_text[:80]}...")
-        logger.info(f"[Q{i+1}] Transcript ({transcript_word_count} words): {transcript[:200] if transcript else '(empty)'}")
-        logger.info(f"[Q{i+1}] Valid speech: {has_valid_speech}")
-
-        # Step 3: Evaluate answer — ONLY if real speech was detected
-        if has_valid_speech and evaluation_service:
-            debug_log("Evaluating answer with real transcript...")
-            try:
-                eval_result = await evaluation_service.evaluate(
-                    question=question.question_text,
-                    response=transcript,
-                    expected_keywords=question.expected_keywords,
-                    context=technology
-                )
+            return "", None
+
+        if not stt_service:
+            debug_log("No STT service available")
+            return "", None
+
+        debug_log("Transcribing audio", question.audio_file_path)
+        try:
+            transcription_result = await stt_service.transcribe(
+                question.audio_file_path,
+                audio_hash=question.audio_hash
+            )
+        except Exception as e:
+            debug_log("Transcription FAILED", str(e))
+            logger.error(f"Transcription failed for question {question.id}: {e}")
+            return "", None
+
+        # After sanitization by STT service, empty text means no valid speech
+        transcript = transcription_result.text.strip() if transcription_result.text else ""
+        debug_log("Transcription result", {
+            "length": len(transcript),
+            "word_count": len(transcript.split()) if transcript else 0,
+            "confidence": transcription_result.confidence,
+            "preview": transcript[:100] if transcript else "(empty)"
+        })
+        return transcript, transcription_result.confidence
+
+    # Stage 1: transcribe all answers concurrently
+    resolved = await asyncio.gather(*[_resolve_transcript(q) for q in questions])
+    transcripts = [transcript for transcript, _ in resolved]
+    word_counts = [len(t.split()) if t else 0 for t in transcripts]
+
+    # Stage 2: evaluate every answer with real speech concurrently
+    valid_indices = [
+        i for i, (transcript, word_count) in enumerate(zip(transcripts, word_counts))
+        if transcript and word_count >= MIN_TRANSCRIPT_WORDS
+    ]
+    eval_outcomes = {}
+    if evaluation_service and valid_indices:
+        debug_log("Evaluating answers with real transcripts...", len(valid_indices))
+        eval_items = [
+            {
+                "question": questions[i].question_text,
+                "response": transcripts[i],
+                "expected_keywords": questions[i].keywords_normalized or questions[i].expected_keywords,
+                "context": technology,
+            }
+            for i in valid_indices
+        ]
+        try:
+            # One batched embedding pass for every answer
+            outcomes = await evaluation_service.evaluate_batch(eval_items)
+        except Exception as e:
+            debug_log("Batch evaluation FAILED, evaluating individually", str(e))
+            outcomes = await asyncio.gather(
+                *[evaluation_service.evaluate(**item) for item in eval_items],
+                return_exceptions=True
+            )
+        eval_outcomes = dict(zip(valid_indices, outcomes))
+
+    # Stage 3: score each question; no flushes until the single commit
+    question_updates = []
+    evaluated_at = datetime.now(timezone.utc)
+    with db.no_autoflush:
+        for i, question in enumerate(questions):
+            debug_log(f"Scoring question {i+1}/{len(questions)}", question.id)
+            transcript = transcripts[i]
+
+            # Validate transcript before evaluation
+            transcript_word_count = word_counts[i]
+            has_valid_speech = bool(transcript and transcript_word_count >= MIN_TRANSCRIPT_WORDS)
+
+            # Log transcript for debugging
+            logger.info(f"[Q{i+1}] Question: {question.question_text[:80]}...")
+            logger.info(f"[Q{i+1}] Transcript ({transcript_word_count} words): {transcript[:200] if transcript else '(empty)'}")
+            logger.info(f"[Q{i+1}] Valid speech: {has_valid_speech}")
+
+            # Use evaluation — ONLY if real speech was detected
+            if has_valid_speech and evaluation_service:
+                try:
+                    eval_result = eval_outcomes[i]
+                    if isinstance(eval_result, Exception):
+                        raise eval_result
 
-                # Convert 0-100 scores to 0-5 scale
-                grammar_score = min(5.0, eval_result.grammar.score / 20)
-                fluency_score = min(5.0, eval_result.fluency.score / 20)
-                structure_score = min(5.0, eval_result.relevance.score / 20)
-                similarity_score = min(5.0, eval_result.keyword_usage.score / 20)
+                    # Convert 0-100 scores to 0-5 scale
+                    grammar_score = min(5.0, eval_result.grammar.score / 20)
+                    fluency_score = min(5.0, eval_result.fluency.score / 20)
+                    structure_score = min(5.0, eval_result.relevance.score / 20)
+                    similarity_score = min(5.0, eval_result.keyword_usage.score / 20)
 
-                overall_score = (grammar_score + fluency_score + structure_score + similarity_score) / 4
-                debug_log("Evaluation SUCCESS", {"overall": overall_score})
+                    overall_score = (grammar_score + fluency_score + structure_score + similarity_score) / 4
+                    debug_log("Evaluation SUCCESS", {"overall": overall_score})
 
-                strengths = eval_result.strengths
-                improvements = eval_result.improvements
+                    strengths = eval_result.strengths
+                    improvements = eval_result.improvements
 
-            except Exception as e:
-                debug_log("Evaluation FAILED", str(e))
-                logger.error(f"Evaluation failed for question {question.id}: {e}")
+                except Exception as e:
+                    debug_log("Evaluation FAILED", str(e))
+                    logger.error(f"Evaluation failed for question {question.id}: {e}")
+                    grammar_score = 0
+                    fluency_score = 0
+                    structure_score = 0
+                    similarity_score = 0
+                    overall_score = 0
+                    strengths = []
+                    improvements = ["Evaluation service encountered an error"]
+            else:
+                # No valid speech detected — score is 0
+                debug_log("No valid speech detected — assigning score 0")
                 grammar_score = 0
                 fluency_score = 0
                 structure_score = 0
                 similarity_score = 0
                 overall_score = 0
                 strengths = []
-                improvements = ["Evaluation service encountered an error"]
-        else:
-            # No valid speech detected — score is 0
-            debug_log("No valid speech detected — assigning score 0")
-            grammar_score = 0
-            fluency_score = 0
-            structure_score = 0
-            similarity_score = 0
-            overall_score = 0
-            strengths = []
-            if not transcript:
-                improvements = ["No response detected — please record your answer"]
-            elif transcript_word_count < MIN_TRANSCRIPT_WORDS:
-                improvements = ["Response too short to evaluate — please provide a more detailed answer"]
-            else:
-                improvements = ["No valid answer provided"]
+                if not transcript:
+                    improvements = ["No response detected — please record your answer"]
+                elif transcript_word_count < MIN_TRANSCRIPT_WORDS:
+                    improvements = ["Response too short to evaluate — please provide a more detailed answer"]
+                else:
+                    improvements = ["No valid answer provided"]
         
-        # Update question with scores
-        question.grammar_score = grammar_score * 20  # Store as 0-100
-        question.fluency_score = fluency_score * 20
-        question.relevance_score = structure_score * 20
-        question.keyword_score = similarity_score * 20
-        question.overall_score = overall_score * 20
-        question.strengths = strengths
-        question.weaknesses = improvements
-        question.is_evaluated = True
-        question.evaluated_at = datetime.now(timezone.utc)
+            # Get ideal answer
+            ideal_answer = question.ideal_answer or _generate_ideal_answer(technology, question.question_text)
         
-        # Get ideal answer
-        ideal_answer = question.ideal_answer
-        if not ideal_answer:
-            ideal_answer = _generate_ideal_answer(technology, question.question_text)
-            question.ideal_answer = ideal_answer
+            # Collect question scores for one bulk UPDATE (stored as 0-100);
+            # transcript is the actual text or empty string (never fake text)
+            question_updates.append({
+                "id": question.id,
+                "transcript": transcript if transcript else "",
+                "transcript_confidence": (
+                    resolved[i][1] if resolved[i][1] is not None else question.transcript_confidence
+                ),
+                "grammar_score": grammar_score * 20,
+                "fluency_score": fluency_score * 20,
+                "relevance_score": structure_score * 20,
+                "keyword_score": similarity_score * 20,
+                "overall_score": overall_score * 20,
+                "strengths": strengths,
+                "weaknesses": improvements,
+                "ideal_answer": ideal_answer,
+                "is_evaluated": True,
+                "evaluated_at": evaluated_at,
+            })
         
-        # Add to totals
-        total_grammar += grammar_score
-        total_fluency += fluency_score
-        total_structure += structure_score
-        total_similarity += similarity_score
+            # Add to totals
+            total_grammar += grammar_score
+            total_fluency += fluency_score
+            total_structure += structure_score
+            total_similarity += similarity_score
         
-        # Create question score response
-        question_scores.append(QuestionScore(
-            question_id=question.id,
-            question_number=question.question_order,
-            question_text=question.question_text,
-            transcript=transcript,
-            grammar_score=round(grammar_score, 1),
-            fluency_score=round(fluency_score, 1),
-            structure_score=round(structure_score, 1),
-            similarity_score=round(similarity_score, 1),
-            overall_score=round(overall_score, 1),
-            strengths=strengths[:3],
-            improvements=improvements[:3],
-            ideal_answer=ideal_answer
-        ))
+            # Create question score response
+            question_scores.append(QuestionScore(
+                question_id=question.id,
+                question_number=question.question_order,
+                question_text=question.question_text,
+                transcript=transcript,
+                grammar_score=round(grammar_score, 1),
+                fluency_score=round(fluency_score, 1),
+                structure_score=round(structure_score, 1),
+                similarity_score=round(similarity_score, 1),
+                overall_score=round(overall_score, 1),
+                strengths=strengths[:3],
+                improvements=improvements[:3],
+                ideal_answer=ideal_answer
+            ))
+    
+    await db.execute(update(InterviewQuestion), question_updates)
     
     # Calculate final scores
     num_questions = len(questions)
@@ -1069,31 +1293,10 @@ async def submit_interview(
     total_score = sum(qs.overall_score for qs in question_scores)
     percentage = (total_score / max_possible) * 100 if max_possible > 0 else 0
     
-    # Determine grade
-    if percentage >= 90:
-        grade = "A+"
-    elif percentage >= 80:
-        grade = "A"
-    elif percentage >= 70:
-        grade = "B+"
-    elif percentage >= 60:
-        grade = "B"
-    elif percentage >= 50:
-        grade = "C"
-    elif percentage >= 40:
-        grade = "D"
-    else:
-        grade = "F"
-    
-    # Generate performance summary
-    if percentage >= 80:
-        performance_summary = f"Excellent performance! You demonstrated strong knowledge of {technology} with clear and well-structured answers."
-    elif percentage >= 60:
-        performance_summary = f"Good performance. You showed solid understanding of {technology} fundamentals with room for improvement in some areas."
-    elif percentage >= 40:
-        performance_summary = f"Satisfactory performance. You have basic understanding of {technology} but need to work on technical depth and clarity."
-    else:
-        performance_summary = f"Needs improvement. Consider reviewing {technology} fundamentals and practice explaining concepts more clearly."
+    # Determine grade and performance band
+    grade = _GRADES[bisect.bisect_right(_GRADE_CUTOFFS, percentage)]
+    performance_band = bisect.bisect_right(_PERFORMANCE_CUTOFFS, percentage)
+    performance_summary = _PERFORMANCE_SUMMARIES[performance_band].format(technology=technology)
     
     # Aggregate strengths and improvements
     all_strengths = []
@@ -1102,19 +1305,12 @@ async def submit_interview(
         all_strengths.extend(qs.strengths)
         all_improvements.extend(qs.improvements)
     
-    # Get unique items
-    overall_strengths = list(set(all_strengths))[:5]
-    overall_improvements = list(set(all_improvements))[:5]
+    # Get unique items, keeping first-seen order
+    overall_strengths = list(dict.fromkeys(all_strengths))[:5]
+    overall_improvements = list(dict.fromkeys(all_improvements))[:5]
 
     # Derive feedback fields expected by /feedback UI
-    if percentage >= 80:
-        performance_rating = "excellent"
-    elif percentage >= 60:
-        performance_rating = "good"
-    elif percentage >= 40:
-        performance_rating = "average"
-    else:
-        performance_rating = "needs_improvement"
+    performance_rating = _PERFORMANCE_RATINGS[performance_band]
 
     if percentage >= 80:
         readiness_level = "ready"
@@ -1158,8 +1354,8 @@ async def submit_interview(
     session.settings = session_settings
     flag_modified(session, "settings")
 
-    # Update user statistics
-    current_user.update_statistics(percentage)
+    # Update user statistics in SQL; current_user may be a cached snapshot
+    await db.execute(User.statistics_update(current_user.id, percentage))
     
     # Save feedback
     feedback = InterviewFeedback(
@@ -1181,12 +1377,14 @@ async def submit_interview(
     )
     db.add(feedback)
 
+    # Single commit for question scores, session, user stats and feedback
     await db.commit()
+    invalidate_user_stats(current_user.id)
+    invalidate_cached_user(current_user.id)
 
     # Schedule audio file cleanup in background
-    audio_paths = [q.audio_file_path for q in questions if q.audio_file_path]
-    if audio_paths:
-        background_tasks.add_task(cleanup_audio_files, session_id, audio_paths)
+    if any(q.audio_file_path for q in questions):
+        background_tasks.add_task(cleanup_audio_files, session_id)
 
     return InterviewResult(
         session_id=session.id,
@@ -1208,6 +1406,14 @@ async def submit_interview(
     )
 
 
+def _results_etag(session_id: str, *updated_at: Optional[datetime]) -> str:
+    """Weak ETag for a session's results from its row timestamps."""
+    stamps = "-".join(
+        str(int(ts.timestamp() * 1_000_000)) if ts else "0" for ts in updated_at
+    )
+    return f'W/"{session_id}-{stamps}"'
+
+
 @router.get(
     "/{session_id}/results",
     response_model=InterviewResult,
@@ -1216,14 +1422,62 @@ async def submit_interview(
 )
 async def get_interview_results(
     session_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get results for a completed interview."""
-    # Get session with questions
+    """
+    Get results for a completed interview.
+    
+    Evaluated results carry a weak ETag derived from the latest session and
+    question updated_at, so any re-scoring (from any route or worker)
+    changes it; a matching If-None-Match gets a 304 without loading the
+    questions.
+    """
+    version = (await db.execute(
+        select(
+            InterviewSession.status,
+            InterviewSession.updated_at,
+            select(func.max(InterviewQuestion.updated_at))
+            .where(InterviewQuestion.session_id == InterviewSession.id)
+            .scalar_subquery()
+        )
+        .where(
+            InterviewSession.id == session_id,
+            InterviewSession.user_id == current_user.id
+        )
+    )).first()
+    
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found"
+        )
+    
+    etag = None
+    if version[0] == InterviewStatus.EVALUATED.value:
+        etag = _results_etag(session_id, version[1], version[2])
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    # Get session with only the question columns the result view shows
     result = await db.execute(
         select(InterviewSession)
-        .options(selectinload(InterviewSession.questions))
+        .options(
+            selectinload(InterviewSession.questions).load_only(
+                InterviewQuestion.question_order,
+                InterviewQuestion.question_text,
+                InterviewQuestion.transcript,
+                InterviewQuestion.grammar_score,
+                InterviewQuestion.fluency_score,
+                InterviewQuestion.relevance_score,
+                InterviewQuestion.keyword_score,
+                InterviewQuestion.overall_score,
+                InterviewQuestion.strengths,
+                InterviewQuestion.weaknesses,
+                InterviewQuestion.ideal_answer
+            )
+        )
         .where(
             InterviewSession.id == session_id,
             InterviewSession.user_id == current_user.id
@@ -1246,9 +1500,12 @@ async def get_interview_results(
     questions = sorted(session.questions, key=lambda q: q.question_order)
     technology = session.skills_tested[0] if session.skills_tested else "General"
     
+    # Build per-question scores and the section totals in one pass
     question_scores = []
+    total_grammar = total_fluency = total_structure = total_similarity = total_score = 0.0
     for q in questions:
-        question_scores.append(QuestionScore(
+        # Stored scores were validated when the interview was submitted
+        question_score = QuestionScore.fast_build(
             question_id=q.id,
             question_number=q.question_order,
             question_text=q.question_text,
@@ -1258,23 +1515,28 @@ async def get_interview_results(
             structure_score=round((q.relevance_score or 0) / 20, 1),
             similarity_score=round((q.keyword_score or 0) / 20, 1),
             overall_score=round((q.overall_score or 0) / 20, 1),
-            strengths=q.strengths or [],
-            improvements=q.weaknesses or [],
+            strengths=tuple(q.strengths or ()),
+            improvements=tuple(q.weaknesses or ()),
             ideal_answer=q.ideal_answer
-        ))
+        )
+        question_scores.append(question_score)
+        total_grammar += question_score.grammar_score
+        total_fluency += question_score.fluency_score
+        total_structure += question_score.structure_score
+        total_similarity += question_score.similarity_score
+        total_score += question_score.overall_score
     
-    total_score = sum(qs.overall_score for qs in question_scores)
     max_possible = len(questions) * 5.0
     
-    return InterviewResult(
+    interview_result = InterviewResult(
         session_id=session.id,
         technology=technology,
         difficulty=session.difficulty,
         question_scores=question_scores,
-        total_grammar_score=round(sum(qs.grammar_score for qs in question_scores), 1),
-        total_fluency_score=round(sum(qs.fluency_score for qs in question_scores), 1),
-        total_structure_score=round(sum(qs.structure_score for qs in question_scores), 1),
-        total_similarity_score=round(sum(qs.similarity_score for qs in question_scores), 1),
+        total_grammar_score=round(total_grammar, 1),
+        total_fluency_score=round(total_fluency, 1),
+        total_structure_score=round(total_structure, 1),
+        total_similarity_score=round(total_similarity, 1),
         total_score=round(total_score, 1),
         max_possible_score=round(max_possible, 1),
         percentage_score=round(session.overall_score or 0, 1),
@@ -1284,146 +1546,267 @@ async def get_interview_results(
         overall_improvements=session.weaknesses or [],
         completed_at=session.completed_at or datetime.now(timezone.utc)
     )
+    
+    # Rendered with the app's orjson options, so completed_at is formatted
+    # the same as in POST /submit
+    body = render_json(interview_result.model_dump())
+    headers = {"ETag": etag} if etag else None
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get(
     "/history",
     response_model=InterviewHistoryResponse,
     summary="Get interview history",
-    description="Get all completed interviews for the current user."
+    description="Get completed interviews for the current user, newest first (keyset paginated)."
 )
 async def get_interview_history(
     limit: int = Query(10, ge=1, le=50),
-    offset: int = Query(0, ge=0),
+    cursor_completed_at: Optional[datetime] = Query(None, description="completed_at of the last item seen"),
+    cursor_id: Optional[str] = Query(None, description="session_id of the last item seen"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get user's interview history."""
-    # Count total
-    count_result = await db.execute(
-        select(func.count(InterviewSession.id)).where(
-            InterviewSession.user_id == current_user.id,
-            InterviewSession.status == InterviewStatus.EVALUATED.value
+    """
+    Get user's interview history, newest first.
+    
+    Uses keyset pagination on (completed_at, id): pass the next_cursor_*
+    values from the previous page to fetch the following one.
+    """
+    # The list view skips the wide JSON/text columns (strengths, summary, ...)
+    query = select(InterviewSession).options(
+        load_only(
+            InterviewSession.skills_tested,
+            InterviewSession.difficulty,
+            InterviewSession.total_questions,
+            InterviewSession.overall_score,
+            InterviewSession.grade,
+            InterviewSession.completed_at,
+            InterviewSession.created_at
         )
+    ).where(
+        InterviewSession.user_id == current_user.id,
+        InterviewSession.status == InterviewStatus.EVALUATED.value
     )
-    total_count = count_result.scalar()
+    if cursor_completed_at is not None and cursor_id is not None:
+        query = query.where(
+            tuple_(InterviewSession.completed_at, InterviewSession.id) < (cursor_completed_at, cursor_id)
+        )
     
-    # Get sessions
+    # Fetch one extra row to know whether another page exists
     result = await db.execute(
-        select(InterviewSession).where(
-            InterviewSession.user_id == current_user.id,
-            InterviewSession.status == InterviewStatus.EVALUATED.value
-        ).order_by(InterviewSession.completed_at.desc())
-        .limit(limit).offset(offset)
+        query.order_by(InterviewSession.completed_at.desc(), InterviewSession.id.desc())
+        .limit(limit + 1)
     )
     sessions = result.scalars().all()
+    has_more = len(sessions) > limit
+    sessions = sessions[:limit]
     
+    # Rows were validated on write, so the page is built as plain dicts in
+    # the InterviewHistoryResponse shape and handed straight to orjson
     history_items = []
     for session in sessions:
-        technology = session.skills_tested[0] if session.skills_tested else "General"
         max_possible = session.total_questions * 5.0
-        total_score = (session.overall_score or 0) * max_possible / 100
-        
-        history_items.append(InterviewHistoryItem(
-            session_id=session.id,
-            technology=technology,
-            difficulty=session.difficulty,
-            total_questions=session.total_questions,
-            total_score=round(total_score, 1),
-            max_possible_score=round(max_possible, 1),
-            percentage_score=round(session.overall_score or 0, 1),
-            grade=session.grade or "N/A",
-            completed_at=session.completed_at or session.created_at
-        ))
-    
-    return InterviewHistoryResponse(
-        interviews=history_items,
-        total_count=total_count
-    )
+        history_items.append({
+            "session_id": session.id,
+            "technology": session.skills_tested[0] if session.skills_tested else "General",
+            "difficulty": session.difficulty,
+            "total_questions": session.total_questions,
+            "total_score": round((session.overall_score or 0) * max_possible / 100, 1),
+            "max_possible_score": round(max_possible, 1),
+            "percentage_score": round(session.overall_score or 0, 1),
+            "grade": session.grade or "N/A",
+            "completed_at": session.completed_at or session.created_at,
+        })
+    
+    last = sessions[-1] if has_more else None
+    return ORJSONResponse(content={
+        "interviews": history_items,
+        "has_more": has_more,
+        "next_cursor_completed_at": last.completed_at if last else None,
+        "next_cursor_id": last.id if last else None,
+    })
 
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
-def cleanup_audio_files(session_id: str, audio_paths: List[str]):
+async def refill_question_pool(tech_name: str, difficulty: str, pool_size: int):
+    """
+    Background task to generate a technology/difficulty question pool.
+    
+    Later sessions sample from the cached pool instead of calling the
+    question generator on the request path.
     """
-    Background task to clean up audio files after processing.
+    cache_key = f"{tech_name}|{difficulty}"
+    try:
+        question_pool = await QuestionGeneratorService().generate_questions(
+            role=f"{tech_name} Developer",
+            skills=[tech_name],
+            experience_years=3,
+            difficulty=difficulty,
+            num_questions=pool_size,
+            categories=["technical"]
+        )
+        await get_normalized_cache(f"questions:{tech_name.lower()}").put(cache_key, question_pool)
+        debug_log("Question pool refilled", {"key": cache_key, "size": len(question_pool)})
+    except Exception as e:
+        logger.warning(f"Question pool refill failed for {cache_key}: {e}")
+    finally:
+        _pool_refills.discard(cache_key)
 
+
+async def transcribe_and_store(question_id: str, audio_path: str, audio_hash: str):
+    """
+    Background task to transcribe an uploaded answer and store the transcript.
+    
+    Runs in its own database session. The row is only updated if its
+    audio_hash still matches, so a re-recording is never overwritten by
+    the transcript of the previous take, nor a typed answer (which clears
+    the hash) by a late transcript.
+    
     Args:
-        session_id: Interview session ID
-        audio_paths: List of audio file paths to delete
+        question_id: Interview question ID
+        audio_path: Path of the uploaded audio file
+        audio_hash: Content hash of the uploaded audio
     """
-    import shutil
+    try:
+        stt_service = get_stt_service()
+        transcription_result = await stt_service.transcribe(audio_path, audio_hash=audio_hash)
+        transcript = transcription_result.text.strip() if transcription_result.text else ""
+        if not transcript:
+            debug_log("Background transcription found no speech", question_id)
+            return
+        
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(InterviewQuestion)
+                .where(
+                    InterviewQuestion.id == question_id,
+                    InterviewQuestion.audio_hash == audio_hash
+                )
+                .values(
+                    transcript=transcript,
+                    transcript_confidence=transcription_result.confidence
+                )
+            )
+            await db.commit()
+        debug_log("Background transcription stored", {"question_id": question_id, "length": len(transcript)})
+    except Exception as e:
+        logger.warning(f"Background transcription failed for question {question_id}: {e}")
 
-    for path in audio_paths:
-        try:
-            if path and os.path.exists(path):
-                os.remove(path)
-                logger.debug(f"Deleted audio file: {path}")
-        except Exception as e:
-            logger.warning(f"Failed to delete audio file {path}: {e}")
 
-    # Try to remove the session directory if empty
+def _safe_unlink(name: str, dir_fd: int, session_dir: str) -> None:
+    """Remove one entry of an open session directory, logging failures."""
+    try:
+        os.unlink(name, dir_fd=dir_fd)
+        logger.debug(f"Deleted audio file: {name}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to delete audio file {name} in {session_dir}: {e}")
+
+
+def _sync_cleanup_audio_files(session_id: str):
+    """
+    Remove a session's audio files and upload directory (blocking).
+
+    The session directory is authoritative: it is opened once and every
+    entry is removed relative to that descriptor (unlinkat), so the kernel
+    does not re-walk the full path for each file.
+
+    Args:
+        session_id: Interview session ID
+    """
     session_dir = os.path.join(settings.upload_dir, "audio", session_id)
     try:
-        if os.path.exists(session_dir) and not os.listdir(session_dir):
-            os.rmdir(session_dir)
-            logger.debug(f"Deleted empty session directory: {session_dir}")
-    except Exception as e:
+        dir_fd = os.open(session_dir, os.O_RDONLY | os.O_DIRECTORY)
+    except FileNotFoundError:
+        return
+
+    try:
+        # scandir reads entry types from getdents, so stray subdirectories
+        # are skipped without a stat or a failed unlink per entry
+        with os.scandir(dir_fd) as entries:
+            names = [entry.name for entry in entries if not entry.is_dir(follow_symlinks=False)]
+        # On networked storage each unlink is a round trip, so overlapping
+        # them pays off; on local disks the sequential loop is faster
+        if settings.cleanup_parallelism > 1 and len(names) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(settings.cleanup_parallelism, len(names))
+            ) as executor:
+                list(executor.map(lambda name: _safe_unlink(name, dir_fd, session_dir), names))
+        else:
+            for name in names:
+                _safe_unlink(name, dir_fd, session_dir)
+    finally:
+        os.close(dir_fd)
+
+    # rmdir itself reports a non-empty directory, so no pre-check is needed
+    try:
+        os.rmdir(session_dir)
+        logger.debug(f"Deleted session directory: {session_dir}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
         logger.warning(f"Failed to delete session directory {session_dir}: {e}")
 
 
-def _get_fallback_questions(technology: str, num_questions: int, difficulty: str) -> list:
-    """Get fallback questions when AI generation fails."""
-    from app.services.question_service import GeneratedQuestion
-    
-    fallback_questions = {
-        "python": [
-            "What are Python's key features?",
-            "Explain the difference between lists and tuples in Python.",
-            "What are decorators in Python and how do they work?",
-            "Explain the GIL (Global Interpreter Lock) in Python.",
-            "What are generators and how are they different from regular functions?",
-            "Explain the concept of context managers in Python.",
-            "What is the difference between deep copy and shallow copy?",
-            "How does Python's memory management work?",
-        ],
-        "javascript": [
-            "What is the event loop in JavaScript?",
-            "Explain closures in JavaScript.",
-            "What is the difference between let, const, and var?",
-            "Explain Promises and async/await in JavaScript.",
-            "What is prototypal inheritance in JavaScript?",
-            "Explain the concept of hoisting.",
-            "What are arrow functions and how do they differ from regular functions?",
-            "Explain the 'this' keyword in JavaScript.",
-        ],
-        "react": [
-            "What is the Virtual DOM and how does React use it?",
-            "Explain the difference between state and props.",
-            "What are React Hooks and why were they introduced?",
-            "How does useEffect work and when should you use it?",
-            "Explain React's reconciliation algorithm.",
-            "What is the Context API and when should you use it?",
-            "How do you optimize React application performance?",
-            "Explain the component lifecycle in React.",
-        ],
-    }
-    
-    tech_lower = technology.lower()
-    questions_list = fallback_questions.get(tech_lower, [
-        f"Explain the core concepts of {technology}.",
-        f"What are the key features of {technology}?",
-        f"How would you use {technology} in a real-world project?",
-        f"What are the best practices when working with {technology}?",
-        f"Explain a challenging problem you solved using {technology}.",
-    ])
-    
-    # Select questions based on count
-    selected = questions_list[:num_questions]
-    
-    return [
+async def cleanup_audio_files(session_id: str):
+    """
+    Background task to clean up a session's audio files after processing.
+
+    The blocking purge runs in a worker thread, bounded by a semaphore so
+    bulk teardown cannot flood the thread pool.
+
+    Args:
+        session_id: Interview session ID
+    """
+    async with _cleanup_semaphore:
+        await asyncio.to_thread(_sync_cleanup_audio_files, session_id)
+
+
+# Static fallback question bank used when AI generation fails
+_FALLBACK_QUESTIONS = {
+    "python": [
+        "What are Python's key features?",
+        "Explain the difference between lists and tuples in Python.",
+        "What are decorators in Python and how do they work?",
+        "Explain the GIL (Global Interpreter Lock) in Python.",
+        "What are generators and how are they different from regular functions?",
+        "Explain the concept of context managers in Python.",
+        "What is the difference between deep copy and shallow copy?",
+        "How does Python's memory management work?",
+    ],
+    "javascript": [
+        "What is the event loop in JavaScript?",
+        "Explain closures in JavaScript.",
+        "What is the difference between let, const, and var?",
+        "Explain Promises and async/await in JavaScript.",
+        "What is prototypal inheritance in JavaScript?",
+        "Explain the concept of hoisting.",
+        "What are arrow functions and how do they differ from regular functions?",
+        "Explain the 'this' keyword in JavaScript.",
+    ],
+    "react": [
+        "What is the Virtual DOM and how does React use it?",
+        "Explain the difference between state and props.",
+        "What are React Hooks and why were they introduced?",
+        "How does useEffect work and when should you use it?",
+        "Explain React's reconciliation algorithm.",
+        "What is the Context API and when should you use it?",
+        "How do you optimize React application performance?",
+        "Explain the component lifecycle in React.",
+    ],
+}
+
+_FALLBACK_DIFFICULTIES = ("easy", "medium", "hard")
+
+
+def _build_fallback_questions(technology: str, questions_list: List[str], difficulty: str) -> tuple:
+    """Build GeneratedQuestion objects for a fallback question list."""
+    return tuple(
         GeneratedQuestion(
             question_text=q,
             category="technical",
@@ -1432,19 +1815,54 @@ def _get_fallback_questions(technology: str, num_questions: int, difficulty: str
             time_limit=120,
             follow_up_questions=[]
         )
-        for q in selected
-    ]
+        for q in questions_list
+    )
+
+
+# Prebuilt at import: (technology, difficulty) -> GeneratedQuestions
+_FALLBACK_CACHE = {
+    (tech, difficulty): _build_fallback_questions(tech, questions_list, difficulty)
+    for tech, questions_list in _FALLBACK_QUESTIONS.items()
+    for difficulty in _FALLBACK_DIFFICULTIES
+}
+
+
+@lru_cache(maxsize=256)
+def _generic_fallback_questions(technology: str, difficulty: str) -> tuple:
+    """Templated fallback questions for technologies without a question bank."""
+    return _build_fallback_questions(technology, [
+        f"Explain the core concepts of {technology}.",
+        f"What are the key features of {technology}?",
+        f"How would you use {technology} in a real-world project?",
+        f"What are the best practices when working with {technology}?",
+        f"Explain a challenging problem you solved using {technology}.",
+    ], difficulty)
+
+
+@lru_cache(maxsize=256)
+def _get_fallback_questions(technology: str, num_questions: int, difficulty: str) -> tuple:
+    """
+    Get fallback questions when AI generation fails.
+    
+    Memoized per (technology, count, difficulty), so repeat requests reuse
+    the same trimmed tuple. Returns shared, prebuilt objects; callers copy
+    it into a list and must not mutate the questions.
+    """
+    questions = _FALLBACK_CACHE.get((technology.lower(), difficulty))
+    if questions is None:
+        questions = _generic_fallback_questions(technology, difficulty)
+    return questions[:num_questions]
 
 
+@lru_cache(maxsize=1024)
 def _generate_ideal_answer(technology: str, question: str) -> str:
-    """Generate a placeholder ideal answer."""
+    """Generate a placeholder ideal answer (cached; IDEAL_ANSWERS is static)."""
     tech_lower = technology.lower()
     
     # Check if we have a stored ideal answer
-    if tech_lower in IDEAL_ANSWERS:
-        for stored_q, stored_a in IDEAL_ANSWERS[tech_lower].items():
-            if stored_q.lower() in question.lower() or question.lower() in stored_q.lower():
-                return stored_a
+    stored_answer = _find_ideal_answer(tech_lower, question)
+    if stored_answer:
+        return stored_answer
     
     # Generic template
     return f"A comprehensive answer should include: 1) Clear definition or explanation of the concept, 2) How it works or is implemented, 3) Key benefits and use cases, 4) Best practices, 5) Real-world examples. For {technology}, focus on practical applications and technical accuracy."
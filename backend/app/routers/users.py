@@ -17,10 +17,12 @@ from datetime import datetime, timedelta
 from typing import List, Optional
 import os
 import uuid
+import secrets
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, exists, bindparam
+from sqlalchemy.exc import IntegrityError
 
 logger = logging.getLogger(__name__)
 
@@ -35,13 +37,20 @@ from app.schemas.user import (
     UserStatsResponse,
     Token,
 )
-from app.schemas.common import APIResponse
+from app.schemas.common import APIResponse, construct_from_attributes
+from app.responses import model_response
 from app.services.auth_service import (
     get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
+    password_needs_rehash,
     create_access_token,
     get_current_user,
+    get_current_user_id,
+    invalidate_cached_user,
 )
+from app.services.skills_service import add_user_skills, remove_user_skill
+from app.services.stats_service import calculate_user_stats, get_user_stats_version
 from app.config import settings
 
 # =============================================================================
@@ -57,6 +66,27 @@ router = APIRouter(
     }
 )
 
+def _user_response(model, user: User):
+    """
+    Build a user response model from a trusted ORM row without validating.
+    
+    The row already satisfies the schema, so model_validate would only
+    repeat checks the database constraints guarantee.
+    """
+    return construct_from_attributes(model, user)
+
+
+# Verified against when the email is unknown, so a failed login costs one
+# password check either way and response time does not reveal registered emails
+_DUMMY_HASH = get_password_hash("not-a-real-password-" + secrets.token_hex(8))
+
+
+# Hot statements built once at import; values are bound per call, so the
+# engine's compiled cache is hit without rebuilding the construct each time
+_SEL_EMAIL_TAKEN = select(exists().where(User.email == bindparam("email")))
+_SEL_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_SEL_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+
 
 # =============================================================================
 # AUTHENTICATION ENDPOINTS
@@ -64,7 +94,8 @@ router = APIRouter(
 
 @router.post(
     "/register",
-    response_model=Token,
+    response_model=None,
+    responses={201: {"model": Token}},
     status_code=status.HTTP_201_CREATED,
     summary="Register a new user",
     description="Create a new user account with profile information."
@@ -89,20 +120,17 @@ async def register_user(
     - JWT access token
     - User profile information
     """
-    # Check if email already exists
-    result = await db.execute(
-        select(User).where(User.email == user_data.email)
-    )
-    existing_user = result.scalar_one_or_none()
+    # Check if email already exists (before paying for the password hash)
+    email_taken = await db.scalar(_SEL_EMAIL_TAKEN, {"email": user_data.email})
     
-    if existing_user:
+    if email_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     
     new_user = User(
         email=user_data.email,
@@ -119,23 +147,32 @@ async def register_user(
     )
     
     db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent registration for the same email
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     
     # Generate access token
     access_token = create_access_token(subject=new_user.id)
     
-    return Token(
+    token = Token(
         access_token=access_token,
         token_type="bearer",
         expires_in=settings.access_token_expire_minutes * 60,
-        user=UserResponse.model_validate(new_user)
+        user=_user_response(UserResponse, new_user)
     )
+    return model_response(token, status_code=status.HTTP_201_CREATED)
 
 
 @router.post(
     "/login",
-    response_model=Token,
+    response_model=None,
+    responses={200: {"model": Token}},
     summary="User login",
     description="Authenticate user and return JWT token."
 )
@@ -154,13 +191,16 @@ async def login(
     - JWT access token
     - User profile information
     """
-    # Find user by email
-    result = await db.execute(
-        select(User).where(User.email == credentials.email)
-    )
+    # Read only until the password checks out, so no write transaction (or
+    # row lock) is held across the hash verification
+    result = await db.execute(_SEL_USER_BY_EMAIL, {"email": credentials.email})
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    password_ok = await verify_password_async(
+        credentials.password,
+        user.hashed_password if user else _DUMMY_HASH
+    )
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -173,19 +213,24 @@ async def login(
             detail="Account is deactivated"
         )
     
-    # Update last login
+    # Migrate bcrypt (or outdated argon2) hashes while the password is at
+    # hand; hashed before the write so the UPDATE commits immediately
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await get_password_hash_async(credentials.password)
+    
     user.last_login_at = datetime.utcnow()
     await db.commit()
     
     # Generate access token
     access_token = create_access_token(subject=user.id)
     
-    return Token(
+    token = Token(
         access_token=access_token,
         token_type="bearer",
         expires_in=settings.access_token_expire_minutes * 60,
-        user=UserResponse.model_validate(user)
+        user=_user_response(UserResponse, user)
     )
+    return model_response(token)
 
 
 # =============================================================================
@@ -194,7 +239,8 @@ async def login(
 
 @router.get(
     "/me",
-    response_model=UserProfileResponse,
+    response_model=None,
+    responses={200: {"model": UserProfileResponse}},
     summary="Get current user profile",
     description="Get the authenticated user's profile."
 )
@@ -212,12 +258,13 @@ async def get_current_user_profile(
     - Statistics (interviews, scores)
     - Preferences
     """
-    return UserProfileResponse.model_validate(current_user)
+    return model_response(_user_response(UserProfileResponse, current_user))
 
 
 @router.put(
     "/me",
-    response_model=UserProfileResponse,
+    response_model=None,
+    responses={200: {"model": UserProfileResponse}},
     summary="Update current user profile",
     description="Update the authenticated user's profile."
 )
@@ -248,9 +295,8 @@ async def update_current_user_profile(
     
     current_user.updated_at = datetime.utcnow()
     await db.commit()
-    await db.refresh(current_user)
     
-    return UserProfileResponse.model_validate(current_user)
+    return model_response(_user_response(UserProfileResponse, current_user))
 
 
 @router.get(
@@ -272,10 +318,10 @@ async def get_current_user_stats(
     - Performance trends
     - Strengths and areas to improve
     """
-    # Import here to avoid circular imports
-    from app.services.stats_service import calculate_user_stats
-    
-    stats = await calculate_user_stats(current_user.id, db)
+    # Cached stats are validated against the user's session/question state
+    # in the database, so changes made by any route or worker are picked up
+    version = await get_user_stats_version(current_user.id, db)
+    stats = await calculate_user_stats(current_user.id, db, version=version)
     return stats
 
 
@@ -285,7 +331,8 @@ async def get_current_user_stats(
 
 @router.get(
     "/{user_id}",
-    response_model=UserResponse,
+    response_model=None,
+    responses={200: {"model": UserResponse}},
     summary="Get user by ID",
     description="Get a user's public profile by their ID."
 )
@@ -301,9 +348,7 @@ async def get_user_by_id(
     
     **Returns:** Public user profile
     """
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
+    result = await db.execute(_SEL_USER_BY_ID, {"user_id": user_id})
     user = result.scalar_one_or_none()
     
     if not user:
@@ -312,7 +357,7 @@ async def get_user_by_id(
             detail=f"User with ID {user_id} not found"
         )
     
-    return UserResponse.model_validate(user)
+    return model_response(_user_response(UserResponse, user))
 
 
 @router.delete(
@@ -350,13 +395,14 @@ async def delete_current_user(
 
 @router.post(
     "/me/skills",
-    response_model=UserProfileResponse,
+    response_model=None,
+    responses={200: {"model": UserProfileResponse}},
     summary="Add skills to profile",
     description="Add new skills to the user's profile."
 )
 async def add_skills(
     skills: List[str],
-    current_user: User = Depends(get_current_user),
+    user_id: str = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -366,25 +412,32 @@ async def add_skills(
     
     **Returns:** Updated user profile
     """
-    current_skills = set(current_user.skills or [])
-    current_skills.update(skills)
-    current_user.skills = list(current_skills)
+    # Ordered dedup: existing skills first, then new ones
+    user = await add_user_skills(db, user_id, skills)
+    
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     
     await db.commit()
-    await db.refresh(current_user)
+    invalidate_cached_user(user_id)
     
-    return UserProfileResponse.model_validate(current_user)
+    return model_response(_user_response(UserProfileResponse, user))
 
 
 @router.delete(
     "/me/skills/{skill}",
-    response_model=UserProfileResponse,
+    response_model=None,
+    responses={200: {"model": UserProfileResponse}},
     summary="Remove a skill",
     description="Remove a skill from the user's profile."
 )
 async def remove_skill(
     skill: str,
-    current_user: User = Depends(get_current_user),
+    user_id: str = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -395,12 +448,19 @@ async def remove_skill(
     
     **Returns:** Updated user profile
     """
-    if current_user.skills and skill in current_user.skills:
-        current_user.skills.remove(skill)
-        await db.commit()
-        await db.refresh(current_user)
+    user = await remove_user_skill(db, user_id, skill)
+    
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    await db.commit()
+    invalidate_cached_user(user_id)
 
-    return UserProfileResponse.model_validate(current_user)
+    return model_response(_user_response(UserProfileResponse, user))
 
 
 # =============================================================================
@@ -486,7 +546,6 @@ async def upload_resume(
 
         current_user.updated_at = datetime.utcnow()
         await db.commit()
-        await db.refresh(current_user)
 
         return APIResponse(
             success=True,
@@ -13,6 +13,7 @@ Version: 1.0.0
 # User schemas
 from app.schemas.user import (
     UserBase,
+    UserReadBase,
     UserCreate,
     UserUpdate,
     UserLogin,
@@ -39,6 +40,7 @@ from app.schemas.interview import (
     EvaluationRequest,
     EvaluationScores,
     EvaluationResponse,
+    AnswerProcessingResponse,
 )
 
 # Feedback & Scoring schemas
@@ -51,10 +53,13 @@ from app.schemas.feedback import (
     StrengthItem,
     WeaknessItem,
     SuggestionItem,
+    ResourceLink,
+    AnswerHighlight,
     InterviewHistoryItem,
     InterviewHistoryResponse,
     PerformanceTrend,
     DashboardStatsResponse,
+    ChartDataset,
     ChartDataResponse,
 )
 
@@ -65,6 +70,7 @@ from app.schemas.common import (
     ValidationErrorResponse,
     PaginationParams,
     PaginatedResponse,
+    HistoryItemBase,
     HealthCheckResponse,
     FileUploadResponse,
     SortParams,
@@ -75,6 +81,7 @@ from app.schemas.common import (
 __all__ = [
     # User
     "UserBase",
+    "UserReadBase",
     "UserCreate",
     "UserUpdate",
     "UserLogin",
@@ -99,6 +106,7 @@ __all__ = [
     "EvaluationRequest",
     "EvaluationScores",
     "EvaluationResponse",
+    "AnswerProcessingResponse",
     
     # Feedback & Scoring
     "ScoringRequest",
@@ -109,10 +117,13 @@ __all__ = [
     "StrengthItem",
     "WeaknessItem",
     "SuggestionItem",
+    "ResourceLink",
+    "AnswerHighlight",
     "InterviewHistoryItem",
     "InterviewHistoryResponse",
     "PerformanceTrend",
     "DashboardStatsResponse",
+    "ChartDataset",
     "ChartDataResponse",
     
     # Common
@@ -121,6 +132,7 @@ __all__ = [
     "ValidationErrorResponse",
     "PaginationParams",
     "PaginatedResponse",
+    "HistoryItemBase",
     "HealthCheckResponse",
     "FileUploadResponse",
     "SortParams",
@@ -11,17 +11,56 @@ Version: 1.0.0
 """
 
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar
-from pydantic import BaseModel, Field
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.config import settings
 
 # Generic type for paginated responses
 T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Shared by every schema read from ORM objects
+FROM_ATTRIBUTES_CONFIG = ConfigDict(from_attributes=True)
+
+
+def example_config(example: Dict[str, Any], **config: Any) -> ConfigDict:
+    """
+    Build a model config carrying an OpenAPI example.
+    
+    With settings.openapi_examples off (production), the example is left
+    out so it never enters the generated JSON schema.
+    """
+    if settings.openapi_examples:
+        config["json_schema_extra"] = {"example": example}
+    return ConfigDict(**config)
+
+
+def construct_from_attributes(model: Type[ModelT], obj: Any, **overrides: Any) -> ModelT:
+    """
+    Build a response model from a trusted ORM object without validating.
+    
+    Rows are validated on write, so read paths copy the model's fields off
+    the object and skip a second validation; overrides replace fields that
+    need building separately (e.g. nested relationships).
+    """
+    values = {name: getattr(obj, name) for name in model.model_fields if name not in overrides}
+    values.update(overrides)
+    return model.model_construct(**values)
 
 
 # =============================================================================
 # STANDARD API RESPONSES
 # =============================================================================
 
+_API_RESPONSE_EXAMPLE = {
+    "success": True,
+    "message": "Operation completed successfully",
+    "data": {},
+    "timestamp": "2024-01-15T10:30:00Z"
+}
+
+
 class APIResponse(BaseModel):
     """Standard API response wrapper."""
     success: bool = True
@@ -29,16 +68,16 @@ class APIResponse(BaseModel):
     data: Optional[Any] = None
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "success": True,
-                "message": "Operation completed successfully",
-                "data": {},
-                "timestamp": "2024-01-15T10:30:00Z"
-            }
-        }
-    }
+    model_config = example_config(_API_RESPONSE_EXAMPLE)
+
+
+_ERROR_RESPONSE_EXAMPLE = {
+    "success": False,
+    "error": "Resource not found",
+    "error_code": "NOT_FOUND",
+    "details": {"resource": "user", "id": "123"},
+    "timestamp": "2024-01-15T10:30:00Z"
+}
 
 
 class ErrorResponse(BaseModel):
@@ -49,17 +88,19 @@ class ErrorResponse(BaseModel):
     details: Optional[Dict[str, Any]] = None
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "success": False,
-                "error": "Resource not found",
-                "error_code": "NOT_FOUND",
-                "details": {"resource": "user", "id": "123"},
-                "timestamp": "2024-01-15T10:30:00Z"
-            }
-        }
-    }
+    model_config = example_config(_ERROR_RESPONSE_EXAMPLE)
+
+
+_VALIDATION_ERROR_RESPONSE_EXAMPLE = {
+    "success": False,
+    "error": "Validation error",
+    "error_code": "VALIDATION_ERROR",
+    "details": [
+        {"field": "email", "message": "Invalid email format"},
+        {"field": "password", "message": "Password too short"}
+    ],
+    "timestamp": "2024-01-15T10:30:00Z"
+}
 
 
 class ValidationErrorResponse(BaseModel):
@@ -70,20 +111,7 @@ class ValidationErrorResponse(BaseModel):
     details: List[Dict[str, Any]]
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "success": False,
-                "error": "Validation error",
-                "error_code": "VALIDATION_ERROR",
-                "details": [
-                    {"field": "email", "message": "Invalid email format"},
-                    {"field": "password", "message": "Password too short"}
-                ],
-                "timestamp": "2024-01-15T10:30:00Z"
-            }
-        }
-    }
+    model_config = example_config(_VALIDATION_ERROR_RESPONSE_EXAMPLE)
 
 
 # =============================================================================
@@ -132,10 +160,34 @@ class PaginatedResponse(BaseModel, Generic[T]):
         )
 
 
+# =============================================================================
+# INTERVIEW HISTORY
+# =============================================================================
+
+class HistoryItemBase(BaseModel):
+    """Fields shared by the mock and skill interview history items."""
+    session_id: str
+    total_score: Optional[float] = None
+    grade: Optional[str] = None
+    completed_at: Optional[datetime] = None
+    
+    model_config = FROM_ATTRIBUTES_CONFIG
+
+
 # =============================================================================
 # HEALTH CHECK
 # =============================================================================
 
+_HEALTH_CHECK_RESPONSE_EXAMPLE = {
+    "status": "healthy",
+    "version": "1.0.0",
+    "environment": "development",
+    "database_status": "connected",
+    "timestamp": "2024-01-15T10:30:00Z",
+    "uptime_seconds": 3600.5
+}
+
+
 class HealthCheckResponse(BaseModel):
     """Health check response."""
     status: str = "healthy"
@@ -145,24 +197,23 @@ class HealthCheckResponse(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     uptime_seconds: Optional[float] = None
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "status": "healthy",
-                "version": "1.0.0",
-                "environment": "development",
-                "database_status": "connected",
-                "timestamp": "2024-01-15T10:30:00Z",
-                "uptime_seconds": 3600.5
-            }
-        }
-    }
+    model_config = example_config(_HEALTH_CHECK_RESPONSE_EXAMPLE)
 
 
 # =============================================================================
 # FILE UPLOAD
 # =============================================================================
 
+_FILE_UPLOAD_RESPONSE_EXAMPLE = {
+    "success": True,
+    "filename": "recording.wav",
+    "file_path": "/uploads/audio/recording_123.wav",
+    "file_size": 1024000,
+    "content_type": "audio/wav",
+    "uploaded_at": "2024-01-15T10:30:00Z"
+}
+
+
 class FileUploadResponse(BaseModel):
     """File upload response."""
     success: bool
@@ -172,18 +223,7 @@ class FileUploadResponse(BaseModel):
     content_type: str
     uploaded_at: datetime
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "success": True,
-                "filename": "recording.wav",
-                "file_path": "/uploads/audio/recording_123.wav",
-                "file_size": 1024000,
-                "content_type": "audio/wav",
-                "uploaded_at": "2024-01-15T10:30:00Z"
-            }
-        }
-    }
+    model_config = example_config(_FILE_UPLOAD_RESPONSE_EXAMPLE)
 
 
 # =============================================================================
@@ -11,14 +11,26 @@ Version: 1.0.0
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Annotated, List, Optional, Dict, Tuple
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
+
+from app.schemas.common import HistoryItemBase, example_config
 
 
 # =============================================================================
 # SCORING SCHEMAS
 # =============================================================================
 
+_SCORING_REQUEST_EXAMPLE = {
+    "session_id": "550e8400-e29b-41d4-a716-446655440000",
+    "question_scores": [
+        {"question_id": "q1", "relevance": 85, "grammar": 90, "fluency": 80, "keywords": 75},
+        {"question_id": "q2", "relevance": 78, "grammar": 85, "fluency": 82, "keywords": 80}
+    ]
+}
+
+
 class ScoringRequest(BaseModel):
     """Schema for calculating final interview scores."""
     session_id: str = Field(..., description="Interview session ID")
@@ -27,17 +39,16 @@ class ScoringRequest(BaseModel):
         description="List of scores for each question"
     )
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "session_id": "550e8400-e29b-41d4-a716-446655440000",
-                "question_scores": [
-                    {"question_id": "q1", "relevance": 85, "grammar": 90, "fluency": 80, "keywords": 75},
-                    {"question_id": "q2", "relevance": 78, "grammar": 85, "fluency": 82, "keywords": 80}
-                ]
-            }
-        }
-    }
+    model_config = example_config(_SCORING_REQUEST_EXAMPLE)
+
+
+_SECTION_SCORE_EXAMPLE = {
+    "section_name": "Relevance",
+    "score": 85.0,
+    "weight": 0.35,
+    "weighted_score": 29.75,
+    "feedback": "Excellent - answers directly address the questions"
+}
 
 
 class SectionScore(BaseModel):
@@ -48,17 +59,26 @@ class SectionScore(BaseModel):
     weighted_score: float
     feedback: str
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "section_name": "Relevance",
-                "score": 85.0,
-                "weight": 0.35,
-                "weighted_score": 29.75,
-                "feedback": "Excellent - answers directly address the questions"
-            }
-        }
-    }
+    model_config = example_config(_SECTION_SCORE_EXAMPLE)
+
+
+_SCORING_RESPONSE_EXAMPLE = {
+    "success": True,
+    "session_id": "550e8400-e29b-41d4-a716-446655440000",
+    "section_scores": [
+        {"section_name": "Relevance", "score": 85.0, "weight": 0.35, "weighted_score": 29.75, "feedback": "Excellent"}
+    ],
+    "total_score": 82.5,
+    "grade": "A",
+    "percentile": 78.0,
+    "questions_answered": 5,
+    "questions_skipped": 0,
+    "best_question_score": 92.0,
+    "worst_question_score": 68.0,
+    "total_time_seconds": 600,
+    "average_time_per_question": 120.0,
+    "calculated_at": "2024-01-15T10:30:00Z"
+}
 
 
 class ScoringResponse(BaseModel):
@@ -86,105 +106,114 @@ class ScoringResponse(BaseModel):
     
     calculated_at: datetime
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "success": True,
-                "session_id": "550e8400-e29b-41d4-a716-446655440000",
-                "section_scores": [
-                    {"section_name": "Relevance", "score": 85.0, "weight": 0.35, "weighted_score": 29.75, "feedback": "Excellent"}
-                ],
-                "total_score": 82.5,
-                "grade": "A",
-                "percentile": 78.0,
-                "questions_answered": 5,
-                "questions_skipped": 0,
-                "best_question_score": 92.0,
-                "worst_question_score": 68.0,
-                "total_time_seconds": 600,
-                "average_time_per_question": 120.0,
-                "calculated_at": "2024-01-15T10:30:00Z"
-            }
-        }
-    }
+    model_config = example_config(_SCORING_RESPONSE_EXAMPLE)
 
 
 # =============================================================================
 # FEEDBACK SCHEMAS
 # =============================================================================
 
+_FEEDBACK_REQUEST_EXAMPLE = {
+    "session_id": "550e8400-e29b-41d4-a716-446655440000",
+    "include_resources": True
+}
+
+
 class FeedbackRequest(BaseModel):
     """Schema for generating feedback."""
     session_id: str = Field(..., description="Interview session ID")
     include_resources: bool = Field(True, description="Include learning resources")
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "session_id": "550e8400-e29b-41d4-a716-446655440000",
-                "include_resources": True
-            }
-        }
-    }
+    model_config = example_config(_FEEDBACK_REQUEST_EXAMPLE)
 
 
-class StrengthItem(BaseModel):
+_STRENGTH_ITEM_EXAMPLE = {
+    "area": "Technical Knowledge",
+    "description": "Strong understanding of core concepts",
+    "examples": ["Clear explanation of ML algorithms", "Accurate use of terminology"]
+}
+
+
+# Feedback items are small, immutable and created per strength/weakness/
+# suggestion, so they are slotted dataclasses rather than BaseModels
+@dataclass(frozen=True, slots=True, config=example_config(_STRENGTH_ITEM_EXAMPLE))
+class StrengthItem:
     """Schema for a strength item."""
     area: str
     description: str
-    examples: List[str] = []
-    
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "area": "Technical Knowledge",
-                "description": "Strong understanding of core concepts",
-                "examples": ["Clear explanation of ML algorithms", "Accurate use of terminology"]
-            }
-        }
-    }
+    examples: Tuple[str, ...] = ()
+
 
+_WEAKNESS_ITEM_EXAMPLE = {
+    "area": "Communication",
+    "description": "Answers could be more structured",
+    "impact": "medium",
+    "improvement_priority": 2
+}
 
-class WeaknessItem(BaseModel):
+
+@dataclass(frozen=True, slots=True, config=example_config(_WEAKNESS_ITEM_EXAMPLE))
+class WeaknessItem:
     """Schema for a weakness item."""
     area: str
     description: str
     impact: str = Field("medium", description="Impact level: low, medium, high")
     improvement_priority: int = Field(1, ge=1, le=5)
-    
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "area": "Communication",
-                "description": "Answers could be more structured",
-                "impact": "medium",
-                "improvement_priority": 2
-            }
-        }
-    }
 
 
-class SuggestionItem(BaseModel):
+class ResourceLink(BaseModel):
+    """Schema for a recommended learning resource."""
+    title: str
+    url: str = ""
+    type: Optional[str] = None  # article, video, course, ...
+    description: Optional[str] = None
+
+
+_SUGGESTION_ITEM_EXAMPLE = {
+    "priority": 1,
+    "category": "Communication",
+    "suggestion": "Use the STAR method for behavioral questions",
+    "action_items": ["Practice structuring answers", "Time yourself"],
+    "resources": [{"title": "STAR Method Guide", "url": "https://example.com"}],
+    "estimated_improvement": "10-15% score increase"
+}
+
+
+@dataclass(frozen=True, slots=True, config=example_config(_SUGGESTION_ITEM_EXAMPLE))
+class SuggestionItem:
     """Schema for an improvement suggestion."""
-    priority: int = Field(..., ge=1, le=10)
+    priority: Annotated[int, Field(ge=1, le=10)]  # no dataclass default: required
     category: str
     suggestion: str
-    action_items: List[str] = []
-    resources: List[Dict[str, str]] = []
+    action_items: Tuple[str, ...] = ()
+    resources: Tuple[ResourceLink, ...] = ()
     estimated_improvement: Optional[str] = None
-    
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "priority": 1,
-                "category": "Communication",
-                "suggestion": "Use the STAR method for behavioral questions",
-                "action_items": ["Practice structuring answers", "Time yourself"],
-                "resources": [{"title": "STAR Method Guide", "url": "https://example.com"}],
-                "estimated_improvement": "10-15% score increase"
-            }
-        }
-    }
+
+
+class AnswerHighlight(BaseModel):
+    """Schema for a best/worst answer snapshot."""
+    question_id: Optional[str] = None
+    question_text: str
+    score: float
+
+
+_FEEDBACK_RESPONSE_EXAMPLE = {
+    "success": True,
+    "session_id": "550e8400-e29b-41d4-a716-446655440000",
+    "performance_rating": "good",
+    "executive_summary": "Strong technical performance with room for improvement in communication...",
+    "total_score": 82.5,
+    "grade": "A",
+    "strengths": [],
+    "weaknesses": [],
+    "suggestions": [],
+    "job_readiness_score": 75.0,
+    "readiness_level": "almost_ready",
+    "estimated_practice_needed": 3,
+    "improvement_percentage": 8.5,
+    "performance_trend": "improving",
+    "generated_at": "2024-01-15T10:30:00Z"
+}
 
 
 class FeedbackResponse(BaseModel):
@@ -206,8 +235,8 @@ class FeedbackResponse(BaseModel):
     suggestions: List[SuggestionItem]
     
     # Question-specific highlights
-    best_answer: Optional[Dict[str, Any]] = None
-    worst_answer: Optional[Dict[str, Any]] = None
+    best_answer: Optional[AnswerHighlight] = None
+    worst_answer: Optional[AnswerHighlight] = None
     
     # Readiness assessment
     job_readiness_score: float
@@ -219,54 +248,38 @@ class FeedbackResponse(BaseModel):
     performance_trend: Optional[str] = None  # improving, stable, declining
     
     # Resources
-    recommended_resources: List[Dict[str, str]] = []
-    practice_topics: List[str] = []
+    recommended_resources: Tuple[ResourceLink, ...] = ()
+    practice_topics: Tuple[str, ...] = ()
     
     generated_at: datetime
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "success": True,
-                "session_id": "550e8400-e29b-41d4-a716-446655440000",
-                "performance_rating": "good",
-                "executive_summary": "Strong technical performance with room for improvement in communication...",
-                "total_score": 82.5,
-                "grade": "A",
-                "strengths": [],
-                "weaknesses": [],
-                "suggestions": [],
-                "job_readiness_score": 75.0,
-                "readiness_level": "almost_ready",
-                "estimated_practice_needed": 3,
-                "improvement_percentage": 8.5,
-                "performance_trend": "improving",
-                "generated_at": "2024-01-15T10:30:00Z"
-            }
-        }
-    }
+    model_config = example_config(_FEEDBACK_RESPONSE_EXAMPLE)
 
 
 # =============================================================================
 # DASHBOARD / HISTORY SCHEMAS
 # =============================================================================
 
-class InterviewHistoryItem(BaseModel):
+class InterviewHistoryItem(HistoryItemBase):
     """Schema for a single interview in history."""
-    session_id: str
     id: Optional[str] = None  # Alias for frontend compatibility
     job_role: str
     interview_type: str
-    total_score: Optional[float] = None
     overall_score: Optional[float] = None  # Alias for frontend compatibility
-    grade: Optional[str] = None
     status: str
     questions_count: int
     duration_seconds: Optional[int] = None
-    completed_at: Optional[datetime] = None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+
+_INTERVIEW_HISTORY_RESPONSE_EXAMPLE = {
+    "user_id": "550e8400-e29b-41d4-a716-446655440000",
+    "total_interviews": 15,
+    "page": 1,
+    "page_size": 10,
+    "total_pages": 2,
+    "interviews": []
+}
 
 
 class InterviewHistoryResponse(BaseModel):
@@ -278,18 +291,7 @@ class InterviewHistoryResponse(BaseModel):
     total_pages: int
     interviews: List[InterviewHistoryItem]
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "user_id": "550e8400-e29b-41d4-a716-446655440000",
-                "total_interviews": 15,
-                "page": 1,
-                "page_size": 10,
-                "total_pages": 2,
-                "interviews": []
-            }
-        }
-    }
+    model_config = example_config(_INTERVIEW_HISTORY_RESPONSE_EXAMPLE)
 
 
 class PerformanceTrend(BaseModel):
@@ -300,6 +302,26 @@ class PerformanceTrend(BaseModel):
     session_id: str
 
 
+_DASHBOARD_STATS_RESPONSE_EXAMPLE = {
+    "user_id": "550e8400-e29b-41d4-a716-446655440000",
+    "total_interviews": 25,
+    "completed_interviews": 23,
+    "average_score": 78.5,
+    "best_score": 94.0,
+    "total_practice_hours": 12.5,
+    "recent_scores": [],
+    "performance_trend": "improving",
+    "improvement_percentage": 15.2,
+    "category_scores": {"technical": 82, "behavioral": 75, "communication": 80},
+    "strongest_skills": ["Python", "System Design"],
+    "weakest_skills": ["Leadership", "Conflict Resolution"],
+    "interviews_this_week": 3,
+    "interviews_this_month": 8,
+    "current_streak": 5,
+    "generated_at": "2024-01-15T10:30:00Z"
+}
+
+
 class DashboardStatsResponse(BaseModel):
     """Schema for dashboard statistics."""
     user_id: str
@@ -336,28 +358,29 @@ class DashboardStatsResponse(BaseModel):
     
     generated_at: datetime
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "user_id": "550e8400-e29b-41d4-a716-446655440000",
-                "total_interviews": 25,
-                "completed_interviews": 23,
-                "average_score": 78.5,
-                "best_score": 94.0,
-                "total_practice_hours": 12.5,
-                "recent_scores": [],
-                "performance_trend": "improving",
-                "improvement_percentage": 15.2,
-                "category_scores": {"technical": 82, "behavioral": 75, "communication": 80},
-                "strongest_skills": ["Python", "System Design"],
-                "weakest_skills": ["Leadership", "Conflict Resolution"],
-                "interviews_this_week": 3,
-                "interviews_this_month": 8,
-                "current_streak": 5,
-                "generated_at": "2024-01-15T10:30:00Z"
-            }
+    model_config = example_config(_DASHBOARD_STATS_RESPONSE_EXAMPLE)
+
+
+_CHART_DATA_RESPONSE_EXAMPLE = {
+    "chart_type": "line",
+    "title": "Performance Over Time",
+    "labels": ["Jan 1", "Jan 8", "Jan 15", "Jan 22"],
+    "datasets": [
+        {
+            "label": "Overall Score",
+            "data": [72, 75, 78, 82],
+            "borderColor": "#4CAF50"
         }
-    }
+    ]
+}
+
+
+class ChartDataset(BaseModel):
+    """Schema for one chart dataset; styling keys pass through as-is."""
+    label: str
+    data: List[Optional[float]]
+    
+    model_config = ConfigDict(extra="allow")
 
 
 class ChartDataResponse(BaseModel):
@@ -365,24 +388,9 @@ class ChartDataResponse(BaseModel):
     chart_type: str  # line, bar, radar, pie
     title: str
     labels: List[str]
-    datasets: List[Dict[str, Any]]
+    datasets: List[ChartDataset]
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "chart_type": "line",
-                "title": "Performance Over Time",
-                "labels": ["Jan 1", "Jan 8", "Jan 15", "Jan 22"],
-                "datasets": [
-                    {
-                        "label": "Overall Score",
-                        "data": [72, 75, 78, 82],
-                        "borderColor": "#4CAF50"
-                    }
-                ]
-            }
-        }
-    }
+    model_config = example_config(_CHART_DATA_RESPONSE_EXAMPLE)
 
 
 class TimingByQuestionCount(BaseModel):
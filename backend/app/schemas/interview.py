@@ -11,14 +11,28 @@ Version: 1.0.0
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from pydantic import BaseModel, Field
 
+from app.schemas.common import FROM_ATTRIBUTES_CONFIG, example_config
+
 
 # =============================================================================
 # REQUEST SCHEMAS
 # =============================================================================
 
+_INTERVIEW_SESSION_CREATE_EXAMPLE = {
+    "job_role": "Senior Python Developer",
+    "interview_type": "technical",
+    "skills_tested": ["Python", "FastAPI", "PostgreSQL", "Docker"],
+    "experience_level": "senior",
+    "difficulty": "hard",
+    "total_questions": 5,
+    "time_limit_per_question": 180,
+    "categories": ["technical", "behavioral"]
+}
+
+
 class InterviewSessionCreate(BaseModel):
     """Schema for creating a new interview session."""
     job_role: str = Field(..., min_length=1, max_length=200, description="Target job role")
@@ -33,20 +47,13 @@ class InterviewSessionCreate(BaseModel):
         description="Question categories: behavioral, technical, situational, hr"
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "job_role": "Senior Python Developer",
-                "interview_type": "technical",
-                "skills_tested": ["Python", "FastAPI", "PostgreSQL", "Docker"],
-                "experience_level": "senior",
-                "difficulty": "hard",
-                "total_questions": 5,
-                "time_limit_per_question": 180,
-                "categories": ["technical", "behavioral"]
-            }
-        }
-    }
+    model_config = example_config(_INTERVIEW_SESSION_CREATE_EXAMPLE)
+
+
+_INTERVIEW_SESSION_UPDATE_EXAMPLE = {
+    "status": "in_progress",
+    "current_question_index": 2
+}
 
 
 class InterviewSessionUpdate(BaseModel):
@@ -54,20 +61,24 @@ class InterviewSessionUpdate(BaseModel):
     status: Optional[str] = None
     current_question_index: Optional[int] = None
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "status": "in_progress",
-                "current_question_index": 2
-            }
-        }
-    }
+    model_config = example_config(_INTERVIEW_SESSION_UPDATE_EXAMPLE)
 
 
 # =============================================================================
 # QUESTION SCHEMAS
 # =============================================================================
 
+_QUESTION_GENERATION_REQUEST_EXAMPLE = {
+    "job_role": "Machine Learning Engineer",
+    "skills": ["Python", "TensorFlow", "NLP", "Deep Learning"],
+    "experience_level": "senior",
+    "num_questions": 5,
+    "interview_type": "technical",
+    "difficulty": "hard",
+    "focus_areas": ["System Design", "Model Optimization"]
+}
+
+
 class QuestionGenerationRequest(BaseModel):
     """Schema for requesting AI-generated questions."""
     job_role: str = Field(..., description="Target job role")
@@ -81,19 +92,17 @@ class QuestionGenerationRequest(BaseModel):
     focus_areas: Optional[List[str]] = Field(None, description="Specific areas to focus on")
     avoid_topics: Optional[List[str]] = Field(None, description="Topics to avoid")
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "job_role": "Machine Learning Engineer",
-                "skills": ["Python", "TensorFlow", "NLP", "Deep Learning"],
-                "experience_level": "senior",
-                "num_questions": 5,
-                "interview_type": "technical",
-                "difficulty": "hard",
-                "focus_areas": ["System Design", "Model Optimization"]
-            }
-        }
-    }
+    model_config = example_config(_QUESTION_GENERATION_REQUEST_EXAMPLE)
+
+
+_GENERATED_QUESTION_EXAMPLE = {
+    "question_text": "Explain the difference between supervised and unsupervised learning with examples.",
+    "category": "Machine Learning Fundamentals",
+    "difficulty": "medium",
+    "expected_keywords": ["supervised", "unsupervised", "classification", "clustering", "labeled data"],
+    "ideal_answer": "Supervised learning uses labeled data...",
+    "time_limit": 180
+}
 
 
 class GeneratedQuestion(BaseModel):
@@ -105,18 +114,16 @@ class GeneratedQuestion(BaseModel):
     ideal_answer: Optional[str] = None
     time_limit: int = 180
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "question_text": "Explain the difference between supervised and unsupervised learning with examples.",
-                "category": "Machine Learning Fundamentals",
-                "difficulty": "medium",
-                "expected_keywords": ["supervised", "unsupervised", "classification", "clustering", "labeled data"],
-                "ideal_answer": "Supervised learning uses labeled data...",
-                "time_limit": 180
-            }
-        }
-    }
+    model_config = example_config(_GENERATED_QUESTION_EXAMPLE)
+
+
+_QUESTION_GENERATION_RESPONSE_EXAMPLE = {
+    "session_id": "550e8400-e29b-41d4-a716-446655440000",
+    "job_role": "Machine Learning Engineer",
+    "questions": [],
+    "generated_at": "2024-01-15T10:30:00Z",
+    "ai_model_used": "gpt-4-turbo"
+}
 
 
 class QuestionGenerationResponse(BaseModel):
@@ -127,23 +134,24 @@ class QuestionGenerationResponse(BaseModel):
     generated_at: datetime
     ai_model_used: str
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "session_id": "550e8400-e29b-41d4-a716-446655440000",
-                "job_role": "Machine Learning Engineer",
-                "questions": [],
-                "generated_at": "2024-01-15T10:30:00Z",
-                "ai_model_used": "gpt-4-turbo"
-            }
-        }
-    }
+    model_config = example_config(_QUESTION_GENERATION_RESPONSE_EXAMPLE)
 
 
 # =============================================================================
 # AUDIO UPLOAD SCHEMAS
 # =============================================================================
 
+_AUDIO_UPLOAD_RESPONSE_EXAMPLE = {
+    "success": True,
+    "message": "Audio uploaded successfully",
+    "question_id": "550e8400-e29b-41d4-a716-446655440000",
+    "file_path": "/uploads/audio/question_123.wav",
+    "file_size": 1024000,
+    "duration_seconds": 45.5,
+    "uploaded_at": "2024-01-15T10:30:00Z"
+}
+
+
 class AudioUploadResponse(BaseModel):
     """Schema for audio upload response."""
     success: bool
@@ -154,38 +162,37 @@ class AudioUploadResponse(BaseModel):
     duration_seconds: Optional[float] = None
     uploaded_at: datetime
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "success": True,
-                "message": "Audio uploaded successfully",
-                "question_id": "550e8400-e29b-41d4-a716-446655440000",
-                "file_path": "/uploads/audio/question_123.wav",
-                "file_size": 1024000,
-                "duration_seconds": 45.5,
-                "uploaded_at": "2024-01-15T10:30:00Z"
-            }
-        }
-    }
+    model_config = example_config(_AUDIO_UPLOAD_RESPONSE_EXAMPLE)
 
 
 # =============================================================================
 # SPEECH-TO-TEXT SCHEMAS
 # =============================================================================
 
+_TRANSCRIPTION_REQUEST_EXAMPLE = {
+    "question_id": "550e8400-e29b-41d4-a716-446655440000",
+    "language": "en"
+}
+
+
 class TranscriptionRequest(BaseModel):
     """Schema for transcription request."""
     question_id: str = Field(..., description="Question ID with audio to transcribe")
     language: str = Field("en", description="Language code")
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "question_id": "550e8400-e29b-41d4-a716-446655440000",
-                "language": "en"
-            }
-        }
-    }
+    model_config = example_config(_TRANSCRIPTION_REQUEST_EXAMPLE)
+
+
+_TRANSCRIPTION_RESPONSE_EXAMPLE = {
+    "success": True,
+    "question_id": "550e8400-e29b-41d4-a716-446655440000",
+    "transcript": "Machine learning is a subset of artificial intelligence...",
+    "confidence": 0.95,
+    "language_detected": "en",
+    "duration_seconds": 45.5,
+    "word_count": 150,
+    "processing_time_ms": 2500
+}
 
 
 class TranscriptionResponse(BaseModel):
@@ -199,26 +206,21 @@ class TranscriptionResponse(BaseModel):
     word_count: int
     processing_time_ms: int
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "success": True,
-                "question_id": "550e8400-e29b-41d4-a716-446655440000",
-                "transcript": "Machine learning is a subset of artificial intelligence...",
-                "confidence": 0.95,
-                "language_detected": "en",
-                "duration_seconds": 45.5,
-                "word_count": 150,
-                "processing_time_ms": 2500
-            }
-        }
-    }
+    model_config = example_config(_TRANSCRIPTION_RESPONSE_EXAMPLE)
 
 
 # =============================================================================
 # EVALUATION SCHEMAS
 # =============================================================================
 
+_EVALUATION_REQUEST_EXAMPLE = {
+    "question_id": "550e8400-e29b-41d4-a716-446655440000",
+    "question_text": "What is machine learning?",
+    "transcript": "Machine learning is a subset of AI that enables systems to learn...",
+    "expected_keywords": ["AI", "algorithm", "data", "training", "model"]
+}
+
+
 class EvaluationRequest(BaseModel):
     """Schema for NLP evaluation request."""
     question_id: str = Field(..., description="Question ID to evaluate")
@@ -226,16 +228,16 @@ class EvaluationRequest(BaseModel):
     transcript: str = Field(..., description="User's answer transcript")
     expected_keywords: List[str] = Field(default_factory=list, description="Expected keywords")
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "question_id": "550e8400-e29b-41d4-a716-446655440000",
-                "question_text": "What is machine learning?",
-                "transcript": "Machine learning is a subset of AI that enables systems to learn...",
-                "expected_keywords": ["AI", "algorithm", "data", "training", "model"]
-            }
-        }
-    }
+    model_config = example_config(_EVALUATION_REQUEST_EXAMPLE)
+
+
+_EVALUATION_SCORES_EXAMPLE = {
+    "relevance_score": 85.0,
+    "grammar_score": 90.0,
+    "fluency_score": 80.0,
+    "keyword_score": 75.0,
+    "overall_score": 82.5
+}
 
 
 class EvaluationScores(BaseModel):
@@ -246,17 +248,26 @@ class EvaluationScores(BaseModel):
     keyword_score: float = Field(..., ge=0, le=100)
     overall_score: float = Field(..., ge=0, le=100)
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "relevance_score": 85.0,
-                "grammar_score": 90.0,
-                "fluency_score": 80.0,
-                "keyword_score": 75.0,
-                "overall_score": 82.5
-            }
-        }
-    }
+    model_config = example_config(_EVALUATION_SCORES_EXAMPLE)
+
+
+_EVALUATION_RESPONSE_EXAMPLE = {
+    "success": True,
+    "question_id": "550e8400-e29b-41d4-a716-446655440000",
+    "scores": {
+        "relevance_score": 85.0,
+        "grammar_score": 90.0,
+        "fluency_score": 80.0,
+        "keyword_score": 75.0,
+        "overall_score": 82.5
+    },
+    "grade": "A",
+    "strengths": ["Clear explanation", "Good examples"],
+    "weaknesses": ["Missing some key terms"],
+    "suggestions": ["Include more technical vocabulary"],
+    "feedback_text": "Good answer with clear structure...",
+    "evaluation_time_ms": 500
+}
 
 
 class EvaluationResponse(BaseModel):
@@ -271,27 +282,16 @@ class EvaluationResponse(BaseModel):
     feedback_text: str
     evaluation_time_ms: int
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "success": True,
-                "question_id": "550e8400-e29b-41d4-a716-446655440000",
-                "scores": {
-                    "relevance_score": 85.0,
-                    "grammar_score": 90.0,
-                    "fluency_score": 80.0,
-                    "keyword_score": 75.0,
-                    "overall_score": 82.5
-                },
-                "grade": "A",
-                "strengths": ["Clear explanation", "Good examples"],
-                "weaknesses": ["Missing some key terms"],
-                "suggestions": ["Include more technical vocabulary"],
-                "feedback_text": "Good answer with clear structure...",
-                "evaluation_time_ms": 500
-            }
-        }
-    }
+    model_config = example_config(_EVALUATION_RESPONSE_EXAMPLE)
+
+
+class AnswerProcessingResponse(BaseModel):
+    """Schema for combined transcription + evaluation response."""
+    success: bool
+    question_id: str
+    transcription: TranscriptionResponse
+    evaluation: EvaluationResponse
+    processing_time_ms: int
 
 
 # =============================================================================
@@ -319,7 +319,7 @@ class InterviewQuestionResponse(BaseModel):
     weaknesses: Optional[list] = None
     suggestions: Optional[list] = None
 
-    model_config = {"from_attributes": True}
+    model_config = FROM_ATTRIBUTES_CONFIG
 
 
 class InterviewSessionResponse(BaseModel):
@@ -342,9 +342,9 @@ class InterviewSessionResponse(BaseModel):
     created_at: datetime
     
     # Questions summary
-    questions: List[InterviewQuestionResponse] = []
+    questions: Tuple[InterviewQuestionResponse, ...] = ()
     
-    model_config = {"from_attributes": True}
+    model_config = FROM_ATTRIBUTES_CONFIG
 
 
 class InterviewSessionDetailResponse(InterviewSessionResponse):
@@ -353,9 +353,9 @@ class InterviewSessionDetailResponse(InterviewSessionResponse):
     grammar_score: Optional[float] = None
     fluency_score: Optional[float] = None
     technical_score: Optional[float] = None
-    strengths: List[str] = []
-    weaknesses: List[str] = []
-    suggestions: List[str] = []
+    strengths: Tuple[str, ...] = ()
+    weaknesses: Tuple[str, ...] = ()
+    suggestions: Tuple[str, ...] = ()
     summary: Optional[str] = None
     
-    model_config = {"from_attributes": True}
+    model_config = FROM_ATTRIBUTES_CONFIG
@@ -11,8 +11,11 @@ Version: 1.0.0
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
+
+from app.schemas.common import FROM_ATTRIBUTES_CONFIG, HistoryItemBase, example_config
 
 
 # =============================================================================
@@ -38,6 +41,14 @@ class TechnologyListResponse(BaseModel):
 # QUESTION GENERATION SCHEMAS
 # =============================================================================
 
+_SKILL_INTERVIEW_REQUEST_EXAMPLE = {
+    "technology": "Python",
+    "num_questions": 5,
+    "difficulty": "medium",
+    "categories": ["technical", "behavioral"]
+}
+
+
 class SkillInterviewRequest(BaseModel):
     """Request to start a skill-based interview."""
     technology: str = Field(..., min_length=1, max_length=100, description="Selected technology/skill")
@@ -48,16 +59,7 @@ class SkillInterviewRequest(BaseModel):
         description="Question categories: behavioral, technical, situational, hr"
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "technology": "Python",
-                "num_questions": 5,
-                "difficulty": "medium",
-                "categories": ["technical", "behavioral"]
-            }
-        }
-    }
+    model_config = example_config(_SKILL_INTERVIEW_REQUEST_EXAMPLE)
 
 
 class SkillQuestion(BaseModel):
@@ -67,11 +69,11 @@ class SkillQuestion(BaseModel):
     question_text: str
     technology: str
     difficulty: str
-    expected_keywords: List[str] = []
+    expected_keywords: Tuple[str, ...] = ()
     ideal_answer: Optional[str] = None
     time_limit_seconds: int = 120
     
-    model_config = {"from_attributes": True}
+    model_config = FROM_ATTRIBUTES_CONFIG
 
 
 class SkillInterviewResponse(BaseModel):
@@ -83,14 +85,15 @@ class SkillInterviewResponse(BaseModel):
     questions: List[SkillQuestion]
     created_at: datetime
     
-    model_config = {"from_attributes": True}
+    model_config = FROM_ATTRIBUTES_CONFIG
 
 
 # =============================================================================
 # AUDIO SUBMISSION SCHEMAS
 # =============================================================================
 
-class AudioSubmission(BaseModel):
+@dataclass(frozen=True, slots=True)
+class AudioSubmission:
     """Schema for audio submission info."""
     question_id: str
     audio_duration_seconds: float
@@ -107,6 +110,22 @@ class SubmitInterviewRequest(BaseModel):
 # SCORING & EVALUATION SCHEMAS
 # =============================================================================
 
+_QUESTION_SCORE_EXAMPLE = {
+    "question_id": "q-001",
+    "question_number": 1,
+    "question_text": "What is Python?",
+    "transcript": "Python is a high-level programming language...",
+    "grammar_score": 4.5,
+    "fluency_score": 4.0,
+    "structure_score": 3.5,
+    "similarity_score": 4.2,
+    "overall_score": 4.1,
+    "strengths": ["Good technical accuracy", "Clear explanation"],
+    "improvements": ["Could include more examples", "Mention use cases"],
+    "ideal_answer": "Python is a high-level, interpreted programming language..."
+}
+
+
 class QuestionScore(BaseModel):
     """Detailed score for a single question."""
     question_id: str
@@ -126,28 +145,68 @@ class QuestionScore(BaseModel):
     overall_score: float = Field(..., ge=0, le=5)
     
     # Feedback
-    strengths: List[str] = []
-    improvements: List[str] = []
+    strengths: Tuple[str, ...] = ()
+    improvements: Tuple[str, ...] = ()
     ideal_answer: Optional[str] = None
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "question_id": "q-001",
-                "question_number": 1,
-                "question_text": "What is Python?",
-                "transcript": "Python is a high-level programming language...",
-                "grammar_score": 4.5,
-                "fluency_score": 4.0,
-                "structure_score": 3.5,
-                "similarity_score": 4.2,
-                "overall_score": 4.1,
-                "strengths": ["Good technical accuracy", "Clear explanation"],
-                "improvements": ["Could include more examples", "Mention use cases"],
-                "ideal_answer": "Python is a high-level, interpreted programming language..."
-            }
-        }
-    }
+    model_config = example_config(_QUESTION_SCORE_EXAMPLE)
+    
+    @classmethod
+    def fast_build(
+        cls,
+        question_id: str,
+        question_number: int,
+        question_text: str,
+        transcript: str,
+        grammar_score: float,
+        fluency_score: float,
+        structure_score: float,
+        similarity_score: float,
+        overall_score: float,
+        strengths: Tuple[str, ...] = (),
+        improvements: Tuple[str, ...] = (),
+        ideal_answer: Optional[str] = None
+    ) -> "QuestionScore":
+        """
+        Build from stored, already-validated scores without re-validating.
+        
+        For read paths only; freshly computed scores should go through the
+        normal constructor so the 0-5 bounds are still enforced.
+        """
+        return cls.model_construct(
+            question_id=question_id,
+            question_number=question_number,
+            question_text=question_text,
+            transcript=transcript,
+            grammar_score=grammar_score,
+            fluency_score=fluency_score,
+            structure_score=structure_score,
+            similarity_score=similarity_score,
+            overall_score=overall_score,
+            strengths=strengths,
+            improvements=improvements,
+            ideal_answer=ideal_answer
+        )
+
+
+_INTERVIEW_RESULT_EXAMPLE = {
+    "session_id": "sess-001",
+    "technology": "Python",
+    "difficulty": "medium",
+    "question_scores": [],
+    "total_grammar_score": 22.5,
+    "total_fluency_score": 20.0,
+    "total_structure_score": 18.5,
+    "total_similarity_score": 21.0,
+    "total_score": 20.5,
+    "max_possible_score": 25.0,
+    "percentage_score": 82.0,
+    "grade": "A",
+    "performance_summary": "Excellent performance with strong technical knowledge",
+    "overall_strengths": ["Strong technical vocabulary"],
+    "overall_improvements": ["Work on answer structure"],
+    "completed_at": "2024-01-15T10:30:00Z"
+}
 
 
 class InterviewResult(BaseModel):
@@ -175,42 +234,20 @@ class InterviewResult(BaseModel):
     performance_summary: str
     
     # Overall feedback
-    overall_strengths: List[str] = []
-    overall_improvements: List[str] = []
+    overall_strengths: Tuple[str, ...] = ()
+    overall_improvements: Tuple[str, ...] = ()
     
     completed_at: datetime
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "session_id": "sess-001",
-                "technology": "Python",
-                "difficulty": "medium",
-                "question_scores": [],
-                "total_grammar_score": 22.5,
-                "total_fluency_score": 20.0,
-                "total_structure_score": 18.5,
-                "total_similarity_score": 21.0,
-                "total_score": 20.5,
-                "max_possible_score": 25.0,
-                "percentage_score": 82.0,
-                "grade": "A",
-                "performance_summary": "Excellent performance with strong technical knowledge",
-                "overall_strengths": ["Strong technical vocabulary"],
-                "overall_improvements": ["Work on answer structure"],
-                "completed_at": "2024-01-15T10:30:00Z"
-            }
-        }
-    }
+    model_config = example_config(_INTERVIEW_RESULT_EXAMPLE)
 
 
 # =============================================================================
 # HISTORY & STORAGE SCHEMAS
 # =============================================================================
 
-class InterviewHistoryItem(BaseModel):
-    """Schema for an interview in history."""
-    session_id: str
+class InterviewHistoryItem(HistoryItemBase):
+    """Schema for an interview in history (scores always present)."""
     technology: str
     difficulty: str
     total_questions: int
@@ -219,11 +256,11 @@ class InterviewHistoryItem(BaseModel):
     percentage_score: float
     grade: str
     completed_at: datetime
-    
-    model_config = {"from_attributes": True}
 
 
 class InterviewHistoryResponse(BaseModel):
-    """Response for interview history."""
+    """Response for interview history (keyset paginated)."""
     interviews: List[InterviewHistoryItem]
-    total_count: int
+    has_more: bool = False
+    next_cursor_completed_at: Optional[datetime] = None
+    next_cursor_id: Optional[str] = None
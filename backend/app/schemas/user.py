@@ -14,6 +14,11 @@ from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
+from app.schemas.common import FROM_ATTRIBUTES_CONFIG, example_config
+
+EXPERIENCE_LEVELS = ("entry", "junior", "mid", "senior", "lead", "executive")
+_ALLOWED_EXPERIENCE_LEVELS = frozenset(EXPERIENCE_LEVELS)
+
 
 # =============================================================================
 # BASE SCHEMAS
@@ -26,10 +31,37 @@ class UserBase(BaseModel):
     last_name: str = Field(..., min_length=1, max_length=100, description="Last name")
 
 
+class UserReadBase(BaseModel):
+    """
+    Common user fields for responses.
+    
+    Emails are validated at signup, so stored values are re-served as plain
+    strings instead of running email-validator on every response.
+    """
+    email: str = Field(..., description="User email address")
+    first_name: str = Field(..., description="First name")
+    last_name: str = Field(..., description="Last name")
+
+
 # =============================================================================
 # REQUEST SCHEMAS
 # =============================================================================
 
+_USER_CREATE_EXAMPLE = {
+    "email": "john.doe@example.com",
+    "password": "securePassword123",
+    "first_name": "John",
+    "last_name": "Doe",
+    "phone": "+1-555-123-4567",
+    "job_role": "Software Engineer",
+    "skills": ["Python", "FastAPI", "Machine Learning"],
+    "experience_years": 3,
+    "experience_level": "mid",
+    "industry": "Technology",
+    "bio": "Passionate developer with focus on AI/ML"
+}
+
+
 class UserCreate(UserBase):
     """Schema for creating a new user."""
     password: str = Field(..., min_length=8, max_length=100, description="Password (min 8 chars)")
@@ -46,28 +78,22 @@ class UserCreate(UserBase):
     @field_validator("experience_level")
     @classmethod
     def validate_experience_level(cls, v: str) -> str:
-        allowed = ["entry", "junior", "mid", "senior", "lead", "executive"]
-        if v and v.lower() not in allowed:
-            raise ValueError(f"Experience level must be one of: {allowed}")
-        return v.lower() if v else "entry"
+        if not v:
+            return "entry"
+        level = v.lower()
+        if level not in _ALLOWED_EXPERIENCE_LEVELS:
+            raise ValueError(f"Experience level must be one of: {list(EXPERIENCE_LEVELS)}")
+        return level
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "email": "john.doe@example.com",
-                "password": "securePassword123",
-                "first_name": "John",
-                "last_name": "Doe",
-                "phone": "+1-555-123-4567",
-                "job_role": "Software Engineer",
-                "skills": ["Python", "FastAPI", "Machine Learning"],
-                "experience_years": 3,
-                "experience_level": "mid",
-                "industry": "Technology",
-                "bio": "Passionate developer with focus on AI/ML"
-            }
-        }
-    }
+    model_config = example_config(_USER_CREATE_EXAMPLE)
+
+
+_USER_UPDATE_EXAMPLE = {
+    "job_role": "Senior Software Engineer",
+    "skills": ["Python", "FastAPI", "Machine Learning", "Docker"],
+    "experience_years": 5,
+    "experience_level": "senior"
+}
 
 
 class UserUpdate(BaseModel):
@@ -88,16 +114,13 @@ class UserUpdate(BaseModel):
     difficulty_preference: Optional[str] = None
     language_preference: Optional[str] = None
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "job_role": "Senior Software Engineer",
-                "skills": ["Python", "FastAPI", "Machine Learning", "Docker"],
-                "experience_years": 5,
-                "experience_level": "senior"
-            }
-        }
-    }
+    model_config = example_config(_USER_UPDATE_EXAMPLE)
+
+
+_USER_LOGIN_EXAMPLE = {
+    "email": "john.doe@example.com",
+    "password": "securePassword123"
+}
 
 
 class UserLogin(BaseModel):
@@ -105,21 +128,33 @@ class UserLogin(BaseModel):
     email: EmailStr
     password: str
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "email": "john.doe@example.com",
-                "password": "securePassword123"
-            }
-        }
-    }
+    model_config = example_config(_USER_LOGIN_EXAMPLE)
 
 
 # =============================================================================
 # RESPONSE SCHEMAS
 # =============================================================================
 
-class UserResponse(UserBase):
+_USER_RESPONSE_EXAMPLE = {
+    "id": "550e8400-e29b-41d4-a716-446655440000",
+    "email": "john.doe@example.com",
+    "first_name": "John",
+    "last_name": "Doe",
+    "phone": "+1-555-123-4567",
+    "job_role": "Software Engineer",
+    "skills": ["Python", "FastAPI", "Machine Learning"],
+    "experience_years": 3,
+    "experience_level": "mid",
+    "industry": "Technology",
+    "bio": "Passionate developer",
+    "total_interviews": 15,
+    "average_score": 78.5,
+    "best_score": 92.0,
+    "created_at": "2024-01-15T10:30:00Z"
+}
+
+
+class UserResponse(UserReadBase):
     """Schema for user response (public profile)."""
     id: str
     phone: Optional[str] = None
@@ -141,28 +176,7 @@ class UserResponse(UserBase):
     created_at: datetime
     last_login_at: Optional[datetime] = None
     
-    model_config = {
-        "from_attributes": True,
-        "json_schema_extra": {
-            "example": {
-                "id": "550e8400-e29b-41d4-a716-446655440000",
-                "email": "john.doe@example.com",
-                "first_name": "John",
-                "last_name": "Doe",
-                "phone": "+1-555-123-4567",
-                "job_role": "Software Engineer",
-                "skills": ["Python", "FastAPI", "Machine Learning"],
-                "experience_years": 3,
-                "experience_level": "mid",
-                "industry": "Technology",
-                "bio": "Passionate developer",
-                "total_interviews": 15,
-                "average_score": 78.5,
-                "best_score": 92.0,
-                "created_at": "2024-01-15T10:30:00Z"
-            }
-        }
-    }
+    model_config = example_config(_USER_RESPONSE_EXAMPLE, from_attributes=True)
 
 
 class UserProfileResponse(UserResponse):
@@ -173,7 +187,23 @@ class UserProfileResponse(UserResponse):
     language_preference: str = "en"
     is_verified: bool = False
     
-    model_config = {"from_attributes": True}
+    model_config = FROM_ATTRIBUTES_CONFIG
+
+
+_USER_STATS_RESPONSE_EXAMPLE = {
+    "user_id": "550e8400-e29b-41d4-a716-446655440000",
+    "total_interviews": 15,
+    "completed_interviews": 14,
+    "average_score": 78.5,
+    "best_score": 92.0,
+    "improvement_trend": 12.5,
+    "strengths": ["Technical knowledge", "Problem solving"],
+    "areas_to_improve": ["Communication", "Time management"],
+    "interview_history_summary": {
+        "last_7_days": 3,
+        "last_30_days": 8
+    }
+}
 
 
 class UserStatsResponse(BaseModel):
@@ -188,30 +218,26 @@ class UserStatsResponse(BaseModel):
     areas_to_improve: List[str]
     interview_history_summary: dict
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "user_id": "550e8400-e29b-41d4-a716-446655440000",
-                "total_interviews": 15,
-                "completed_interviews": 14,
-                "average_score": 78.5,
-                "best_score": 92.0,
-                "improvement_trend": 12.5,
-                "strengths": ["Technical knowledge", "Problem solving"],
-                "areas_to_improve": ["Communication", "Time management"],
-                "interview_history_summary": {
-                    "last_7_days": 3,
-                    "last_30_days": 8
-                }
-            }
-        }
-    }
+    model_config = example_config(_USER_STATS_RESPONSE_EXAMPLE)
 
 
 # =============================================================================
 # AUTHENTICATION SCHEMAS
 # =============================================================================
 
+_TOKEN_EXAMPLE = {
+    "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+    "token_type": "bearer",
+    "expires_in": 3600,
+    "user": {
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "email": "john.doe@example.com",
+        "first_name": "John",
+        "last_name": "Doe"
+    }
+}
+
+
 class Token(BaseModel):
     """Schema for JWT token response."""
     access_token: str
@@ -219,21 +245,7 @@ class Token(BaseModel):
     expires_in: int
     user: UserResponse
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                "token_type": "bearer",
-                "expires_in": 3600,
-                "user": {
-                    "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "email": "john.doe@example.com",
-                    "first_name": "John",
-                    "last_name": "Doe"
-                }
-            }
-        }
-    }
+    model_config = example_config(_TOKEN_EXAMPLE)
 
 
 class TokenPayload(BaseModel):
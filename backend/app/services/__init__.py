@@ -14,9 +14,13 @@ Version: 1.0.0
 from app.services.auth_service import (
     get_password_hash,
     verify_password,
+    get_password_hash_async,
+    verify_password_async,
+    password_needs_rehash,
     create_access_token,
     verify_token,
     get_current_user,
+    get_current_user_id,
     get_current_active_user,
     get_optional_user,
     security
@@ -44,6 +48,12 @@ from app.services.evaluation_service import (
     get_evaluation_service
 )
 
+# Normalized Key Cache
+from app.services.normalized_cache import (
+    NormalizedKeyCache,
+    get_normalized_cache
+)
+
 # Scoring Service
 from app.services.scoring_service import (
     ScoringService,
@@ -64,12 +74,18 @@ from app.services.feedback_service import (
 )
 
 # Statistics Service
+from app.services.skills_service import (
+    add_user_skills,
+    remove_user_skill
+)
 from app.services.stats_service import (
     StatsService,
     UserStats,
     PerformanceTrend,
     ChartData,
     calculate_user_stats,
+    invalidate_user_stats,
+    get_user_stats_version,
     get_stats_service
 )
 
@@ -78,9 +94,13 @@ __all__ = [
     # Auth
     'get_password_hash',
     'verify_password',
+    'get_password_hash_async',
+    'verify_password_async',
+    'password_needs_rehash',
     'create_access_token',
     'verify_token',
     'get_current_user',
+    'get_current_user_id',
     'get_current_active_user',
     'get_optional_user',
     'security',
@@ -101,6 +121,10 @@ __all__ = [
     'EvaluationResult',
     'get_evaluation_service',
     
+    # Normalized Key Cache
+    'NormalizedKeyCache',
+    'get_normalized_cache',
+    
     # Scoring
     'ScoringService',
     'ScoringWeights',
@@ -116,11 +140,17 @@ __all__ = [
     'InterviewFeedbackResult',
     'get_feedback_service',
     
+    # Profile Skills
+    'add_user_skills',
+    'remove_user_skill',
+    
     # Statistics
     'StatsService',
     'UserStats',
     'PerformanceTrend',
     'ChartData',
     'calculate_user_stats',
+    'invalidate_user_stats',
+    'get_user_stats_version',
     'get_stats_service',
 ]
@@ -10,26 +10,51 @@ Version: 1.0.0
 ==============================================================================
 """
 
-from datetime import datetime, timedelta
-from typing import Optional
+import os
+import time
+import hashlib
+import logging
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+import jwt
+from jwt import PyJWTError
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import event
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.config import settings
 from app.database import get_db
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
 
 # =============================================================================
 # PASSWORD HASHING
 # =============================================================================
 
 
+# argon2id with ~50ms hashes; memory cost is in KiB
+_password_hasher = PasswordHasher(
+    time_cost=2,
+    memory_cost=64 * 1024,
+    parallelism=2
+)
+
+# Hashes created before the switch to argon2id
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+
 def get_password_hash(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using argon2id.
     
     Args:
         password: Plain text password
@@ -37,17 +62,15 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hashed password
     """
-    # bcrypt has a 72-byte limit, truncate if necessary
-    password_bytes = password.encode('utf-8')[:72]
-    salt = bcrypt.gensalt(rounds=12)
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    return hashed.decode('utf-8')
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its hash.
     
+    Accepts both argon2id hashes and legacy bcrypt hashes.
+    
     Args:
         plain_password: Plain text password
         hashed_password: Hashed password from database
@@ -55,16 +78,58 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    # bcrypt has a 72-byte limit, truncate to match hashing
-    password_bytes = plain_password.encode('utf-8')[:72]
-    hashed_bytes = hashed_password.encode('utf-8')
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        # bcrypt has a 72-byte limit, truncate to match hashing
+        password_bytes = plain_password.encode('utf-8')[:72]
+        hashed_bytes = hashed_password.encode('utf-8')
+        return bcrypt.checkpw(password_bytes, hashed_bytes)
+    
+    try:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be replaced after a successful login.
+    
+    True for legacy bcrypt hashes and argon2 hashes made with older parameters.
+    """
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return True
+    return _password_hasher.check_needs_rehash(hashed_password)
+
+
+# argon2 and bcrypt both release the GIL while hashing, so threads run hashes
+# in parallel on separate cores without the pickling/fork cost of a process pool
+_hash_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="password-hash"
+)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, verify_password, plain_password, hashed_password)
 
 
 # =============================================================================
 # JWT TOKEN MANAGEMENT
 # =============================================================================
 
+# Key material and algorithm list are fixed for the process lifetime, so they
+# are prepared once instead of being re-encoded/rebuilt on every token op
+_JWT_SECRET = settings.secret_key.encode("utf-8")
+_JWT_ALGORITHMS = [settings.algorithm]
+
 def create_access_token(
     subject: str,
     expires_delta: Optional[timedelta] = None
@@ -79,44 +144,71 @@ def create_access_token(
     Returns:
         Encoded JWT token
     """
+    # JWT NumericDate claims are integer epoch seconds
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.access_token_expire_minutes
-        )
+        expire = now + settings.access_token_expire_minutes * 60
     
     to_encode = {
         "sub": subject,
         "exp": expire,
-        "iat": datetime.utcnow(),
+        "iat": now,
         "type": "access"
     }
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.secret_key,
+        _JWT_SECRET,
         algorithm=settings.algorithm
     )
     
     return encoded_jwt
 
 
+# blake2b(token) -> (cached_until epoch seconds, user_id); only successful decodes are stored
+TOKEN_CACHE_SIZE = 10_000
+_token_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+
+
+def _token_key(token: str) -> bytes:
+    """Fixed-size cache key, so raw bearer tokens are never held in memory."""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
 def verify_token(token: str) -> Optional[str]:
     """
     Verify and decode a JWT token.
     
+    Tokens that verified recently are served from an in-process cache
+    without re-checking the signature, until the earlier of their own
+    expiry and TOKEN_CACHE_TTL_SECONDS.
+    
     Args:
         token: JWT token string
     
     Returns:
         User ID (subject) if valid, None otherwise
     """
+    now = int(time.time())
+    ttl = settings.token_cache_ttl_seconds
+    key = _token_key(token) if ttl > 0 else None
+    
+    if key is not None:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            if cached[0] > now:
+                _token_cache.move_to_end(key)
+                return cached[1]
+            del _token_cache[key]
+    
     try:
         payload = jwt.decode(
             token,
-            settings.secret_key,
-            algorithms=[settings.algorithm]
+            _JWT_SECRET,
+            algorithms=_JWT_ALGORITHMS,
+            options={"require": ["exp", "sub"]}
         )
         user_id: str = payload.get("sub")
         
@@ -125,12 +217,21 @@ def verify_token(token: str) -> Optional[str]:
         
         # Check expiration
         exp = payload.get("exp")
-        if exp and datetime.utcnow() > datetime.fromtimestamp(exp):
+        if exp and now > exp:
             return None
         
+        if key is not None:
+            cached_until = now + ttl
+            if exp:
+                cached_until = min(cached_until, exp)
+            if cached_until > now:
+                _token_cache[key] = (cached_until, user_id)
+                if len(_token_cache) > TOKEN_CACHE_SIZE:
+                    _token_cache.popitem(last=False)
+        
         return user_id
     
-    except JWTError:
+    except PyJWTError:
         return None
 
 
@@ -142,6 +243,79 @@ def verify_token(token: str) -> Optional[str]:
 security = HTTPBearer()
 
 
+# =============================================================================
+# USER CACHE
+# =============================================================================
+
+# user_id -> (expires_at, detached User snapshot)
+USER_CACHE_SIZE = 4096
+_user_cache: Dict[str, Tuple[float, Any]] = {}
+_user_cache_listeners_registered = False
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    """Drop a user from the authentication cache."""
+    _user_cache.pop(user_id, None)
+
+
+def _evict_user(mapper, connection, target) -> None:
+    """Mapper event hook: any flushed change to a user evicts it."""
+    invalidate_cached_user(target.id)
+
+
+def _register_user_cache_listeners(user_model) -> None:
+    """Evict cached users whenever this process updates or deletes them."""
+    global _user_cache_listeners_registered
+    if _user_cache_listeners_registered:
+        return
+    event.listen(user_model, "after_update", _evict_user)
+    event.listen(user_model, "after_delete", _evict_user)
+    _user_cache_listeners_registered = True
+
+
+def _snapshot_user(user_model, user):
+    """Copy a loaded user's columns into a clean detached instance."""
+    snapshot = user_model(**{
+        column.key: getattr(user, column.key)
+        for column in user_model.__mapper__.column_attrs
+    })
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+async def _load_user(db: AsyncSession, user_id: str):
+    """
+    Load a user by ID, reusing a recently loaded row when possible.
+    
+    Returns:
+        User attached to this request's session, or None if not found
+    """
+    # Reuse a recently loaded user; merge(load=False) attaches a copy
+    # to this request's session without a SELECT
+    cached = _user_cache.get(user_id)
+    if cached and cached[0] > time.monotonic():
+        return await db.merge(cached[1], load=False)
+    
+    # Primary-key lookup: served from the identity map when this session
+    # already holds the row, otherwise a single cached SELECT
+    user = await db.get(User, user_id)
+    
+    if user is not None and settings.user_cache_ttl_seconds > 0:
+        _register_user_cache_listeners(User)
+        if len(_user_cache) >= USER_CACHE_SIZE:
+            now = time.monotonic()
+            for stale_id in [k for k, v in _user_cache.items() if v[0] <= now]:
+                del _user_cache[stale_id]
+            if len(_user_cache) >= USER_CACHE_SIZE:
+                _user_cache.clear()
+        _user_cache[user_id] = (
+            time.monotonic() + settings.user_cache_ttl_seconds,
+            _snapshot_user(User, user)
+        )
+    
+    return user
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
@@ -164,13 +338,6 @@ async def get_current_user(
     Raises:
         HTTPException: If authentication fails
     """
-    # Import here to avoid circular imports
-    from app.models.user import User
-    import logging
-    logger = logging.getLogger(__name__)
-
-    logger.debug("Authenticating user...")
-    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -184,11 +351,7 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
     
-    # Get user from database
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = await _load_user(db, user_id)
     
     if user is None:
         raise credentials_exception
@@ -202,6 +365,28 @@ async def get_current_user(
     return user
 
 
+async def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> str:
+    """
+    Dependency returning the authenticated user's ID from the JWT alone.
+    
+    No database query is made, so endpoints using it must scope their own
+    statements to this ID (and to active users where that matters).
+    
+    Raises:
+        HTTPException: If the token is invalid or expired
+    """
+    user_id = verify_token(credentials.credentials)
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user_id
+
+
 async def get_current_active_user(
     current_user = Depends(get_current_user)
 ):
@@ -247,8 +432,6 @@ async def get_optional_user(
     Returns:
         User object or None
     """
-    from app.models.user import User
-    
     if credentials is None:
         return None
     
@@ -256,7 +439,4 @@ async def get_optional_user(
     if user_id is None:
         return None
     
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
-    return result.scalar_one_or_none()
+    return await _load_user(db, user_id)
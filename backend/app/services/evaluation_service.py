@@ -12,18 +12,44 @@ Version: 1.0.0
 """
 
 import asyncio
+import copy
+import hashlib
 import logging
 import re
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of evaluation results kept in the in-process LRU cache
+EVALUATION_CACHE_SIZE = 1024
+
+# Number of texts encoded together when batching sentence embeddings
+EVALUATION_BATCH_SIZE = 16
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=1024)
+def _prepare_keywords(keywords: Tuple[str, ...]) -> Tuple[Tuple[str, str, bool], ...]:
+    """
+    Lowercase a keyword set once and flag which entries are single words.
+    
+    Questions are scored many times against the same keywords, so the
+    (keyword, normalized, is_single_word) triples are cached per set.
+    """
+    return tuple(
+        (keyword, keyword.lower(), _WORD_RE.fullmatch(keyword.lower()) is not None)
+        for keyword in keywords
+    )
+
 
 def debug_log(msg: str, data: Any = None):
-    """Helper for consistent debug logging."""
+    """Helper for consistent debug logging; formatting is deferred to the logger."""
     if data is not None:
-        logger.debug(f"{msg}: {data}")
+        logger.debug("%s: %s", msg, data)
     else:
         logger.debug(msg)
 
@@ -81,6 +107,8 @@ class NLPEvaluationService:
         """Initialize the NLP evaluation service."""
         self.sentence_model = None
         self.grammar_tool = None
+        self._result_cache: "OrderedDict[str, EvaluationResult]" = OrderedDict()
+        self._question_embeddings: "OrderedDict[str, Any]" = OrderedDict()
         self._initialize()
     
     def _initialize(self):
@@ -129,7 +157,8 @@ class NLPEvaluationService:
         question: str,
         response: str,
         expected_keywords: Optional[List[str]] = None,
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        similarity: Optional[float] = None
     ) -> EvaluationResult:
         """
         Evaluate a candidate's response.
@@ -139,6 +168,8 @@ class NLPEvaluationService:
             response: Candidate's transcribed response
             expected_keywords: Keywords expected in a good response
             context: Additional context (role, skills, etc.)
+            similarity: Precomputed question/response cosine similarity
+                (supplied by evaluate_batch)
         
         Returns:
             EvaluationResult with detailed scores
@@ -152,12 +183,20 @@ class NLPEvaluationService:
             debug_log("ERROR: Empty response")
             return self._create_empty_result("No response provided")
         
+        # Identical (question, response, keywords) inputs always score the same
+        cache_key = self._cache_key(question, response, expected_keywords, context)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            debug_log("Evaluation cache hit")
+            return copy.deepcopy(cached)
+        
         # Run all evaluations
         loop = asyncio.get_event_loop()
         
         # Evaluate each metric
         relevance = await loop.run_in_executor(
-            None, self._evaluate_relevance, question, response, context
+            None, self._evaluate_relevance, question, response, context, similarity
         )
         grammar = await loop.run_in_executor(
             None, self._evaluate_grammar, response
@@ -184,7 +223,7 @@ class NLPEvaluationService:
         
         summary = self._generate_summary(overall_score, strengths, improvements)
         
-        return EvaluationResult(
+        result = EvaluationResult(
             relevance=relevance,
             grammar=grammar,
             fluency=fluency,
@@ -194,23 +233,154 @@ class NLPEvaluationService:
             strengths=strengths,
             improvements=improvements
         )
+        
+        self._result_cache[cache_key] = copy.deepcopy(result)
+        if len(self._result_cache) > EVALUATION_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        
+        return result
+    
+    @staticmethod
+    def _cache_key(
+        question: str,
+        response: str,
+        expected_keywords: Optional[List[str]],
+        context: Optional[str]
+    ) -> str:
+        """Build a content hash identifying an evaluation input."""
+        parts = [
+            question,
+            response,
+            "\x1f".join(sorted(expected_keywords or [])),
+            context or "",
+        ]
+        return hashlib.blake2b(
+            "\x1e".join(parts).encode("utf-8"), digest_size=16
+        ).hexdigest()
+    
+    async def prepare(self, question: str) -> None:
+        """
+        Pre-compute the question embedding used for relevance scoring.
+        
+        Lets callers overlap embedding work with transcription; a later
+        evaluate() call for the same question reuses the embedding.
+        """
+        if not self.sentence_model or question in self._question_embeddings:
+            return
+        
+        loop = asyncio.get_event_loop()
+        try:
+            embedding = await loop.run_in_executor(
+                None, self.sentence_model.encode, [question]
+            )
+        except Exception as e:
+            logger.warning(f"Question embedding failed: {e}")
+            return
+        
+        self._question_embeddings[question] = embedding
+        if len(self._question_embeddings) > EVALUATION_CACHE_SIZE:
+            self._question_embeddings.popitem(last=False)
+    
+    async def evaluate_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate several responses at once.
+        
+        Relevance embeddings for all uncached items are computed in
+        length-bucketed batches before the per-item scoring runs.
+        
+        Args:
+            items: Dicts with the keyword arguments accepted by evaluate()
+        
+        Returns:
+            EvaluationResults in the same order as items
+        """
+        pending = [
+            i for i, item in enumerate(items)
+            if (item.get("response") or "").strip()
+            and self._cache_key(
+                item["question"], item["response"],
+                item.get("expected_keywords"), item.get("context")
+            ) not in self._result_cache
+        ]
+        
+        similarities: Dict[int, float] = {}
+        if self.sentence_model and pending:
+            loop = asyncio.get_event_loop()
+            try:
+                scores = await loop.run_in_executor(
+                    None,
+                    self._batch_similarities,
+                    [items[i]["question"] for i in pending],
+                    [items[i]["response"] for i in pending]
+                )
+                similarities = dict(zip(pending, scores))
+            except Exception as e:
+                logger.warning(f"Batch similarity failed, scoring individually: {e}")
+        
+        # Per-item scoring runs in the executor, so the items proceed concurrently
+        return list(await asyncio.gather(*(
+            self.evaluate(**item, similarity=similarities.get(i))
+            for i, item in enumerate(items)
+        )))
+    
+    def _batch_similarities(
+        self,
+        questions: List[str],
+        responses: List[str]
+    ) -> List[float]:
+        """Cosine similarity of each question/response pair."""
+        import numpy as np
+        
+        embeddings = np.asarray(self._encode_length_bucketed(questions + responses))
+        count = len(questions)
+        # Embeddings are L2-normalized, so the row-wise dot product is the cosine
+        return (embeddings[:count] * embeddings[count:]).sum(axis=1).tolist()
+    
+    def _encode_length_bucketed(self, texts: List[str]) -> list:
+        """
+        Encode texts with similar lengths batched together.
+        
+        Sorting by length before batching keeps short answers from being
+        padded up to the longest text in the request.
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        embeddings = [None] * len(texts)
+        
+        for start in range(0, len(order), EVALUATION_BATCH_SIZE):
+            bucket = order[start:start + EVALUATION_BATCH_SIZE]
+            encoded = self.sentence_model.encode(
+                [texts[i] for i in bucket],
+                batch_size=len(bucket),
+                normalize_embeddings=True
+            )
+            for i, embedding in zip(bucket, encoded):
+                embeddings[i] = embedding
+        
+        return embeddings
     
     def _evaluate_relevance(
         self,
         question: str,
         response: str,
-        context: Optional[str]
+        context: Optional[str],
+        similarity: Optional[float] = None
     ) -> EvaluationScore:
         """Evaluate response relevance to the question."""
         
         if self.sentence_model:
             try:
-                # Semantic similarity using sentence embeddings
-                question_embedding = self.sentence_model.encode([question])
-                response_embedding = self.sentence_model.encode([response])
-                
-                from sklearn.metrics.pairwise import cosine_similarity
-                similarity = cosine_similarity(question_embedding, response_embedding)[0][0]
+                if similarity is None:
+                    # Semantic similarity using sentence embeddings
+                    question_embedding = self._question_embeddings.get(question)
+                    if question_embedding is None:
+                        question_embedding = self.sentence_model.encode([question])
+                    response_embedding = self.sentence_model.encode([response])
+                    
+                    from sklearn.metrics.pairwise import cosine_similarity
+                    similarity = cosine_similarity(question_embedding, response_embedding)[0][0]
                 
                 # Scale similarity to score (0-100)
                 # Similarity > 0.5 is considered relevant for Q&A
@@ -451,15 +621,28 @@ class NLPEvaluationService:
             )
         
         response_lower = response.lower()
+        response_tokens = frozenset(_WORD_RE.findall(response_lower))
         
         # Check for each keyword (with variations)
         found_keywords = []
         missing_keywords = []
         
-        for keyword in expected_keywords:
-            keyword_lower = keyword.lower()
-            # Check for keyword or its stem
-            if keyword_lower in response_lower or keyword_lower[:-1] in response_lower:
+        for keyword, normalized, single_word in _prepare_keywords(tuple(expected_keywords)):
+            if single_word:
+                # Coverage is decided by token membership; the plural/singular
+                # forms cover simple stemming without rescanning the response
+                found = (
+                    normalized in response_tokens
+                    or normalized + "s" in response_tokens
+                    or normalized + "es" in response_tokens
+                    or (normalized.endswith("s") and normalized[:-1] in response_tokens)
+                )
+            else:
+                # Fallback: phrases and keywords with symbols ("big o",
+                # "o(n log n)") never form one token, so match them as substrings
+                found = normalized in response_lower
+            
+            if found:
                 found_keywords.append(keyword)
             else:
                 missing_keywords.append(keyword)
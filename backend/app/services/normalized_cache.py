@@ -0,0 +1,106 @@
+"""
+==============================================================================
+AI Mock Interview System - Normalized Key Cache
+==============================================================================
+
+In-process cache for expensive AI calls (question generation, evaluation).
+Keys are normalized text, so trivially different prompts share a result.
+
+Author: AI Mock Interview System
+Version: 1.0.0
+==============================================================================
+"""
+
+import copy
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_key(key_text: str) -> str:
+    """Lowercase and collapse whitespace so trivially different keys match."""
+    return _WHITESPACE_RE.sub(" ", key_text.strip().lower())
+
+
+# =============================================================================
+# NORMALIZED KEY CACHE
+# =============================================================================
+
+class NormalizedKeyCache:
+    """
+    Bounded LRU cache with per-entry TTL over normalized text keys.
+
+    Each cache instance is one namespace (e.g. "questions:python"), so
+    entries from different contexts never match each other. Values are
+    deep-copied on the way in and out, so callers can mutate what they get.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int = 1024,
+        ttl_seconds: int = 3600
+    ):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # normalized key -> (expires_at, value)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    async def get(self, key_text: str) -> Optional[Any]:
+        """Return a cached value for key_text, or None on miss."""
+        key = normalize_key(key_text)
+        now = time.monotonic()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                self._entries.move_to_end(key)
+                return copy.deepcopy(entry[1])
+            del self._entries[key]
+        return None
+
+    async def put(self, key_text: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store value under key_text for ttl seconds (default: cache TTL)."""
+        key = normalize_key(key_text)
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.ttl_seconds)
+
+        self._entries[key] = (expires_at, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# =============================================================================
+# SINGLETON REGISTRY
+# =============================================================================
+
+_caches: Dict[str, NormalizedKeyCache] = {}
+
+
+def get_normalized_cache(namespace: str) -> NormalizedKeyCache:
+    """Get or create the cache for a namespace."""
+    cache = _caches.get(namespace)
+    if cache is None:
+        cache = NormalizedKeyCache(
+            namespace,
+            max_entries=settings.normalized_cache_max_entries,
+            ttl_seconds=settings.normalized_cache_ttl_seconds
+        )
+        _caches[namespace] = cache
+    return cache
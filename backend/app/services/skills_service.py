@@ -0,0 +1,131 @@
+"""
+==============================================================================
+AI Mock Interview System - Profile Skills Service
+==============================================================================
+
+Adds and removes skills on a user's profile. On PostgreSQL and SQLite the
+JSON list is rewritten inside a single UPDATE ... RETURNING; other dialects
+use an ORM read-modify-write.
+
+Author: AI Mock Interview System
+Version: 1.0.0
+==============================================================================
+"""
+
+import json
+import logging
+from typing import List, Optional
+
+from sqlalchemy import text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# DIALECT SQL
+# =============================================================================
+
+# Ordered-dedup append of :new_skills (a JSON array) to users.skills,
+# evaluated inside a single UPDATE; first occurrence wins
+_MERGE_SKILLS_SQL = {
+    "postgresql": (
+        "(SELECT COALESCE(json_agg(skill ORDER BY first_pos), '[]'::json) FROM ("
+        "SELECT skill, MIN(pos) AS first_pos FROM ("
+        "SELECT value AS skill, ordinality AS pos "
+        "FROM json_array_elements_text(COALESCE(users.skills, '[]'::json)) WITH ORDINALITY "
+        "UNION ALL "
+        "SELECT value, 1000000 + ordinality "
+        "FROM json_array_elements_text(CAST(:new_skills AS json)) WITH ORDINALITY"
+        ") AS merged GROUP BY skill) AS deduped)"
+    ),
+    "sqlite": (
+        "(SELECT json_group_array(skill) FROM ("
+        "SELECT skill FROM ("
+        "SELECT value AS skill, key AS pos FROM json_each(COALESCE(users.skills, '[]')) "
+        "UNION ALL "
+        "SELECT value, 1000000 + key FROM json_each(:new_skills)"
+        ") GROUP BY skill ORDER BY MIN(pos)))"
+    ),
+}
+
+# users.skills without any occurrence of :skill, order preserved
+_REMOVE_SKILL_SQL = {
+    "postgresql": (
+        "(SELECT COALESCE(json_agg(value ORDER BY ordinality), '[]'::json) "
+        "FROM json_array_elements_text(COALESCE(users.skills, '[]'::json)) WITH ORDINALITY "
+        "WHERE value <> :skill)"
+    ),
+    "sqlite": (
+        "(SELECT json_group_array(value) FROM ("
+        "SELECT value FROM json_each(COALESCE(users.skills, '[]')) "
+        "WHERE value <> :skill ORDER BY key))"
+    ),
+}
+
+
+# =============================================================================
+# SKILL OPERATIONS
+# =============================================================================
+
+async def _update_skills(db: AsyncSession, user_id: str, skills_sql) -> Optional[User]:
+    """Rewrite users.skills with a SQL expression and return the updated row."""
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id, User.is_active.is_(True))
+        .values(skills=skills_sql)
+        .returning(User)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _load_active_user(db: AsyncSession, user_id: str) -> Optional[User]:
+    """Load an active user for the read-modify-write fallback."""
+    user = await db.get(User, user_id)
+    if user is None or not user.is_active:
+        return None
+    return user
+
+
+async def add_user_skills(db: AsyncSession, user_id: str, skills: List[str]) -> Optional[User]:
+    """
+    Append skills to an active user's profile, keeping existing order and
+    skipping duplicates. The caller commits.
+
+    Returns:
+        Updated user, or None if no active user has this ID
+    """
+    merge_sql = _MERGE_SKILLS_SQL.get(db.get_bind().dialect.name)
+    if merge_sql is not None:
+        return await _update_skills(
+            db, user_id, text(merge_sql).bindparams(new_skills=json.dumps(skills))
+        )
+
+    user = await _load_active_user(db, user_id)
+    if user is not None:
+        user.skills = list(dict.fromkeys([*(user.skills or []), *skills]))
+        await db.flush()
+    return user
+
+
+async def remove_user_skill(db: AsyncSession, user_id: str, skill: str) -> Optional[User]:
+    """
+    Remove every occurrence of a skill from an active user's profile.
+    The caller commits.
+
+    Returns:
+        Updated user, or None if no active user has this ID
+    """
+    remove_sql = _REMOVE_SKILL_SQL.get(db.get_bind().dialect.name)
+    if remove_sql is not None:
+        return await _update_skills(
+            db, user_id, text(remove_sql).bindparams(skill=skill)
+        )
+
+    user = await _load_active_user(db, user_id)
+    if user is not None:
+        user.skills = [s for s in (user.skills or []) if s != skill]
+        await db.flush()
+    return user
@@ -10,10 +10,12 @@ Version: 1.0.0
 ==============================================================================
 """
 
+import copy
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from dataclasses import dataclass, field
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,6 +23,15 @@ from sqlalchemy import select, func, and_, desc
 
 logger = logging.getLogger(__name__)
 
+# Computed user stats are reused until the user's sessions or questions
+# change (see get_user_stats_version), or the TTL expires (streaks and
+# recency drift with time)
+STATS_CACHE_TTL_SECONDS = 300
+STATS_CACHE_SIZE = 10_000
+
+# user_id -> (expires_at, version, stats dict)
+_stats_cache: "OrderedDict[str, Tuple[float, Any, Dict[str, Any]]]" = OrderedDict()
+
 
 # =============================================================================
 # DATA CLASSES
@@ -522,22 +533,74 @@ class StatsService:
 # HELPER FUNCTION
 # =============================================================================
 
+async def get_user_stats_version(user_id: str, db: AsyncSession) -> Tuple[Any, ...]:
+    """
+    Cheap database-side validator for a user's cached statistics.
+    
+    Session count plus the latest session and question updated_at; any
+    status or score change bumps one of them, whichever worker made it.
+    """
+    from app.models.interview import InterviewSession
+    from app.models.question import InterviewQuestion
+    
+    result = await db.execute(
+        select(
+            select(func.count(InterviewSession.id))
+            .where(InterviewSession.user_id == user_id)
+            .scalar_subquery(),
+            select(func.max(InterviewSession.updated_at))
+            .where(InterviewSession.user_id == user_id)
+            .scalar_subquery(),
+            select(func.max(InterviewQuestion.updated_at))
+            .join(InterviewSession, InterviewQuestion.session_id == InterviewSession.id)
+            .where(InterviewSession.user_id == user_id)
+            .scalar_subquery(),
+        )
+    )
+    return tuple(result.one())
+
+
+def invalidate_user_stats(user_id: str) -> None:
+    """Drop cached statistics for a user (call when an interview completes)."""
+    _stats_cache.pop(user_id, None)
+
+
 async def calculate_user_stats(
     user_id: str,
-    db: AsyncSession
+    db: AsyncSession,
+    version: Any = None
 ) -> Dict[str, Any]:
     """
     Calculate and return user statistics as a dictionary.
     
     This is a convenience function that can be called from routers.
+    Results are cached per user; a different version (see
+    get_user_stats_version) forces a recalculation.
     
     Args:
         user_id: User ID
         db: Database session
+        version: Cache validator for the user's current state
     
     Returns:
         Dictionary with all user statistics
     """
+    now = time.monotonic()
+    cached = _stats_cache.get(user_id)
+    if cached and cached[0] > now and cached[1] == version:
+        _stats_cache.move_to_end(user_id)
+        return copy.deepcopy(cached[2])
+    
+    result = await _build_user_stats(user_id, db)
+    _stats_cache[user_id] = (now + STATS_CACHE_TTL_SECONDS, version, result)
+    _stats_cache.move_to_end(user_id)
+    while len(_stats_cache) > STATS_CACHE_SIZE:
+        _stats_cache.popitem(last=False)
+    return copy.deepcopy(result)
+
+
+async def _build_user_stats(user_id: str, db: AsyncSession) -> Dict[str, Any]:
+    """Compute the statistics dictionary returned by calculate_user_stats."""
     service = StatsService(db)
     stats = await service.get_user_stats(user_id, db)
     
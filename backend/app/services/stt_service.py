@@ -13,10 +13,13 @@ Version: 1.0.0
 
 import os
 import re
+import copy
 import asyncio
+import hashlib
 import logging
 import httpx
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -78,6 +81,21 @@ MIN_CONFIDENCE_THRESHOLD = 0.15
 # Minimum word count for a valid transcript
 MIN_TRANSCRIPT_WORDS = 3
 
+# Maximum number of transcripts kept in the in-process cache
+TRANSCRIPT_CACHE_SIZE = 512
+
+
+def audio_hasher():
+    """Return an incremental hasher producing the same digest as hash_audio()."""
+    return hashlib.blake2b(digest_size=16)
+
+
+def hash_audio(content: bytes) -> str:
+    """Return a content hash for audio bytes (keys the transcript cache)."""
+    hasher = audio_hasher()
+    hasher.update(content)
+    return hasher.hexdigest()
+
 
 def is_hallucination(text: str) -> bool:
     """Check if a transcript is a known Whisper hallucination."""
@@ -170,7 +188,7 @@ class SpeechToTextService:
     Supports:
     - Hugging Face Whisper API (cloud, free tier available)
     - OpenAI Whisper API (cloud)
-    - Local Whisper model (offline)
+    - Local Whisper model (offline; faster-whisper/CTranslate2 when installed)
     
     Usage:
         stt_service = SpeechToTextService()
@@ -184,9 +202,11 @@ class SpeechToTextService:
     def __init__(self):
         """Initialize the STT service."""
         self.model = None
+        self.model_backend = None  # faster-whisper or openai-whisper
         self.model_size = settings.whisper_model_size
         self.use_api = settings.whisper_use_api
         self.provider = settings.stt_provider  # huggingface, whisper, local
+        self._transcript_cache: "OrderedDict[Tuple[str, Optional[str], bool], TranscriptionResult]" = OrderedDict()
         self._initialize()
     
     def _initialize(self):
@@ -218,12 +238,33 @@ class SpeechToTextService:
         self._load_local_model()
     
     def _load_local_model(self):
-        """Load local Whisper model."""
+        """Load local Whisper model (quantized faster-whisper when available)."""
+        try:
+            from faster_whisper import WhisperModel
+            logger.info(
+                f"Loading faster-whisper model: {self.model_size} "
+                f"({settings.whisper_compute_type})"
+            )
+            self.model = WhisperModel(
+                self.model_size,
+                device=settings.whisper_device,
+                compute_type=settings.whisper_compute_type
+            )
+            self.model_backend = "faster-whisper"
+            self.provider = "local"
+            logger.info("faster-whisper model loaded successfully")
+            return
+        except ImportError:
+            debug_log("faster-whisper not installed, trying openai-whisper")
+        except Exception as e:
+            logger.warning(f"Failed to load faster-whisper model: {e}")
+        
         try:
             import whisper
             debug_log(f"Loading local Whisper model: {self.model_size}")
             logger.info(f"Loading local Whisper model: {self.model_size}")
             self.model = whisper.load_model(self.model_size)
+            self.model_backend = "openai-whisper"
             self.provider = "local"
             debug_log("Local Whisper model loaded successfully")
             logger.info("Local Whisper model loaded successfully")
@@ -242,7 +283,8 @@ class SpeechToTextService:
         self,
         audio_path: str,
         language: Optional[str] = None,
-        include_timestamps: bool = False
+        include_timestamps: bool = False,
+        audio_hash: Optional[str] = None
     ) -> TranscriptionResult:
         """
         Transcribe audio file to text.
@@ -251,6 +293,8 @@ class SpeechToTextService:
             audio_path: Path to audio file
             language: Optional language code (e.g., 'en', 'es')
             include_timestamps: Whether to include word timestamps
+            audio_hash: Content hash from hash_audio(); when given, a
+                transcript of identical audio is reused
         
         Returns:
             TranscriptionResult with transcribed text and metadata
@@ -262,6 +306,12 @@ class SpeechToTextService:
         debug_log("=== TRANSCRIBE AUDIO ===")
         debug_log("Input params", {"audio_path": audio_path, "language": language})
         
+        cache_key = (audio_hash, language, include_timestamps) if audio_hash else None
+        if cache_key and cache_key in self._transcript_cache:
+            self._transcript_cache.move_to_end(cache_key)
+            debug_log("Transcript cache hit", audio_hash)
+            return copy.deepcopy(self._transcript_cache[cache_key])
+        
         # Validate file exists
         if not os.path.exists(audio_path):
             debug_log("ERROR: File not found", audio_path)
@@ -300,6 +350,12 @@ class SpeechToTextService:
         debug_log("Final transcript after sanitization",
                   {"text_length": len(result.text), "confidence": result.confidence,
                    "preview": result.text[:100] if result.text else "(empty)"})
+        
+        if cache_key:
+            self._transcript_cache[cache_key] = copy.deepcopy(result)
+            if len(self._transcript_cache) > TRANSCRIPT_CACHE_SIZE:
+                self._transcript_cache.popitem(last=False)
+        
         return result
     
     async def _transcribe_huggingface(
@@ -473,6 +529,10 @@ class SpeechToTextService:
         loop = asyncio.get_event_loop()
         
         def _transcribe():
+            if self.model_backend == "faster-whisper":
+                return self._transcribe_faster_whisper(
+                    audio_path, language, include_timestamps
+                )
             options = {
                 "language": language,
                 "word_timestamps": include_timestamps,
@@ -521,6 +581,47 @@ class SpeechToTextService:
             logger.error(f"Local transcription failed: {e}")
             raise RuntimeError(f"Transcription failed: {e}")
 
+    def _transcribe_faster_whisper(
+        self,
+        audio_path: str,
+        language: Optional[str],
+        include_timestamps: bool
+    ) -> Dict[str, Any]:
+        """Run faster-whisper and return an openai-whisper shaped result."""
+        segments, info = self.model.transcribe(
+            audio_path,
+            language=language,
+            beam_size=5,
+            word_timestamps=include_timestamps
+        )
+        
+        segment_dicts = []
+        for segment in segments:
+            segment_dict = {
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text,
+                'no_speech_prob': segment.no_speech_prob,
+            }
+            if include_timestamps and segment.words:
+                segment_dict['words'] = [
+                    {
+                        'word': w.word,
+                        'start': w.start,
+                        'end': w.end,
+                        'probability': w.probability
+                    }
+                    for w in segment.words
+                ]
+            segment_dicts.append(segment_dict)
+        
+        return {
+            'text': "".join(s['text'] for s in segment_dicts),
+            'language': info.language,
+            'duration': info.duration,
+            'segments': segment_dicts,
+        }
+
     async def _transcribe_mock(
         self,
         audio_path: str,
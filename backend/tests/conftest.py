@@ -16,9 +16,10 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 
 from app.main import app
 from app.database import Base, get_db
-from app.core.security import create_access_token, get_password_hash
+from app.services.auth_service import create_access_token, get_password_hash
 from app.models.user import User
-from app.models.interview import InterviewSession, InterviewQuestion
+from app.models.interview import InterviewSession
+from app.models.question import InterviewQuestion
 
 
 # Test database URL (in-memory SQLite)
@@ -91,7 +92,8 @@ async def test_user(test_session: AsyncSession) -> User:
         id=str(uuid4()),
         email="test@example.com",
         hashed_password=get_password_hash("testpassword123"),
-        full_name="Test User",
+        first_name="Test",
+        last_name="User",
         is_active=True,
         is_verified=True,
         created_at=datetime.utcnow(),
@@ -106,7 +108,7 @@ async def test_user(test_session: AsyncSession) -> User:
 @pytest_asyncio.fixture
 async def auth_headers(test_user: User) -> dict:
     """Create authentication headers for a test user."""
-    token = create_access_token(data={"sub": test_user.id})
+    token = create_access_token(subject=test_user.id)
     return {"Authorization": f"Bearer {token}"}
 
 
@@ -0,0 +1,80 @@
+"""
+Tests for NLP Evaluation Service
+
+Tests cover:
+- Evaluation result caching
+- Batched evaluation
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+
+@pytest.fixture
+def evaluation_service():
+    """Evaluation service without heavy NLP models (fallback scorers only)."""
+    from app.services.evaluation_service import NLPEvaluationService
+
+    with patch.object(NLPEvaluationService, "_initialize"):
+        return NLPEvaluationService()
+
+
+class TestEvaluationCache:
+    """Tests for the in-process evaluation result cache."""
+
+    async def test_repeated_evaluation_is_cached(self, evaluation_service):
+        """Identical inputs should only run the scorers once."""
+        question = "What is a Python decorator?"
+        answer = "A decorator wraps a function to extend its behavior without modifying it."
+
+        with patch.object(
+            evaluation_service, "_evaluate_grammar",
+            wraps=evaluation_service._evaluate_grammar
+        ) as grammar:
+            first = await evaluation_service.evaluate(question, answer, ["function", "wrapper"])
+            second = await evaluation_service.evaluate(question, answer, ["wrapper", "function"])
+
+        assert grammar.call_count == 1
+        assert first == second
+        assert first is not second
+
+    async def test_different_answers_are_not_shared(self, evaluation_service):
+        """A changed transcript must be re-evaluated."""
+        question = "What is a Python decorator?"
+
+        await evaluation_service.evaluate(question, "It wraps a function.", [])
+        await evaluation_service.evaluate(question, "It is a design pattern for classes.", [])
+
+        assert len(evaluation_service._result_cache) == 2
+
+
+class TestEvaluateBatch:
+    """Tests for batched evaluation."""
+
+    async def test_batch_preserves_order(self, evaluation_service):
+        """Results come back in input order, empty answers scored as empty."""
+        items = [
+            {"question": "Explain REST.", "response": "REST uses stateless HTTP resources and verbs."},
+            {"question": "Explain GIL.", "response": ""},
+            {"question": "Explain async.", "response": "Async code yields to the event loop while waiting."},
+        ]
+
+        results = await evaluation_service.evaluate_batch(items)
+
+        assert len(results) == 3
+        assert results[1].overall_score == 0
+        assert results[0] == await evaluation_service.evaluate(**items[0])
+        assert results[2] == await evaluation_service.evaluate(**items[2])
+
+    def test_length_bucketing_restores_order(self, evaluation_service):
+        """Embeddings are returned in input order after length-sorted encoding."""
+        model = MagicMock()
+        model.encode.side_effect = lambda texts, **kwargs: [f"emb:{t}" for t in texts]
+        evaluation_service.sentence_model = model
+
+        texts = ["a much longer answer text", "short", "medium text"]
+        embeddings = evaluation_service._encode_length_bucketed(texts)
+
+        assert embeddings == [f"emb:{t}" for t in texts]
+        encoded_texts = model.encode.call_args_list[0].args[0]
+        assert encoded_texts == sorted(texts, key=len)
@@ -0,0 +1,50 @@
+"""
+Tests for Normalized Key Cache
+
+Tests cover:
+- Exact (normalized) key hits
+- TTL expiry and LRU eviction
+"""
+
+from app.services.normalized_cache import NormalizedKeyCache
+
+
+class TestNormalizedKeyCache:
+    """Tests for the in-process normalized key cache."""
+
+    async def test_normalized_key_hit(self):
+        """Case and whitespace differences share an entry."""
+        cache = NormalizedKeyCache("test")
+        await cache.put("Python|medium|5", ["q1", "q2"])
+
+        assert await cache.get("  python|MEDIUM|5 ") == ["q1", "q2"]
+        assert await cache.get("python|medium|6") is None
+
+    async def test_returned_value_is_a_copy(self):
+        """Mutating a cached result must not change the stored entry."""
+        cache = NormalizedKeyCache("test")
+        await cache.put("key", ["q1"])
+
+        first = await cache.get("key")
+        first.append("q2")
+
+        assert await cache.get("key") == ["q1"]
+
+    async def test_expired_entry_is_a_miss(self):
+        """Entries past their TTL are dropped."""
+        cache = NormalizedKeyCache("test")
+        await cache.put("key", "value", ttl=-1)
+
+        assert await cache.get("key") is None
+        assert len(cache) == 0
+
+    async def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = NormalizedKeyCache("test", max_entries=2)
+        await cache.put("a", 1)
+        await cache.put("b", 2)
+        await cache.get("a")
+        await cache.put("c", 3)
+
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
@@ -0,0 +1,121 @@
+"""
+Tests for Skill Interview API endpoints
+
+Tests cover:
+- Interview history keyset pagination
+- Results ETag / If-None-Match
+"""
+
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from httpx import AsyncClient
+
+from app.models.interview import InterviewSession, InterviewStatus
+from app.models.question import InterviewQuestion
+
+
+async def _add_evaluated_session(test_session, user_id: str, completed_at: datetime) -> InterviewSession:
+    """Create an evaluated skill interview with one scored question."""
+    session = InterviewSession(
+        id=str(uuid4()),
+        user_id=user_id,
+        job_role="Python Developer",
+        skills_tested=["Python"],
+        difficulty="medium",
+        total_questions=1,
+        status=InterviewStatus.EVALUATED.value,
+        overall_score=80.0,
+        grade="B",
+        completed_at=completed_at,
+    )
+    session.questions.append(InterviewQuestion(
+        id=str(uuid4()),
+        question_text="What is a generator?",
+        question_order=1,
+        transcript="A function that yields values lazily.",
+        overall_score=80.0,
+        is_evaluated=True,
+    ))
+    test_session.add(session)
+    await test_session.commit()
+    return session
+
+
+class TestInterviewHistory:
+    """Tests for the keyset-paginated history endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_across_equal_timestamps(self, client: AsyncClient, test_session, test_user, auth_headers):
+        """Sessions sharing completed_at are paged by id without gaps or repeats."""
+        completed_at = datetime(2026, 1, 15, 12, 0, 0)
+        sessions = [
+            await _add_evaluated_session(test_session, test_user.id, completed_at)
+            for _ in range(3)
+        ]
+        expected = sorted((s.id for s in sessions), reverse=True)
+
+        response = await client.get(
+            "/api/v1/skill-interview/history",
+            headers=auth_headers,
+            params={"limit": 2}
+        )
+        assert response.status_code == 200
+        first_page = response.json()
+        assert first_page["has_more"] is True
+        assert first_page["next_cursor_id"] == expected[1]
+
+        response = await client.get(
+            "/api/v1/skill-interview/history",
+            headers=auth_headers,
+            params={
+                "limit": 2,
+                "cursor_completed_at": first_page["next_cursor_completed_at"],
+                "cursor_id": first_page["next_cursor_id"],
+            }
+        )
+        assert response.status_code == 200
+        second_page = response.json()
+        assert second_page["has_more"] is False
+        assert second_page["next_cursor_id"] is None
+
+        seen = [item["session_id"] for item in first_page["interviews"] + second_page["interviews"]]
+        assert seen == expected
+
+
+class TestInterviewResults:
+    """Tests for the results endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_if_none_match_returns_304(self, client: AsyncClient, test_session, test_user, auth_headers):
+        """A matching If-None-Match gets 304 with the same ETag."""
+        session = await _add_evaluated_session(test_session, test_user.id, datetime(2026, 1, 15, 12, 0, 0))
+        url = f"/api/v1/skill-interview/{session.id}/results"
+
+        response = await client.get(url, headers=auth_headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.json()["session_id"] == session.id
+
+        response = await client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    @pytest.mark.asyncio
+    async def test_etag_changes_after_rescore(self, client: AsyncClient, test_session, test_user, auth_headers):
+        """Updating a question changes the ETag, so the old one no longer matches."""
+        session = await _add_evaluated_session(test_session, test_user.id, datetime(2026, 1, 15, 12, 0, 0))
+        url = f"/api/v1/skill-interview/{session.id}/results"
+
+        response = await client.get(url, headers=auth_headers)
+        etag = response.headers["etag"]
+
+        question = session.questions[0]
+        question.overall_score = 40.0
+        question.updated_at = datetime(2026, 1, 16, 9, 0, 0)
+        await test_session.commit()
+
+        response = await client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
@@ -5,6 +5,7 @@ Tests cover:
 - Audio transcription
 - Multiple audio formats
 - Error handling
+- Transcript caching
 """
 
 import pytest
@@ -186,3 +187,37 @@ class TestAsyncTranscription:
                 result = await stt.transcribe_async("audio.wav")
                 
                 assert result["text"] == "Async transcription result."
+
+
+class TestTranscriptCache:
+    """Tests for transcript reuse keyed by audio content hash."""
+    
+    async def test_same_audio_hash_reuses_transcript(self, tmp_path):
+        """Identical audio is only sent to the STT backend once."""
+        from app.services.stt_service import (
+            SpeechToTextService, TranscriptionResult, hash_audio
+        )
+        
+        audio_file = tmp_path / "answer.wav"
+        audio_file.write_bytes(b"RIFF fake audio")
+        audio_hash = hash_audio(audio_file.read_bytes())
+        
+        with patch.object(SpeechToTextService, "_initialize"):
+            stt = SpeechToTextService()
+        stt.provider = "mock"
+        
+        fake_result = TranscriptionResult(
+            text="Decorators wrap functions to add behaviour",
+            language="en",
+            duration=3.0,
+            confidence=0.9
+        )
+        with patch.object(
+            stt, "_transcribe_mock", AsyncMock(return_value=fake_result)
+        ) as backend:
+            first = await stt.transcribe(str(audio_file), audio_hash=audio_hash)
+            second = await stt.transcribe(str(audio_file), audio_hash=audio_hash)
+        
+        assert backend.await_count == 1
+        assert first == second
+        assert first is not second
@@ -6,11 +6,14 @@ Tests cover:
 - User login
 - Get current user profile
 - Update profile
+- Profile skill merge/removal SQL
 """
 
 import pytest
 from httpx import AsyncClient
 
+from app.services.skills_service import add_user_skills, remove_user_skill
+
 
 class TestUserRegistration:
     """Tests for user registration endpoint."""
@@ -182,3 +185,66 @@ class TestUserProfile:
         assert "Python" in data["skills"]
         assert "React" in data["skills"]
         assert len(data["skills"]) == 4
+
+
+class TestSkillsService:
+    """Tests for the single-statement skill merge/removal on SQLite."""
+    
+    @pytest.mark.asyncio
+    async def test_add_skills_ordered_dedup(self, test_session, test_user):
+        """Existing order is kept and duplicates are skipped, first occurrence wins."""
+        await add_user_skills(test_session, test_user.id, ["Python", "SQL"])
+        user = await add_user_skills(
+            test_session, test_user.id, ["React", "Python", "Docker", "React"]
+        )
+        await test_session.commit()
+        
+        assert user.skills == ["Python", "SQL", "React", "Docker"]
+    
+    @pytest.mark.asyncio
+    async def test_add_skills_to_null_skills(self, test_session, test_user):
+        """A NULL skills column is treated as an empty list."""
+        test_user.skills = None
+        await test_session.commit()
+        
+        user = await add_user_skills(test_session, test_user.id, ["Go", "Go", "Rust"])
+        await test_session.commit()
+        
+        assert user.skills == ["Go", "Rust"]
+    
+    @pytest.mark.asyncio
+    async def test_remove_skill(self, test_session, test_user):
+        """Every occurrence is removed and the remaining order is kept."""
+        await add_user_skills(test_session, test_user.id, ["Python", "SQL", "React"])
+        user = await remove_user_skill(test_session, test_user.id, "SQL")
+        await test_session.commit()
+        
+        assert user.skills == ["Python", "React"]
+    
+    @pytest.mark.asyncio
+    async def test_remove_missing_skill(self, test_session, test_user):
+        """Removing a skill the user does not have leaves the list unchanged."""
+        await add_user_skills(test_session, test_user.id, ["Python", "SQL"])
+        user = await remove_user_skill(test_session, test_user.id, "Haskell")
+        await test_session.commit()
+        
+        assert user.skills == ["Python", "SQL"]
+    
+    @pytest.mark.asyncio
+    async def test_remove_skill_from_null_skills(self, test_session, test_user):
+        """Removing from a NULL skills column yields an empty list."""
+        test_user.skills = None
+        await test_session.commit()
+        
+        user = await remove_user_skill(test_session, test_user.id, "Python")
+        await test_session.commit()
+        
+        assert user.skills == []
+    
+    @pytest.mark.asyncio
+    async def test_inactive_user_not_updated(self, test_session, test_user):
+        """Inactive users are skipped and None is returned."""
+        test_user.is_active = False
+        await test_session.commit()
+        
+        assert await add_user_skills(test_session, test_user.id, ["Python"]) is None
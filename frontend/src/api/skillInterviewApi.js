@@ -334,12 +334,13 @@ export const getResults = async (sessionId) => {
 };
 
 /**
- * Get interview history
- * 
+ * Get interview history (newest first, keyset paginated)
+ *
  * @param {Object} params - Query parameters
  * @param {number} params.limit - Number of items to return
- * @param {number} params.offset - Number of items to skip
- * @returns {Promise<Object>} - Interview history
+ * @param {string} [params.cursor_completed_at] - next_cursor_completed_at from the previous page
+ * @param {string} [params.cursor_id] - next_cursor_id from the previous page
+ * @returns {Promise<Object>} - { interviews, has_more, next_cursor_completed_at, next_cursor_id }
  */
 export const getHistory = async (params = {}) => {
     try {